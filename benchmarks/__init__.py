@@ -0,0 +1,4 @@
+"""
+Benchmarks for DERSLY performance-sensitive code paths.
+Run individual modules with python -m benchmarks.<name>.
+"""
@@ -0,0 +1,58 @@
+"""
+Benchmark for StorageManager.bulk_load.
+Loads a large synthetic export and prints the per-entity timing breakdown.
+
+Usage:
+    python -m benchmarks.bench_bulk_load [records_per_entity]
+"""
+import sys
+from datetime import datetime, timedelta
+from utils.storage_manager import StorageManager
+
+
+def build_export(size: int) -> dict:
+    """Build an export dictionary with `size` records per entity."""
+    base = datetime(2025, 1, 1)
+    return {
+        'version': StorageManager.DATA_VERSION,
+        'exported_at': base.isoformat(),
+        'user_profile': {'name': 'Benchmark'},
+        'courses': [
+            {'id': i, 'course_name': f'Ders {i}', 'course_code': f'C{i}', 'day': 'Monday',
+             'start_time': '09:00', 'end_time': '10:30'}
+            for i in range(1, size + 1)
+        ],
+        'assignments': [
+            {'id': i, 'title': f'Ödev {i}', 'due_date': (base + timedelta(hours=i)).isoformat(),
+             'type': 'assignment', 'status': 'pending', 'priority': 'medium'}
+            for i in range(1, size + 1)
+        ],
+        'grades': [
+            {'id': i, 'course_name': f'Ders {i % 50}', 'grade': 3.0, 'credits': 3,
+             'semester': 'Fall', 'year': 2024}
+            for i in range(1, size + 1)
+        ],
+        'reminders': [],
+        'next_course_id': size + 1,
+        'next_assignment_id': size + 1,
+        'next_grade_id': size + 1,
+        'next_reminder_id': 1
+    }
+
+
+def main() -> None:
+    """Run bulk_load once and print where the time went."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    data = build_export(size)
+
+    StorageManager.clear_all_data()
+    success, message, timings = StorageManager.bulk_load(data)
+    print(message)
+    print(f"{'stage':<14}{'ms':>10}")
+    for stage, seconds in timings.items():
+        print(f"{stage:<14}{seconds * 1000:>10.2f}")
+    StorageManager.clear_all_data()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Benchmark for the cached CSS bundle.
+Measures bytes sent per rerun and build time before and after bundling.
+Pages call apply_modern_style() without the mobile styles, which they never
+injected before bundling either, so both sides measure the modern CSS only.
+
+Usage:
+    python -m benchmarks.bench_css_bundle
+"""
+import timeit
+from utils.ui_styles import get_modern_css, get_css_bundle
+
+
+def main() -> None:
+    """Print bytes per rerun and per-call build time for each theme."""
+    runs = 1000
+
+    print(f"{'theme':<8}{'before (B)':>12}{'after (B)':>12}{'saved':>8}{'build before':>16}{'build after':>14}")
+    for theme in ["light", "dark"]:
+        # Previous behaviour: rebuild the f-string and send it unminified
+        before_bytes = len(get_modern_css.__wrapped__(theme).encode())
+        after_bytes = len(get_css_bundle(theme)[0].encode())
+
+        before_time = timeit.timeit(lambda: get_modern_css.__wrapped__(theme), number=runs) / runs
+        after_time = timeit.timeit(lambda: get_css_bundle(theme), number=runs) / runs
+
+        saved = 1 - after_bytes / before_bytes
+        print(
+            f"{theme:<8}{before_bytes:>12,}{after_bytes:>12,}{saved:>8.0%}"
+            f"{before_time * 1e6:>13.1f} µs{after_time * 1e6:>11.2f} µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark for TranscriptConverter.
+Converts many synthetic transcripts between GPA systems and compares the
+table-based conversion with a per-grade dictionary loop.
+
+Usage:
+    python -m benchmarks.bench_transcript_conversion [transcripts] [grades_per_transcript]
+"""
+import random
+import sys
+import time
+from utils.gpa_systems import GPASystem
+from utils.transcript_converter import TranscriptConverter
+
+
+PAIRS = [
+    ("4.0 Çift Harf", "4.0 Tek Harf"),
+    ("4.0 Artı/Eksi", "4.0 Çift Harf"),
+    ("5.0 Sistem", "4.0 Çift Harf")
+]
+
+
+def build_transcripts(count: int, size: int, system_name: str) -> list:
+    """Build `count` transcripts of `size` grades drawn from the system's letters."""
+    rng = random.Random(42)
+    points = [GPASystem.grade_to_point(letter, system_name) for letter in GPASystem.get_grade_options(system_name)]
+    return [
+        [
+            {'id': i, 'course_name': f'Ders {i}', 'grade': rng.choice(points), 'credits': rng.randint(1, 6),
+             'semester': 'Fall', 'year': 2020 + i % 4}
+            for i in range(size)
+        ]
+        for _ in range(count)
+    ]
+
+
+def convert_loop(grades: list, from_system: str, to_system: str) -> float:
+    """Reference: per-grade scan of both scales, returning the target GPA."""
+    source = GPASystem.get_system(from_system)['scale']
+    target = GPASystem.get_system(to_system)['scale']
+    ratio = max(target.values()) / max(source.values())
+
+    total_points = total_credits = 0.0
+    for grade in grades:
+        point = max((p for p in source.values() if p <= grade['grade'] + 1e-9), default=0.0)
+        scaled = point * ratio
+        target_point = max((p for p in target.values() if p <= scaled + 1e-9), default=0.0)
+        total_points += target_point * grade['credits']
+        total_credits += grade['credits']
+    return round(total_points / total_credits, 2) if total_credits else 0.0
+
+
+def main() -> None:
+    """Time both conversions for every system pair."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+    print(f"{count} transcripts x {size} grades")
+    print(f"{'pair':<36}{'table ms':>12}{'loop ms':>12}")
+    for from_system, to_system in PAIRS:
+        transcripts = build_transcripts(count, size, from_system)
+
+        started = time.perf_counter()
+        converted = [TranscriptConverter.convert_grades(t, from_system, to_system) for t in transcripts]
+        table_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        reference = [convert_loop(t, from_system, to_system) for t in transcripts]
+        loop_seconds = time.perf_counter() - started
+
+        assert [result['target_gpa'] for result in converted] == reference
+        print(f"{from_system + ' -> ' + to_system:<36}{table_seconds * 1000:>12.1f}{loop_seconds * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
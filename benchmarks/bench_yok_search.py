@@ -0,0 +1,99 @@
+"""
+Benchmark for the YÖK search indexes.
+Builds synthetic lists at full YÖK scale and times per-keystroke lookups
+against the old linear scans, both on the bare indexes and through YokAPI
+(disk cache version check + index lookup) backed by a temporary cache file.
+
+Usage:
+    python -m benchmarks.bench_yok_search [universities] [departments]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from utils.yok_api import YokAPI
+from utils.yok_cache import YokCache
+from utils.yok_index import UniversityIndex, NameIndex
+
+
+WORDS = ["İstanbul", "Ankara", "Teknik", "Boğaziçi", "Işık", "Çukurova", "Ege", "Şehir", "Gazi", "Dokuz",
+         "Eylül", "Sağlık", "Bilim", "Mühendisliği", "Öğretmenliği", "Yönetim", "İşletme", "Bilgisayar",
+         "Elektrik", "Makine", "Kimya", "Fizik", "Tarih", "Hukuk", "Tıp", "Uluslararası", "İlişkiler"]
+CITIES = ["İstanbul", "Ankara", "İzmir", "Eskişehir", "Adana", "Kayseri", "Bursa", "Şanlıurfa", "Iğdır"]
+
+
+def build(universities: int, departments: int) -> tuple:
+    """Build synthetic university dictionaries and department names."""
+    rng = random.Random(1)
+    unis = [
+        {'id': i, 'name': f"{' '.join(rng.sample(WORDS, 2))} Üniversitesi {i}",
+         'city': rng.choice(CITIES), 'type': rng.choice(["Devlet", "Vakıf"])}
+        for i in range(universities)
+    ]
+    deps = [f"{' '.join(rng.sample(WORDS, 3))} {i}" for i in range(departments)]
+    return unis, deps
+
+
+def keystrokes(names: list, count: int) -> list:
+    """Prefixes of random names, as typed one character at a time."""
+    rng = random.Random(2)
+    queries = []
+    while len(queries) < count:
+        name = rng.choice(names)
+        queries.extend(name[:length].lower() for length in range(1, min(len(name), 12) + 1))
+    return queries[:count]
+
+
+def timed(label: str, func, queries: list) -> None:
+    """Print the mean time per query in microseconds."""
+    started = time.perf_counter()
+    for query in queries:
+        func(query)
+    print(f"{label:<34}{(time.perf_counter() - started) / len(queries) * 1e6:>10.1f} µs")
+
+
+def main() -> None:
+    """Build the indexes and time lookups."""
+    universities = int(sys.argv[1]) if len(sys.argv) > 1 else 250
+    departments = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    unis, deps = build(universities, departments)
+
+    started = time.perf_counter()
+    uni_index = UniversityIndex(unis)
+    dep_index = NameIndex(deps)
+    print(f"index build: {(time.perf_counter() - started) * 1000:.1f} ms "
+          f"({universities} universities, {departments} departments)")
+
+    uni_queries = keystrokes([uni['name'] for uni in unis], 2000)
+    dep_queries = keystrokes(deps, 2000)
+
+    timed("universities linear scan", lambda q: [u for u in unis if q in u['name'].lower()], uni_queries)
+    timed("universities index", uni_index.search, uni_queries)
+    timed("departments linear scan", lambda q: [d for d in deps if q in d.lower()], dep_queries)
+    timed("departments index (all)", dep_index.search, dep_queries)
+    timed("departments autocomplete (10)", lambda q: dep_index.search(q, 10), dep_queries)
+    timed("universities by city", lambda q: uni_index.get_by_city("İzmir"), uni_queries)
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = YokCache(os.path.join(directory, 'yok_cache.db'))
+        cache.put('universities', unis)
+        cache.put('departments', {'Fakülte': deps})
+        YokAPI.remote_enabled = False
+        YokAPI.set_disk_cache(cache)
+        try:
+            # Warm the in-process copies and indexes once, as the first rerun would
+            YokAPI.search_universities("")
+            YokAPI.search_departments("")
+
+            timed("YokAPI.search_universities", YokAPI.search_universities, uni_queries)
+            timed("YokAPI.search_departments", YokAPI.search_departments, dep_queries)
+            YokAPI.version_check_interval = 0
+            timed("YokAPI.search_departments (stat)", YokAPI.search_departments, dep_queries)
+        finally:
+            YokAPI.set_disk_cache(None)
+            cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from utils.user_manager import UserManager
 from utils.course_manager import CourseManager
 from utils.assignment_manager import AssignmentManager
 from utils.grade_manager import GradeManager
+from utils.week_mask import DAYS
 from utils.ui_styles import apply_modern_style
 
 # Page configuration
@@ -34,22 +35,20 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Get dashboard data with caching
-@st.cache_data(ttl=60)  # Cache for 60 seconds
+# Get dashboard data
 def get_dashboard_data():
-    """Get dashboard statistics with caching for better performance."""
-    courses = CourseManager.get_all_courses()
-    assignments = AssignmentManager.get_all_assignments()
-    pending_assignments = AssignmentManager.get_assignments_by_status('pending')
-    upcoming_assignments = AssignmentManager.get_upcoming_assignments(7)
-    gpa = GradeManager.calculate_gpa()
-    
+    """
+    Get dashboard statistics.
+    Counts are read from the collections and the status index, and the GPA
+    is cached on the grade version (see versioned_cache), so only the
+    upcoming list, which depends on the clock, is looked up on every run.
+    """
     return {
-        'total_courses': len(courses),
-        'total_assignments': len(assignments),
-        'pending_assignments': len(pending_assignments),
-        'gpa': gpa,
-        'upcoming_assignments': upcoming_assignments[:5]  # Top 5
+        'total_courses': CourseManager.get_course_count(),
+        'total_assignments': AssignmentManager.get_assignment_count(),
+        'pending_assignments': AssignmentManager.get_pending_count(),
+        'gpa': GradeManager.calculate_gpa(),
+        'upcoming_assignments': AssignmentManager.get_upcoming_assignments(7)[:5]  # Top 5
     }
 
 try:
@@ -135,13 +134,8 @@ try:
             with col3:
                 st.metric("Kredi", course['credits'])
         
-        # Calculate total hours today
-        total_minutes = 0
-        for course in today_courses:
-            start_h, start_m = map(int, course['start_time'].split(':'))
-            end_h, end_m = map(int, course['end_time'].split(':'))
-            duration = (end_h * 60 + end_m) - (start_h * 60 + start_m)
-            total_minutes += duration
+        # Total class time today from the weekly occupancy bitset
+        total_minutes = CourseManager.get_occupancy().total_minutes(DAYS[datetime.now().weekday()])
         
         st.info(f"📊 Bugün toplam **{len(today_courses)} ders** ve **{total_minutes // 60} saat {total_minutes % 60} dakika** ders var")
     else:
@@ -173,13 +167,8 @@ try:
                 
                 with col2:
                     # Due date
-                    try:
-                        due_date_str = assignment.get('due_date', '')
-                        if 'T' in due_date_str:
-                            due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-                        else:
-                            due_date = datetime.fromisoformat(due_date_str)
-                        
+                    due_date = AssignmentManager.get_due_date(assignment)
+                    if due_date is not None:
                         # Calculate days remaining
                         days_remaining = (due_date - datetime.now()).days
                         
@@ -193,7 +182,7 @@ try:
                             st.info(f"⏰ {days_remaining} gün kaldı")
                         
                         st.caption(due_date.strftime("%d.%m.%Y %H:%M"))
-                    except:
+                    else:
                         st.caption("Tarih belirtilmemiş")
                 
                 with col3:
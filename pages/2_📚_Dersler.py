@@ -119,17 +119,17 @@ with tab1:
                                         }
                                         
                                         # Check for time conflicts (exclude current course)
-                                        has_conflict, conflicting_course = CourseManager.check_time_conflict(
+                                        conflicting_courses = CourseManager.find_conflicts(
                                             course['day'],
                                             start_time_str,
                                             end_time_str,
                                             exclude_course_id=course['id']
                                         )
                                         
-                                        if has_conflict:
-                                            st.error(f"⚠️ **Ders Çakışması!** Bu saatte zaten başka bir ders var:")
-                                            st.warning(f"📚 **{conflicting_course['course_code']}** - {conflicting_course['course_name']}")
-                                            st.info(f"⏰ {conflicting_course['start_time']} - {conflicting_course['end_time']}")
+                                        if conflicting_courses:
+                                            st.error(f"⚠️ **Ders Çakışması!** Bu saatte zaten başka ders var:")
+                                            for conflicting_course in conflicting_courses:
+                                                st.warning(f"📚 **{conflicting_course['course_code']}** - {conflicting_course['course_name']} (⏰ {conflicting_course['start_time']} - {conflicting_course['end_time']})")
                                         else:
                                             # Validate updated course data
                                             is_valid, error_message = InputValidator.validate_course(updates)
@@ -211,16 +211,16 @@ with tab2:
             }
             
             # Check for time conflicts
-            has_conflict, conflicting_course = CourseManager.check_time_conflict(
+            conflicting_courses = CourseManager.find_conflicts(
                 day, 
                 start_time.strftime("%H:%M"), 
                 end_time.strftime("%H:%M")
             )
             
-            if has_conflict:
-                st.error(f"⚠️ **Ders Çakışması!** Bu saatte zaten başka bir ders var:")
-                st.warning(f"📚 **{conflicting_course['course_code']}** - {conflicting_course['course_name']}")
-                st.info(f"⏰ {conflicting_course['start_time']} - {conflicting_course['end_time']}")
+            if conflicting_courses:
+                st.error(f"⚠️ **Ders Çakışması!** Bu saatte zaten başka ders var:")
+                for conflicting_course in conflicting_courses:
+                    st.warning(f"📚 **{conflicting_course['course_code']}** - {conflicting_course['course_name']} (⏰ {conflicting_course['start_time']} - {conflicting_course['end_time']})")
             else:
                 # Validate course data
                 is_valid, error_message = InputValidator.validate_course(course_data)
@@ -366,23 +366,18 @@ with tab3:
             total_credits = sum(c.get('credits', 3) for c in CourseManager.get_all_courses())
             st.metric("Toplam Kredi", total_credits)
         
+        occupancy = CourseManager.get_occupancy()
+        
         with col3:
-            # Calculate total hours per week
-            total_minutes = 0
-            for day_courses in schedule.values():
-                for course in day_courses:
-                    start_h, start_m = map(int, course['start_time'].split(':'))
-                    end_h, end_m = map(int, course['end_time'].split(':'))
-                    duration = (end_h * 60 + end_m) - (start_h * 60 + start_m)
-                    total_minutes += duration
-            total_hours = total_minutes / 60
+            # Total class hours per week (overlapping courses counted once)
+            total_hours = occupancy.total_minutes() / 60
             st.metric("Haftalık Ders Saati", f"{total_hours:.1f}")
         
         with col4:
-            # Find busiest day
-            busiest_day = max(schedule.items(), key=lambda x: len(x[1]))
-            if busiest_day[1]:
-                st.metric("En Yoğun Gün", day_names_tr[busiest_day[0]])
+            # Busiest day by class minutes
+            busiest_day = occupancy.busiest_day()
+            if busiest_day:
+                st.metric("En Yoğun Gün", day_names_tr[busiest_day])
             else:
                 st.metric("En Yoğun Gün", "-")
 
@@ -9,6 +9,7 @@ from utils.storage_manager import StorageManager
 from utils.user_manager import UserManager
 from utils.assignment_manager import AssignmentManager
 from utils.course_manager import CourseManager
+from utils.free_time import FreeTimeFinder
 from utils.input_validator import InputValidator
 from utils.calendar_export import CalendarExport
 from utils.ui_styles import apply_modern_style
@@ -93,17 +94,11 @@ def get_type_emoji(assignment_type: str) -> str:
 
 def display_assignment_card(assignment: dict, urgent: bool = False):
     """Display assignment card with deadline warnings."""
-    # Parse due date
-    try:
-        due_date_str = assignment.get('due_date', '')
-        if 'T' in due_date_str:
-            due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-        else:
-            due_date = datetime.fromisoformat(due_date_str)
-        
+    # Cached due date
+    due_date = AssignmentManager.get_due_date(assignment)
+    if due_date is not None:
         badge_emoji, badge_text, urgency = get_deadline_badge(due_date, assignment.get('status', 'pending'))
-    except:
-        due_date = None
+    else:
         badge_emoji, badge_text, urgency = "⚪", "Tarih yok", 0
     
     # Card styling based on urgency
@@ -250,20 +245,16 @@ with tab1:
         normal_assignments = []
         
         for assignment in assignments:
-            try:
-                due_date_str = assignment.get('due_date', '')
-                if 'T' in due_date_str:
-                    due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-                else:
-                    due_date = datetime.fromisoformat(due_date_str)
-                
-                _, _, urgency = get_deadline_badge(due_date, assignment.get('status', 'pending'))
-                
-                if urgency >= 3:  # Urgent (today, tomorrow, overdue)
-                    urgent_assignments.append(assignment)
-                else:
-                    normal_assignments.append(assignment)
-            except:
+            due_date = AssignmentManager.get_due_date(assignment)
+            if due_date is None:
+                normal_assignments.append(assignment)
+                continue
+            
+            _, _, urgency = get_deadline_badge(due_date, assignment.get('status', 'pending'))
+            
+            if urgency >= 3:  # Urgent (today, tomorrow, overdue)
+                urgent_assignments.append(assignment)
+            else:
                 normal_assignments.append(assignment)
         
         # Show urgent section if exists
@@ -424,26 +415,22 @@ with tab3:
     later = 0
     
     for assignment in pending_assignments:
-        try:
-            due_date_str = assignment.get('due_date', '')
-            if 'T' in due_date_str:
-                due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-            else:
-                due_date = datetime.fromisoformat(due_date_str)
-            
-            _, _, urgency = get_deadline_badge(due_date, 'pending')
-            
-            if urgency == 5:
-                overdue += 1
-            elif urgency == 4:
-                today += 1
-            elif urgency == 3:
-                tomorrow += 1
-            elif urgency == 2:
-                this_week += 1
-            else:
-                later += 1
-        except:
+        due_date = AssignmentManager.get_due_date(assignment)
+        if due_date is None:
+            later += 1
+            continue
+        
+        _, _, urgency = get_deadline_badge(due_date, 'pending')
+        
+        if urgency == 5:
+            overdue += 1
+        elif urgency == 4:
+            today += 1
+        elif urgency == 3:
+            tomorrow += 1
+        elif urgency == 2:
+            this_week += 1
+        else:
             later += 1
     
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -512,6 +499,22 @@ with col3:
     upcoming = len(AssignmentManager.get_upcoming_assignments(7))
     st.metric("Yaklaşan (7 gün)", upcoming)
 
+# Free study time before upcoming deadlines
+st.markdown("---")
+st.subheader("⏳ Teslimden Önce Çalışma Zamanı")
+study_windows = FreeTimeFinder.get_study_windows(days=7)
+if study_windows:
+    for entry in study_windows:
+        hours, minutes = divmod(entry['free_minutes'], 60)
+        with st.expander(f"📝 {entry['assignment']['title']} — {hours} saat {minutes} dakika boş zaman"):
+            st.caption(f"Teslim: {entry['due_date'].strftime('%d.%m.%Y %H:%M')} (08:00-23:00 arası, derslerin dışında)")
+            for window_start, window_end in entry['windows'][:10]:
+                st.write(f"🕒 {window_start.strftime('%d.%m %H:%M')} - {window_end.strftime('%H:%M')}")
+            if len(entry['windows']) > 10:
+                st.caption(f"... ve {len(entry['windows']) - 10} zaman aralığı daha")
+else:
+    st.info("ℹ️ Önümüzdeki 7 gün içinde teslim tarihi olan bekleyen görev yok")
+
 # Bulk calendar export
 st.markdown("---")
 st.subheader("📅 Toplu Takvim Aktarımı")
@@ -67,20 +67,15 @@ assignments = AssignmentManager.get_all_assignments()
 # Filter assignments for selected month
 month_assignments = {}
 for assignment in assignments:
-    try:
-        due_date_str = assignment.get('due_date', '')
-        if 'T' in due_date_str:
-            due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-        else:
-            due_date = datetime.fromisoformat(due_date_str)
-        
-        if due_date.month == selected_month and due_date.year == selected_year:
-            day = due_date.day
-            if day not in month_assignments:
-                month_assignments[day] = []
-            month_assignments[day].append(assignment)
-    except:
+    due_date = AssignmentManager.get_due_date(assignment)
+    if due_date is None:
         continue
+    
+    if due_date.month == selected_month and due_date.year == selected_year:
+        day = due_date.day
+        if day not in month_assignments:
+            month_assignments[day] = []
+        month_assignments[day].append(assignment)
 
 # Display calendar
 st.subheader(f"{calendar.month_name[selected_month]} {selected_year}")
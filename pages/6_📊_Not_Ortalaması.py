@@ -3,9 +3,13 @@ GPA page for DERSLY Streamlit application.
 Manages grade entries and calculates GPA.
 """
 import streamlit as st
+import pandas as pd
 from utils.storage_manager import StorageManager
 from utils.user_manager import UserManager
 from utils.grade_manager import GradeManager
+from utils.gpa_systems import GPASystem
+from utils.transcript_converter import TranscriptConverter
+from utils.gpa_simulator import GPASimulator
 from utils.input_validator import InputValidator
 from utils.ui_styles import apply_modern_style
 
@@ -35,16 +39,17 @@ st.markdown("""
 # Display GPA
 st.subheader("🎯 Genel Not Ortalaması (GNO)")
 
-gpa = GradeManager.calculate_gpa()
-total_credits = GradeManager.get_total_credits()
+# Overall, per-semester and cumulative GPA computed together
+gpa_summary = GradeManager.get_gpa_summary()
+gpa = gpa_summary['gpa']
 
 col1, col2, col3 = st.columns(3)
 with col1:
     st.metric("GNO", f"{gpa:.2f}" if gpa > 0 else "N/A")
 with col2:
-    st.metric("Toplam Kredi", total_credits)
+    st.metric("Toplam Kredi", gpa_summary['total_credits'])
 with col3:
-    st.metric("Ders Sayısı", GradeManager.get_grade_count())
+    st.metric("Ders Sayısı", gpa_summary['grade_count'])
 
 st.markdown("---")
 
@@ -226,52 +231,143 @@ with tab2:
 with tab3:
     st.subheader("Dönemlik GPA Hesaplama")
     
-    # Get unique semesters
-    semesters = GradeManager.get_semesters()
+    semesters = gpa_summary['semesters']
     
     if semesters:
+        semester_names_tr = {"Fall": "Güz", "Spring": "Bahar", "Summer": "Yaz"}
+        
+        # Semester and cumulative GPA over time
+        st.line_chart(pd.DataFrame(
+            {
+                'Dönem GPA': [entry['gpa'] for entry in semesters],
+                'GNO': [entry['cumulative_gpa'] for entry in semesters]
+            },
+            index=[f"{entry['year']} {semester_names_tr.get(entry['semester'], entry['semester'])}" for entry in semesters]
+        ))
+        
         st.write("**Dönemler:**")
         
-        for semester, year in semesters:
-            semester_gpa = GradeManager.calculate_semester_gpa(semester, year)
-            semester_grades = GradeManager.get_grades_by_semester(semester, year)
-            semester_credits = sum(g.get('credits', 0) for g in semester_grades)
-            
-            semester_name_tr = {"Fall": "Güz", "Spring": "Bahar", "Summer": "Yaz"}.get(semester, semester)
+        grades_by_id = StorageManager.get_collection('grades')
+        for entry in semesters:
+            semester_name_tr = semester_names_tr.get(entry['semester'], entry['semester'])
             
-            with st.expander(f"{semester_name_tr} {year} - GPA: {semester_gpa:.2f}"):
-                st.metric("Dönem GPA", f"{semester_gpa:.2f}")
-                st.metric("Toplam Kredi", semester_credits)
-                st.metric("Ders Sayısı", len(semester_grades))
+            with st.expander(f"{semester_name_tr} {entry['year']} - GPA: {entry['gpa']:.2f}"):
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Dönem GPA", f"{entry['gpa']:.2f}", delta=f"{entry['gpa_change']:+.2f}" if entry['gpa_change'] else None)
+                col2.metric("GNO (dönem sonu)", f"{entry['cumulative_gpa']:.2f}", delta=f"{entry['cumulative_change']:+.2f}" if entry['cumulative_change'] else None)
+                col3.metric("Toplam Kredi", entry['credits'])
+                col4.metric("Ders Sayısı", entry['grade_count'])
                 
                 st.markdown("**Dersler:**")
+                semester_grades = sorted(
+                    (grades_by_id[grade_id] for grade_id in entry['grade_ids']),
+                    key=lambda g: g.get('course_name', '')
+                )
                 for g in semester_grades:
                     st.write(f"- {g.get('course_name')}: {g.get('grade'):.2f} ({g.get('credits')} kredi)")
     else:
         st.info("📊 Henüz not girilmemiş.")
 
+# Transcript conversion between GPA systems
+if GradeManager.get_grade_count() > 0:
+    st.markdown("---")
+    st.subheader("🔄 Not Sistemi Dönüşümü")
+    
+    with st.expander("🎓 Transkripti başka bir not sistemine dönüştür"):
+        system_names = GPASystem.get_system_names()
+        profile = UserManager.get_profile() or {}
+        current_system = profile.get('gpa_system', "4.0 Çift Harf")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            from_system = st.selectbox(
+                "Mevcut Sistem",
+                options=system_names,
+                index=system_names.index(current_system) if current_system in system_names else 0,
+                key="convert_from_system"
+            )
+        with col2:
+            to_system = st.selectbox("Hedef Sistem", options=system_names, key="convert_to_system")
+        
+        conversion = TranscriptConverter.convert_transcript(from_system, to_system)
+        
+        col1, col2 = st.columns(2)
+        col1.metric(f"GPA ({from_system})", f"{conversion['source_gpa']:.2f}")
+        col2.metric(f"GPA ({to_system})", f"{conversion['target_gpa']:.2f}")
+        
+        st.dataframe(pd.DataFrame(
+            {
+                'Ders': [c['course_name'] for c in conversion['courses']],
+                'Kredi': [c['credits'] for c in conversion['courses']],
+                'Mevcut Not': [c['source_letter'] for c in conversion['courses']],
+                'Yeni Not': [c['target_letter'] for c in conversion['courses']],
+                'Yeni Puan': [c['target_point'] for c in conversion['courses']]
+            }
+        ), hide_index=True, use_container_width=True)
+
 # GPA Calculator Tool
 st.markdown("---")
 st.subheader("🧮 GPA Hesaplayıcı")
 
 with st.expander("💡 Hızlı GPA Hesaplama"):
-    st.markdown("Yeni notlarınızı eklemeden önce GPA'nizi tahmin edin:")
+    st.markdown("Planladığınız derslerle GNO'nuzu tahmin edin veya hedef GNO için gereken notları bulun:")
     
-    num_courses = st.number_input("Ders Sayısı", min_value=1, max_value=10, value=3)
+    simulator_system = (UserManager.get_profile() or {}).get('gpa_system', "4.0 Çift Harf")
+    open_option = "🎯 Hedefe göre"
+    letter_options = [open_option] + GPASystem.get_grade_options(simulator_system)
     
-    total_points = 0
-    total_credits_calc = 0
+    col1, col2 = st.columns(2)
+    with col1:
+        num_courses = st.number_input("Ders Sayısı", min_value=1, max_value=10, value=3)
+    with col2:
+        target_gpa = st.number_input("Hedef GNO (0 = hedef yok)", min_value=0.0, max_value=5.0, value=0.0, step=0.05)
     
+    planned = []
     for i in range(num_courses):
         col1, col2 = st.columns(2)
         with col1:
-            grade_calc = st.number_input(f"Ders {i+1} Notu", min_value=0.0, max_value=4.0, value=3.0, step=0.1, key=f"calc_grade_{i}")
+            letter_calc = st.selectbox(f"Ders {i+1} Notu", options=letter_options, key=f"calc_grade_{i}")
         with col2:
             credits_calc = st.number_input(f"Ders {i+1} Kredi", min_value=1, max_value=10, value=3, key=f"calc_credits_{i}")
         
-        total_points += grade_calc * credits_calc
-        total_credits_calc += credits_calc
+        planned.append({
+            'course_name': f"Ders {i+1}",
+            'credits': credits_calc,
+            'grade': None if letter_calc == open_option else letter_calc
+        })
     
-    if total_credits_calc > 0:
-        calculated_gpa = total_points / total_credits_calc
-        st.success(f"**Hesaplanan GPA:** {calculated_gpa:.2f}")
+    simulation = GPASimulator.simulate(planned, target_gpa or None, simulator_system)
+    
+    col1, col2 = st.columns(2)
+    col1.metric("Mevcut GNO", f"{simulation['current_gpa']:.2f}")
+    col2.metric(
+        "Tahmini GNO",
+        f"{simulation['projected_gpa']:.2f}",
+        delta=f"{simulation['projected_gpa'] - simulation['current_gpa']:+.2f}" if simulation['current_credits'] else None
+    )
+    
+    if simulation['required_average'] is not None:
+        if simulation['feasible']:
+            st.success(
+                f"**Gereken ortalama:** {max(simulation['required_average'], 0):.2f} "
+                f"(tüm açık derslerde en az {simulation['required_letter']})"
+            )
+            for course in simulation['courses']:
+                if 'min_letter' in course:
+                    st.write(f"- {course['course_name']}: diğerleri en yüksek notla geçilirse en az **{course['min_letter']}**")
+            
+            open_courses = [course for course in planned if not course['grade']]
+            combinations = GPASimulator.letter_combinations(open_courses, target_gpa, simulator_system, limit=10)
+            if combinations:
+                st.markdown("**Hedefe ulaştıran not kombinasyonları:**")
+                st.dataframe(pd.DataFrame(
+                    [combination['grades'] + [combination['gpa']] for combination in combinations],
+                    columns=[course['course_name'] for course in open_courses] + ['GNO']
+                ), hide_index=True, use_container_width=True)
+        else:
+            st.error(f"❌ Hedef GNO bu derslerle ulaşılamaz (gereken ortalama: {simulation['required_average']:.2f})")
+    elif simulation['feasible'] is not None:
+        if simulation['feasible']:
+            st.success("✅ Bu notlarla hedef GNO'ya ulaşılıyor!")
+        else:
+            st.warning("⚠️ Bu notlarla hedef GNO'ya ulaşılamıyor.")
@@ -12,6 +12,8 @@ from utils.yok_api import YokAPI
 from utils.export_import_ui import (
     show_export_button,
     show_import_button,
+    show_recovery_code,
+    show_session_restore,
     show_clear_data_button,
     show_storage_info
 )
@@ -241,6 +243,11 @@ if not profile:
                 st.balloons()
                 st.rerun()
     
+    st.markdown("---")
+    
+    # Returning users come back to their data with their recovery code
+    show_session_restore()
+    
     st.stop()
 
 # Tabs
@@ -324,16 +331,26 @@ with tab2:
     
     st.info("""
     **💡 Önemli Bilgi:**
-    Verileriniz tarayıcınızda saklanmaktadır. Tarayıcı önbelleğini temizlerseniz veya farklı bir cihaz kullanırsanız verileriniz kaybolabilir.
+    Verileriniz kurtarma kodunuza bağlıdır. Sayfayı yenilerseniz veya farklı bir cihaz kullanırsanız kurtarma kodunuzla verilerinize geri dönebilirsiniz; kod olmadan verilerinize ulaşılamaz.
     
     **Öneriler:**
+    - Kurtarma kodunuzu güvenli bir yerde saklayın
     - Düzenli olarak verilerinizi dışa aktararak yedekleyin
-    - Farklı cihazlarda kullanmak için veri aktarımı yapın
     - Önemli değişikliklerden önce yedek alın
     """)
     
     st.markdown("---")
     
+    # Recovery code of this session
+    show_recovery_code()
+    
+    st.markdown("---")
+    
+    # Attach to another recovery code
+    show_session_restore()
+    
+    st.markdown("---")
+    
     # Storage info
     show_storage_info()
     
@@ -0,0 +1,49 @@
+"""
+Shared pytest fixtures.
+"""
+import pytest
+from utils.storage_manager import StorageManager
+from utils.yok_api import YokAPI
+from utils.yok_cache import YokCache
+
+
+@pytest.fixture
+def empty_storage():
+    """Start each test with empty storage."""
+    StorageManager.clear_all_data()
+    yield
+    StorageManager.clear_all_data()
+
+
+class StandInYokAtlas:
+    """Local stand-in for the yokatlas client that records its calls."""
+
+    def __init__(self, universities=None):
+        self.universities = universities if universities is not None else [
+            {'name': 'Test Üniversitesi', 'city': 'Eskişehir', 'type': 'Devlet'},
+            {'name': 'Örnek Vakıf Üniversitesi', 'city': 'İzmir', 'type': 'Vakıf'}
+        ]
+        self.calls = 0
+
+    def get_universities(self):
+        self.calls += 1
+        return self.universities
+
+
+@pytest.fixture
+def yok_stand_in(tmp_path, monkeypatch):
+    """
+    Point YokAPI at a temporary disk cache and a stand-in YÖK Atlas client.
+    Remote fetching is disabled; tests enable it with
+    monkeypatch.setattr(YokAPI, 'remote_enabled', True). Disk versions are
+    checked on every read so direct cache.put calls are seen immediately.
+    """
+    cache = YokCache(str(tmp_path / 'yok_cache.db'))
+    client = StandInYokAtlas()
+    monkeypatch.setattr(YokAPI, '_yokatlas', client)
+    monkeypatch.setattr(YokAPI, 'remote_enabled', False)
+    monkeypatch.setattr(YokAPI, 'version_check_interval', 0)
+    YokAPI.set_disk_cache(cache)
+    yield cache, client
+    YokAPI.set_disk_cache(None)
+    cache.close()
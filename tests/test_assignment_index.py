@@ -0,0 +1,144 @@
+"""
+Tests for AssignmentIndex and indexed AssignmentManager queries.
+"""
+from datetime import datetime, timedelta
+from utils.assignment_index import AssignmentIndex, parse_due_date, get_due_date, DUE_DATE_CACHE_FIELD
+from utils.assignment_manager import AssignmentManager
+from utils.storage_manager import StorageManager
+
+
+def add(title, days, status='pending'):
+    """Add an assignment due in the given number of days."""
+    return AssignmentManager.add_assignment({
+        'title': title,
+        'due_date': (datetime.now() + timedelta(days=days)).isoformat(),
+        'type': 'assignment',
+        'status': status
+    })
+
+
+class TestParseDueDate:
+    """Tests for due date parsing."""
+
+    def test_parses_date_and_datetime(self):
+        """Test that date-only and datetime strings are parsed."""
+        assert parse_due_date('2024-05-01') == datetime(2024, 5, 1)
+        assert parse_due_date('2024-05-01T13:30:00') == datetime(2024, 5, 1, 13, 30)
+
+    def test_normalizes_timezone(self):
+        """Test that UTC values become naive local datetimes."""
+        due_date = parse_due_date('2024-05-01T13:30:00Z')
+        assert due_date.tzinfo is None
+
+    def test_invalid_values(self):
+        """Test that invalid values return None."""
+        assert parse_due_date('not a date') is None
+        assert parse_due_date(None) is None
+        assert parse_due_date('') is None
+
+
+class TestDueDateCache:
+    """Tests for the parse-once due date column."""
+
+    def test_cached_and_invalidated_on_change(self):
+        """Test that the parsed value is reused until due_date changes."""
+        assignment = {'id': 1, 'due_date': '2024-05-01T10:00:00'}
+        first = get_due_date(assignment)
+        assert assignment[DUE_DATE_CACHE_FIELD] == ('2024-05-01T10:00:00', first)
+        assert get_due_date(assignment) is first
+
+        assignment['due_date'] = '2024-06-01T10:00:00'
+        assert get_due_date(assignment) == datetime(2024, 6, 1, 10, 0)
+
+    def test_cache_not_exported(self, empty_storage):
+        """Test that the cached column is stored at write time but never exported."""
+        assignment_id = add('Önbellek', 3)
+        assert DUE_DATE_CACHE_FIELD in AssignmentManager.get_assignment(assignment_id)
+
+        AssignmentManager.update_assignment(assignment_id, {'due_date': '2030-01-01T09:00:00'})
+        assert AssignmentManager.get_due_date(AssignmentManager.get_assignment(assignment_id)) == datetime(2030, 1, 1, 9, 0)
+
+        exported = StorageManager.export_data()['assignments']
+        assert all(DUE_DATE_CACHE_FIELD not in record for record in exported)
+
+
+class TestAssignmentIndex:
+    """Tests for the index data structure."""
+
+    def test_build_and_range_query(self):
+        """Test building from a collection and querying a date range."""
+        base = datetime(2024, 1, 1)
+        source = {
+            i: {'id': i, 'status': 'pending', 'due_date': (base + timedelta(days=i)).isoformat()}
+            for i in range(1, 11)
+        }
+        index = AssignmentIndex(source)
+
+        assert index.ids_due_between(base + timedelta(days=3), base + timedelta(days=5)) == [3, 4, 5]
+        assert index.count_by_status('pending') == 10
+
+    def test_incremental_update(self):
+        """Test that updates move entries between status and date buckets."""
+        source = {1: {'id': 1, 'status': 'pending', 'due_date': '2024-01-05'}}
+        index = AssignmentIndex(source)
+
+        source[1]['status'] = 'completed'
+        source[1]['due_date'] = '2024-02-01'
+        index.add(source[1])
+
+        assert index.ids_by_status('pending') == []
+        assert index.ids_by_status('completed') == [1]
+        assert index.ids_due_between(datetime(2024, 1, 1), datetime(2024, 1, 31)) == []
+
+        index.remove(1)
+        assert index.count_by_status('completed') == 0
+        assert index.by_due_date == []
+
+    def test_invalid_dates_are_not_range_indexed(self):
+        """Test that assignments with invalid dates are still status-indexed."""
+        index = AssignmentIndex({1: {'id': 1, 'status': 'pending', 'due_date': 'yarın'}})
+        assert index.ids_by_status('pending') == [1]
+        assert index.by_due_date == []
+
+
+class TestIndexedQueries:
+    """Tests that manager queries use and maintain the index."""
+
+    def test_status_queries(self, empty_storage):
+        """Test status queries are sorted by due date."""
+        late = add('Geç Ödev', 5)
+        early = add('Erken Ödev', 1)
+        done = add('Bitmiş Ödev', 2, status='completed')
+
+        assert [a['id'] for a in AssignmentManager.get_assignments_by_status('pending')] == [early, late]
+        assert [a['id'] for a in AssignmentManager.get_assignments_by_status('completed')] == [done]
+        assert AssignmentManager.get_pending_count() == 2
+
+    def test_upcoming_skips_completed_and_out_of_range(self, empty_storage):
+        """Test upcoming assignments honour the window and status."""
+        soon = add('Yakın', 2)
+        add('Uzak', 20)
+        add('Geçmiş', -2)
+        done = add('Bitmiş', 3, status='completed')
+
+        assert [a['id'] for a in AssignmentManager.get_upcoming_assignments(7)] == [soon]
+
+        AssignmentManager.update_assignment(done, {'status': 'pending'})
+        assert [a['id'] for a in AssignmentManager.get_upcoming_assignments(7)] == [soon, done]
+
+        AssignmentManager.delete_assignment(soon)
+        assert [a['id'] for a in AssignmentManager.get_upcoming_assignments(7)] == [done]
+        assert AssignmentManager.get_pending_count() == 3
+
+    def test_index_rebuilt_after_import(self, empty_storage):
+        """Test that importing data replaces the index."""
+        add('Eski', 1)
+        due_date = (datetime.now() + timedelta(days=1)).isoformat()
+        StorageManager.import_data({
+            'version': StorageManager.DATA_VERSION,
+            'exported_at': datetime.now().isoformat(),
+            'assignments': [{'id': 42, 'title': 'Yeni', 'due_date': due_date, 'status': 'pending'}]
+        })
+
+        assert [a['id'] for a in AssignmentManager.get_upcoming_assignments(7)] == [42]
+        assert AssignmentManager.get_pending_count() == 1
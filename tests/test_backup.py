@@ -0,0 +1,245 @@
+"""
+Tests for backup export/import formats.
+Tests streamed NDJSON backups, compressed columnar backups and legacy JSON compatibility.
+"""
+import io
+import json
+import pytest
+from datetime import datetime, timedelta
+from utils.storage_manager import StorageManager
+from utils import backup_codec
+from utils.course_manager import CourseManager
+from utils.assignment_manager import AssignmentManager
+from utils.grade_manager import GradeManager
+from utils.user_manager import UserManager
+
+
+@pytest.fixture
+def sample_data():
+    """Fill storage with a small dataset."""
+    StorageManager.clear_all_data()
+    UserManager.create_profile(name='Ayşe Yılmaz', email='ayse@universite.edu.tr')
+    for day in ['Monday', 'Wednesday']:
+        CourseManager.add_course({
+            'course_name': 'Veri Yapıları',
+            'course_code': 'CS201',
+            'day': day,
+            'start_time': '09:00',
+            'end_time': '10:30'
+        })
+    for i in range(5):
+        AssignmentManager.add_assignment({
+            'title': f'Ödev {i}',
+            'due_date': (datetime.now() + timedelta(days=i)).isoformat(),
+            'type': 'assignment'
+        })
+    GradeManager.add_grade({'course_name': 'Fizik', 'grade': 3.5, 'credits': 4, 'semester': 'Fall', 'year': 2024})
+    yield
+    StorageManager.clear_all_data()
+
+
+def snapshot():
+    """Comparable view of the current data."""
+    data = StorageManager.export_data()
+    data.pop('exported_at')
+    return data
+
+
+class TestNDJSONBackup:
+    """Tests for streamed NDJSON export/import."""
+
+    def test_roundtrip(self, sample_data):
+        """Test that an NDJSON export imports back to the same data."""
+        before = snapshot()
+        payload = "".join(StorageManager.export_ndjson()).encode('utf-8')
+
+        StorageManager.clear_all_data()
+        success, message = StorageManager.import_ndjson(io.BytesIO(payload), batch_size=2)
+
+        assert success is True, message
+        assert snapshot() == before
+
+    def test_one_record_per_line(self, sample_data):
+        """Test the header and per-record line layout."""
+        lines = list(StorageManager.export_ndjson())
+        header = json.loads(lines[0])
+
+        assert header['format'] == StorageManager.NDJSON_FORMAT
+        assert header['counts'] == {'courses': 2, 'assignments': 5, 'grades': 1, 'reminders': 0}
+        assert len(lines) == 1 + 2 + 5 + 1
+        assert all('\n' not in line[:-1] for line in lines)
+
+    def test_header_preview(self, sample_data):
+        """Test reading only the header of a backup."""
+        stream = io.BytesIO("".join(StorageManager.export_ndjson()).encode('utf-8'))
+        header = StorageManager.read_backup_header(stream)
+        assert header['user_profile']['name'] == 'Ayşe Yılmaz'
+
+        legacy = io.BytesIO(json.dumps(StorageManager.export_data(), indent=2).encode('utf-8'))
+        assert StorageManager.read_backup_header(legacy) is None
+
+    def test_invalid_record_keeps_existing_data(self, sample_data):
+        """Test that a bad line aborts the import without touching current data."""
+        before = snapshot()
+        lines = list(StorageManager.export_ndjson())
+        lines.insert(3, json.dumps({'type': 'unknown', 'data': {}}) + '\n')
+
+        success, message = StorageManager.import_ndjson(io.StringIO("".join(lines)))
+
+        assert success is False
+        assert 'satır 4' in message
+        assert snapshot() == before
+
+    def test_stale_counter_moved_past_imported_ids(self, sample_data):
+        """Test that header counters below the largest imported ID are corrected."""
+        lines = list(StorageManager.export_ndjson())
+        header = json.loads(lines[0])
+        header['next_assignment_id'] = 1
+        lines[0] = json.dumps(header) + '\n'
+        lines.append(json.dumps({'type': 'assignments', 'data': {
+            'id': 50, 'title': 'Yüksek ID', 'due_date': '2030-01-01', 'status': 'pending'}}) + '\n')
+
+        success, _ = StorageManager.import_ndjson(io.StringIO("".join(lines)), batch_size=2)
+
+        assert success is True
+        assert AssignmentManager.add_assignment({'title': 'Yeni', 'due_date': '2030-02-01'}) == 51
+
+    def test_string_ids_rejected(self, sample_data):
+        """Test that NDJSON records get the same ID type checks as bulk_load."""
+        before = snapshot()
+        lines = list(StorageManager.export_ndjson())
+        lines.append(json.dumps({'type': 'courses', 'data': {'id': '1', 'course_name': 'Metin ID'}}) + '\n')
+
+        success, message = StorageManager.import_ndjson(io.StringIO("".join(lines)))
+
+        assert success is False
+        assert message == "❌ Geçersiz kayıt kimliği (courses)"
+        assert snapshot() == before
+
+    def test_legacy_json_still_supported(self, sample_data):
+        """Test that indented single-document backups still import."""
+        before = snapshot()
+        legacy = json.loads(json.dumps(StorageManager.export_data(), indent=2))
+
+        StorageManager.clear_all_data()
+        success, _ = StorageManager.import_data(legacy)
+
+        assert success is True
+        assert snapshot() == before
+
+
+class TestBinaryBackup:
+    """Tests for compressed columnar backups."""
+
+    @pytest.mark.parametrize('codec', ['zlib', 'lzma'])
+    def test_roundtrip_autodetected(self, sample_data, codec):
+        """Test that import_data detects and restores binary backups."""
+        before = snapshot()
+        payload = StorageManager.export_binary(codec=codec)
+
+        StorageManager.clear_all_data()
+        success, message = StorageManager.import_data(payload)
+
+        assert success is True, message
+        assert snapshot() == before
+
+    def test_smaller_than_json(self, sample_data):
+        """Test that the binary backup is smaller than indented JSON."""
+        payload = StorageManager.export_binary()
+        legacy = json.dumps(StorageManager.export_data(), indent=2).encode('utf-8')
+        assert len(payload) < len(legacy)
+
+    def test_header_preview(self, sample_data):
+        """Test that the header is readable without decompressing the payload."""
+        stream = io.BytesIO(StorageManager.export_binary())
+        header = StorageManager.read_backup_header(stream)
+
+        assert header['format'] == StorageManager.BINARY_FORMAT
+        assert header['version'] == StorageManager.DATA_VERSION
+        assert header['counts']['assignments'] == 5
+
+    def test_sparse_columns(self):
+        """Test that missing keys stay missing rather than becoming None."""
+        records = [{'id': 1, 'a': None}, {'id': 2, 'b': 'x'}, {'id': 3}]
+        table = backup_codec.encode_columns(records)
+        assert backup_codec.decode_columns(table) == records
+
+    def test_typed_columns_roundtrip(self):
+        """Test that every column kind survives pack/unpack with its Python type."""
+        records = [
+            {'id': 1, 'grade': 3.5, 'done': True, 'name': 'Çalışma', 'tags': ['a'], 'mixed': 1, 'big': 2 ** 70},
+            {'id': 2, 'grade': None, 'done': False, 'name': '', 'tags': None, 'mixed': 1.5, 'big': 1},
+            {'id': 3, 'grade': 0.0, 'name': None, 'tags': {'k': 1}, 'mixed': 'x'}
+        ]
+        payload = backup_codec.pack({}, {'grades': backup_codec.encode_columns(records)})
+        _, tables = backup_codec.unpack(payload)
+
+        decoded = backup_codec.decode_columns(tables['grades'])
+        assert decoded == records
+        assert [type(record['mixed']) for record in decoded] == [int, float, str]
+
+    def test_payload_not_parsed_as_json(self, sample_data, monkeypatch):
+        """Test that flat records are decoded without a JSON parse of the payload."""
+        payload = StorageManager.export_binary()
+        parsed = []
+        loads = backup_codec.json.loads
+        monkeypatch.setattr(backup_codec.json, 'loads', lambda text, **kwargs: parsed.append(text) or loads(text, **kwargs))
+
+        header, tables = backup_codec.unpack(payload)
+
+        # Only the uncompressed header goes through json.loads
+        assert len(parsed) == 1
+        assert header['counts']['assignments'] == 5
+        assert tables['assignments']['rows'] == 5
+
+    def test_corrupted_payload_rejected(self, sample_data):
+        """Test that a damaged backup fails without touching current data."""
+        before = snapshot()
+        payload = bytearray(StorageManager.export_binary())
+        payload[-5] ^= 0xFF
+
+        success, message = StorageManager.import_data(bytes(payload))
+
+        assert success is False
+        assert message.startswith('❌')
+        assert snapshot() == before
+
+
+class TestBulkLoad:
+    """Tests for the bulk import path."""
+
+    def test_timings_per_entity(self, sample_data):
+        """Test that a timing breakdown is reported for each stage."""
+        data = StorageManager.export_data()
+        success, _, timings = StorageManager.bulk_load(data)
+
+        assert success is True
+        assert set(timings) == set(StorageManager.COLLECTIONS) | {'persist', 'total'}
+        assert all(seconds >= 0 for seconds in timings.values())
+
+    def test_counters_derived_from_max_id(self, sample_data):
+        """Test that stale counters are moved past the largest imported ID."""
+        data = StorageManager.export_data()
+        data['assignments'].append({'id': 50, 'title': 'Yüksek ID', 'due_date': '2030-01-01', 'status': 'pending'})
+        data['next_assignment_id'] = 3
+
+        success, _, _ = StorageManager.bulk_load(data)
+
+        assert success is True
+        assert AssignmentManager.add_assignment({'title': 'Yeni', 'due_date': '2030-02-01'}) == 51
+
+    @pytest.mark.parametrize('bad_records', [
+        ['not a record'],
+        [{'id': '1', 'course_name': 'Metin ID'}],
+    ])
+    def test_invalid_records_rejected(self, sample_data, bad_records):
+        """Test that wrong record or ID types abort the load."""
+        before = snapshot()
+        data = StorageManager.export_data()
+        data['courses'] = data['courses'] + bad_records
+
+        success, message, _ = StorageManager.bulk_load(data)
+
+        assert success is False
+        assert message.startswith('❌')
+        assert snapshot() == before
@@ -0,0 +1,135 @@
+"""
+Tests for data versions and change events emitted by StorageManager.
+"""
+import pytest
+from utils.storage_manager import StorageManager
+from utils.storage_backend import MemoryBackend
+from utils.course_manager import CourseManager
+from utils.assignment_manager import AssignmentManager
+from utils.grade_manager import GradeManager
+from utils.user_manager import UserManager
+
+
+@pytest.fixture
+def events():
+    """Collect all change events emitted during a test."""
+    StorageManager.clear_all_data()
+    received = []
+    unsubscribe = StorageManager.subscribe(received.append)
+    yield received
+    unsubscribe()
+    StorageManager.clear_all_data()
+
+
+def add_grade(name='Fizik'):
+    """Add a grade for the given course name."""
+    return GradeManager.add_grade({'course_name': name, 'grade': 3.0, 'credits': 3, 'semester': 'Fall', 'year': 2024})
+
+
+class TestVersions:
+    """Tests for per-entity data versions."""
+
+    def test_version_changes_on_mutation(self, events):
+        """Test that add, update and delete each bump the version."""
+        seen = [StorageManager.get_version('grades')]
+        grade_id = add_grade()
+        seen.append(StorageManager.get_version('grades'))
+        GradeManager.update_grade(grade_id, {'grade': 4.0})
+        seen.append(StorageManager.get_version('grades'))
+        GradeManager.delete_grade(grade_id)
+        seen.append(StorageManager.get_version('grades'))
+
+        assert len(set(seen)) == 4
+
+    def test_other_entities_unchanged(self, events):
+        """Test that a mutation only bumps its own entity's version."""
+        before = StorageManager.get_versions('courses', 'assignments')
+        add_grade()
+        assert StorageManager.get_versions('courses', 'assignments') == before
+
+    def test_versions_not_reused_after_reset(self, events):
+        """Test that a fresh state never repeats a version seen earlier."""
+        add_grade()
+        old_version = StorageManager.get_version('grades')
+
+        StorageManager.set_backend(MemoryBackend())
+        assert StorageManager.get_version('grades') != old_version
+
+
+class TestSubscribers:
+    """Tests for change-event hooks."""
+
+    def test_event_contents(self, events):
+        """Test that add, update and delete events describe the change."""
+        grade_id = add_grade()
+        GradeManager.update_grade(grade_id, {'grade': 4.0})
+        GradeManager.delete_grade(grade_id)
+
+        grade_events = [e for e in events if e['entity'] == 'grades']
+        assert [(e['action'], e['record_id']) for e in grade_events] == [
+            ('add', grade_id), ('update', grade_id), ('delete', grade_id)
+        ]
+        assert grade_events[-1]['version'] == StorageManager.get_version('grades')
+        assert grade_events[-1]['tenant'] == StorageManager.get_tenant().key
+
+    def test_entity_filter_and_unsubscribe(self, events):
+        """Test that filtered subscribers only see their entities until removed."""
+        courses = []
+        unsubscribe = StorageManager.subscribe(courses.append, entities=['courses'])
+        add_grade()
+        CourseManager.add_course({'course_name': 'Kimya', 'course_code': 'KIM101', 'day': 'Monday', 'start_time': '09:00', 'end_time': '10:00'})
+        unsubscribe()
+        CourseManager.add_course({'course_name': 'Tarih', 'course_code': 'TAR101', 'day': 'Friday', 'start_time': '09:00', 'end_time': '10:00'})
+
+        assert [e['entity'] for e in courses] == ['courses']
+
+    def test_clear_and_import_events(self, events):
+        """Test that clearing and importing notify every entity type."""
+        UserManager.create_profile(name='Ayşe', email='ayse@universite.edu.tr')
+        add_grade()
+        exported = StorageManager.export_data()
+        del events[:]
+
+        StorageManager.clear_all_data()
+        StorageManager.import_data(exported)
+
+        actions = {(e['entity'], e['action']) for e in events}
+        for entity in ['user_profile', *StorageManager.COLLECTIONS]:
+            assert (entity, 'clear') in actions
+            assert (entity, 'replace') in actions
+
+    def test_indexes_current_when_notified(self, events):
+        """Test that hooks already see the change in the schedule and assignment indexes."""
+        seen = []
+        unsubscribe = StorageManager.subscribe(lambda event: seen.append((
+            event['action'],
+            len(CourseManager.get_schedule_index().day_intervals('Monday')),
+            len(CourseManager.get_schedule_index().day_intervals('Friday')),
+            AssignmentManager.get_pending_count()
+        )))
+        try:
+            course_id = CourseManager.add_course({'course_name': 'Kimya', 'course_code': 'KIM101', 'day': 'Monday', 'start_time': '09:00', 'end_time': '10:00'})
+            CourseManager.update_course(course_id, {'day': 'Friday'})
+            CourseManager.delete_course(course_id)
+            assignment_id = AssignmentManager.add_assignment({'title': 'Ödev', 'type': 'assignment', 'due_date': '2030-01-01'})
+            AssignmentManager.update_assignment(assignment_id, {'status': 'completed'})
+            AssignmentManager.delete_assignment(assignment_id)
+        finally:
+            unsubscribe()
+
+        assert seen == [('add', 1, 0, 0), ('update', 0, 1, 0), ('delete', 0, 0, 0),
+                        ('add', 0, 0, 1), ('update', 0, 0, 0), ('delete', 0, 0, 0)]
+
+    def test_failing_subscriber_does_not_break_writes(self, events):
+        """Test that an exception in a hook does not undo the mutation."""
+        def broken(event):
+            raise RuntimeError("bozuk")
+
+        unsubscribe = StorageManager.subscribe(broken)
+        try:
+            add_grade()
+        finally:
+            unsubscribe()
+
+        assert GradeManager.get_grade_count() == 1
+        assert events[-1]['entity'] == 'grades'
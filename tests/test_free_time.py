@@ -0,0 +1,108 @@
+"""
+Tests for the free study time finder.
+"""
+import pytest
+from datetime import datetime, timedelta
+from utils.free_time import FreeTimeFinder
+from utils.course_manager import CourseManager
+from utils.assignment_manager import AssignmentManager
+
+
+# A Monday far in the future, so deadlines are always upcoming
+MONDAY = datetime(2099, 1, 5)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Make the finder see MONDAY 00:00 as the current time."""
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return MONDAY
+
+    monkeypatch.setattr('utils.free_time.datetime', FixedDatetime)
+
+
+def add_course(day, start, end):
+    """Add a weekly course."""
+    return CourseManager.add_course({
+        'course_name': 'Fizik', 'course_code': 'FIZ101', 'day': day, 'start_time': start, 'end_time': end
+    })
+
+
+def add_assignment(title, due_date, status='pending'):
+    """Add an assignment with an exact due date."""
+    return AssignmentManager.add_assignment({'title': title, 'due_date': due_date.isoformat(), 'status': status})
+
+
+class TestFreeWindows:
+    """Tests for free windows around the weekly schedule."""
+
+    def test_courses_split_the_day(self, empty_storage):
+        """Test that courses and study hours bound the windows."""
+        add_course('Monday', '09:00', '10:00')
+        add_course('Monday', '12:00', '13:00')
+
+        windows = FreeTimeFinder.free_windows(MONDAY, MONDAY + timedelta(days=1))
+        assert windows == [
+            (MONDAY.replace(hour=8), MONDAY.replace(hour=9)),
+            (MONDAY.replace(hour=10), MONDAY.replace(hour=12)),
+            (MONDAY.replace(hour=13), MONDAY.replace(hour=23))
+        ]
+
+    def test_short_windows_dropped_and_clipped_to_start(self, empty_storage):
+        """Test the minimum length and that windows start no earlier than `start`."""
+        add_course('Monday', '09:00', '09:50')
+        add_course('Monday', '10:00', '11:00')
+        start = MONDAY.replace(hour=8, minute=45)
+
+        windows = FreeTimeFinder.free_windows(start, MONDAY.replace(hour=12), min_minutes=30)
+        assert windows == [(MONDAY.replace(hour=11), MONDAY.replace(hour=12))]
+
+    def test_windows_merge_over_midnight(self, empty_storage):
+        """Test that round-the-clock study hours give one window per free stretch."""
+        add_course('Tuesday', '10:00', '11:00')
+        windows = FreeTimeFinder.free_windows(MONDAY, MONDAY + timedelta(days=2), day_start='00:00', day_end='24:00')
+        assert windows == [
+            (MONDAY, MONDAY + timedelta(days=1, hours=10)),
+            (MONDAY + timedelta(days=1, hours=11), MONDAY + timedelta(days=2))
+        ]
+
+
+class TestStudyWindows:
+    """Tests for per-deadline study windows."""
+
+    def test_windows_before_each_deadline(self, empty_storage, frozen_now):
+        """Test that each deadline gets the free time up to its due date."""
+        add_course('Monday', '08:00', '23:00')
+        add_course('Tuesday', '08:00', '20:00')
+
+        first = add_assignment('Rapor', MONDAY + timedelta(days=1, hours=21))
+        add_assignment('Sunum', MONDAY + timedelta(days=1, hours=23, minutes=30))
+        add_assignment('Bitti', MONDAY + timedelta(days=1, hours=22), status='completed')
+
+        results = FreeTimeFinder.get_study_windows()
+        assert [r['assignment']['title'] for r in results] == ['Rapor', 'Sunum']
+        assert results[0]['assignment']['id'] == first
+        assert results[0]['free_minutes'] == 60
+        assert results[1]['free_minutes'] == 180
+        assert results[1]['windows'] == [(MONDAY + timedelta(days=1, hours=20), MONDAY + timedelta(days=1, hours=23))]
+
+    def test_semester_horizon_is_cached(self, empty_storage, frozen_now):
+        """Test a 16-week horizon and that repeated queries reuse the result."""
+        add_course('Monday', '09:00', '12:00')
+        add_course('Wednesday', '13:00', '17:00')
+        for week in range(16):
+            add_assignment(f'Ödev {week}', MONDAY + timedelta(weeks=week, days=3))
+
+        results = FreeTimeFinder.get_study_windows(min_minutes=60)
+        assert len(results) == 16
+        # 108 days of 15 study hours, minus 16 Mondays (3 h) and Wednesdays (4 h) of classes
+        assert results[-1]['free_minutes'] == (108 * 15 - 16 * 7) * 60
+
+        misses = FreeTimeFinder._study_windows.cache_info()['misses']
+        assert FreeTimeFinder.get_study_windows(min_minutes=60) is results
+        assert FreeTimeFinder._study_windows.cache_info()['misses'] == misses
+
+        add_course('Friday', '09:00', '10:00')
+        assert FreeTimeFinder.get_study_windows(min_minutes=60)[-1]['free_minutes'] < results[-1]['free_minutes']
@@ -0,0 +1,172 @@
+"""
+Tests for the columnar GPA engine and GradeManager GPA queries.
+"""
+import random
+from utils.gpa_engine import GradeColumns, find_semester
+from utils.grade_manager import GradeManager
+from utils.storage_manager import StorageManager
+
+
+def add_grade(name, grade, credits, semester, year):
+    """Add a grade entry."""
+    return GradeManager.add_grade({'course_name': name, 'grade': grade, 'credits': credits, 'semester': semester, 'year': year})
+
+
+def brute_force_gpa(grades):
+    """Reference credit-weighted GPA rounded to two decimals."""
+    credits = sum(g['credits'] for g in grades)
+    if credits == 0:
+        return 0.0
+    return round(sum(g['grade'] * g['credits'] for g in grades) / credits, 2)
+
+
+class TestGradeColumns:
+    """Tests for the columnar store itself."""
+
+    def test_matches_reference(self):
+        """Test overall, semester and cumulative GPA against plain loops."""
+        rng = random.Random(5)
+        source = {}
+        for grade_id in range(1, 301):
+            source[grade_id] = {
+                'id': grade_id,
+                'grade': rng.choice([0.0, 1.0, 2.0, 2.5, 3.0, 3.5, 4.0]),
+                'credits': rng.randint(1, 6),
+                'semester': rng.choice(['Fall', 'Spring', 'Summer']),
+                'year': rng.randint(2021, 2024)
+            }
+
+        summary = GradeColumns(source).summary()
+        grades = list(source.values())
+        assert summary['gpa'] == brute_force_gpa(grades)
+        assert summary['total_credits'] == sum(g['credits'] for g in grades)
+
+        labels = sorted({(g['semester'], g['year']) for g in grades}, key=lambda x: (x[1], x[0]))
+        assert [(e['semester'], e['year']) for e in summary['semesters']] == labels
+
+        seen = []
+        for entry in summary['semesters']:
+            members = [g for g in grades if (g['semester'], g['year']) == (entry['semester'], entry['year'])]
+            seen.extend(members)
+            assert entry['gpa'] == brute_force_gpa(members)
+            assert sorted(entry['grade_ids']) == sorted(g['id'] for g in members)
+            assert entry['cumulative_gpa'] == brute_force_gpa(seen)
+
+    def test_incremental_updates(self):
+        """Test that add, move and remove keep the columns consistent."""
+        columns = GradeColumns({})
+        for grade_id in range(1, 40):
+            columns.add({'id': grade_id, 'grade': 2.0, 'credits': 3, 'semester': 'Fall', 'year': 2024})
+        columns.add({'id': 5, 'grade': 4.0, 'credits': 3, 'semester': 'Spring', 'year': 2025})
+        columns.remove(1)
+        columns.remove(39)
+
+        summary = columns.summary()
+        assert summary['grade_count'] == 37
+        assert find_semester(summary, 'Spring', 2025)['grade_ids'] == [5]
+        assert 1 not in find_semester(summary, 'Fall', 2024)['grade_ids']
+
+    def test_undated_grades_only_count_overall(self):
+        """Test that grades without semester or year stay out of semester groups."""
+        summary = GradeColumns({1: {'id': 1, 'grade': 3.0, 'credits': 2, 'semester': '', 'year': 2024}}).summary()
+        assert summary['gpa'] == 3.0
+        assert summary['semesters'] == []
+
+
+class TestGradeManagerGPA:
+    """Tests for GradeManager queries served by the engine."""
+
+    def test_queries_follow_mutations(self, empty_storage):
+        """Test GPA, credits, semesters and semester grades after edits."""
+        first = add_grade('Fizik', 4.0, 4, 'Fall', 2023)
+        add_grade('Kimya', 2.0, 2, 'Spring', 2024)
+        assert GradeManager.calculate_gpa() == 3.33
+        assert GradeManager.get_total_credits() == 6
+        assert GradeManager.get_semesters() == [('Fall', 2023), ('Spring', 2024)]
+
+        GradeManager.update_grade(first, {'semester': 'Spring', 'year': 2024})
+        assert GradeManager.get_semesters() == [('Spring', 2024)]
+        assert [g['course_name'] for g in GradeManager.get_grades_by_semester('Spring', 2024)] == ['Fizik', 'Kimya']
+        assert GradeManager.calculate_semester_gpa('Fall', 2023) == 0.0
+
+        GradeManager.delete_grade(first)
+        assert GradeManager.calculate_gpa() == 2.0
+        assert GradeManager.delete_grade(first) is False
+
+    def test_cumulative_timeline(self, empty_storage):
+        """Test cumulative GPA after each semester."""
+        add_grade('Fizik', 4.0, 3, 'Fall', 2023)
+        add_grade('Kimya', 2.0, 3, 'Spring', 2024)
+        add_grade('Tarih', 3.0, 6, 'Summer', 2024)
+
+        semesters = GradeManager.get_gpa_summary()['semesters']
+        assert [e['cumulative_gpa'] for e in semesters] == [4.0, 3.0, 3.0]
+        assert [e['cumulative_credits'] for e in semesters] == [3, 6, 12]
+
+    def test_columns_rebuilt_after_import(self, empty_storage):
+        """Test that importing a backup replaces the columns."""
+        add_grade('Fizik', 4.0, 3, 'Fall', 2023)
+        exported = StorageManager.export_data()
+        StorageManager.clear_all_data()
+        assert GradeManager.get_gpa_summary()['grade_count'] == 0
+
+        StorageManager.import_data(exported)
+        assert GradeManager.calculate_gpa() == 4.0
+
+
+class TestTimeline:
+    """Tests for semester prefix sums and the GPA timeline."""
+
+    def test_incremental_matches_rebuild(self):
+        """Test that random edits leave the same timeline as a fresh build."""
+        rng = random.Random(9)
+        source = {}
+        columns = GradeColumns(source)
+        for step in range(400):
+            grade_id = rng.randint(1, 60)
+            if grade_id in source and rng.random() < 0.3:
+                del source[grade_id]
+                columns.remove(grade_id)
+                continue
+            source[grade_id] = {
+                'id': grade_id,
+                'grade': rng.choice([0.5, 1.5, 2.0, 3.3, 3.7, 4.0]),
+                'credits': rng.randint(1, 5),
+                'semester': rng.choice(['Fall', 'Spring']),
+                'year': rng.randint(2019, 2025)
+            }
+            columns.add(dict(source[grade_id]))
+
+        assert columns.timeline() == GradeColumns(source).timeline()
+        assert columns.summary()['gpa'] == GradeColumns(source).summary()['gpa']
+
+    def test_changes_and_trend(self):
+        """Test semester deltas and the direction of the running GPA."""
+        columns = GradeColumns({})
+        columns.add({'id': 1, 'grade': 3.0, 'credits': 3, 'semester': 'Fall', 'year': 2023})
+        columns.add({'id': 2, 'grade': 4.0, 'credits': 3, 'semester': 'Spring', 'year': 2024})
+        columns.add({'id': 3, 'grade': 3.5, 'credits': 6, 'semester': 'Summer', 'year': 2024})
+
+        timeline = columns.timeline()
+        assert [e['gpa_change'] for e in timeline] == [0.0, 1.0, -0.5]
+        assert [e['cumulative_gpa'] for e in timeline] == [3.0, 3.5, 3.5]
+        assert [e['trend'] for e in timeline] == ['flat', 'up', 'flat']
+
+    def test_earlier_semester_shifts_prefix(self):
+        """Test that adding an earlier semester later updates every running GPA."""
+        columns = GradeColumns({1: {'id': 1, 'grade': 4.0, 'credits': 3, 'semester': 'Fall', 'year': 2024}})
+        columns.add({'id': 2, 'grade': 2.0, 'credits': 3, 'semester': 'Fall', 'year': 2022})
+
+        timeline = columns.timeline()
+        assert [(e['year'], e['cumulative_gpa']) for e in timeline] == [(2022, 2.0), (2024, 3.0)]
+        assert timeline[1]['trend'] == 'up'
+
+    def test_manager_timeline(self, empty_storage):
+        """Test that GradeManager exposes the timeline after each grade."""
+        add_grade('Fizik', 2.0, 3, 'Fall', 2023)
+        assert [e['cumulative_gpa'] for e in GradeManager.get_gpa_timeline()] == [2.0]
+
+        add_grade('Kimya', 4.0, 3, 'Spring', 2024)
+        timeline = GradeManager.get_gpa_timeline()
+        assert [e['cumulative_gpa'] for e in timeline] == [2.0, 3.0]
+        assert timeline[-1]['cumulative_change'] == 1.0
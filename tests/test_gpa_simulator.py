@@ -0,0 +1,107 @@
+"""
+Tests for the what-if GPA simulator.
+"""
+import itertools
+import pytest
+from utils.gpa_simulator import GPASimulator
+from utils.gpa_systems import GPASystem
+from utils.grade_manager import GradeManager
+from utils.storage_manager import StorageManager
+
+
+@pytest.fixture
+def transcript():
+    """Start from a 10-credit transcript with GNO 3.00."""
+    StorageManager.clear_all_data()
+    GradeManager.add_grade({'course_name': 'Fizik', 'grade': 3.0, 'credits': 6, 'semester': 'Fall', 'year': 2024})
+    GradeManager.add_grade({'course_name': 'Kimya', 'grade': 3.0, 'credits': 4, 'semester': 'Fall', 'year': 2024})
+    yield
+    StorageManager.clear_all_data()
+
+
+class TestSimulate:
+    """Tests for projected GNO and required grades."""
+
+    def test_required_average_closed_form(self, transcript):
+        """Test the closed-form average needed on planned credits."""
+        # (3.3 * 19 - 30) / 9
+        assert GPASimulator.required_average(3.3, 9) == pytest.approx((3.3 * 19 - 30) / 9)
+        assert GPASimulator.required_average(3.3, 0) is None
+        assert GPASimulator.required_average(2.0, 5, current=(0.0, 0)) == pytest.approx(2.0)
+
+    def test_simulate_projects_expected_grades(self, transcript):
+        """Test that expected grades are folded into the projected GNO."""
+        result = GPASimulator.simulate([{'course_name': 'Ders', 'credits': 5, 'grade': 'AA'}])
+        assert result['current_gpa'] == 3.0
+        assert result['projected_gpa'] == round((30 + 20) / 15, 2)
+        assert result['projected_credits'] == 15
+        assert result['required_average'] is None
+        assert result['feasible'] is None
+
+    def test_simulate_solves_open_courses(self, transcript):
+        """Test the required average and per-course minimums of open courses."""
+        planned = [
+            {'course_name': 'A', 'credits': 4},
+            {'course_name': 'B', 'credits': 2},
+            {'course_name': 'C', 'credits': 3, 'grade': 'BA'}
+        ]
+        result = GPASimulator.simulate(planned, 3.3)
+        assert result['required_average'] == round((3.3 * 19 - 30 - 10.5) / 6, 2)
+        assert result['required_letter'] == 'AA'
+        assert result['feasible']
+        # B needs (22.2 - 4 * 4.0) / 2 = 3.1 if A gets AA
+        assert result['courses'][1]['min_point'] == pytest.approx(3.1)
+        assert result['courses'][1]['min_letter'] == 'BA'
+
+    def test_simulate_infeasible_target(self, transcript):
+        """Test that a target above the scale is reported as infeasible."""
+        result = GPASimulator.simulate([{'course_name': 'A', 'credits': 2}], 3.9)
+        assert not result['feasible']
+        assert result['required_letter'] is None
+
+    def test_updates_follow_grade_changes(self, transcript):
+        """Test that current totals follow added and deleted grades."""
+        grade_id = GradeManager.add_grade({'course_name': 'Tarih', 'grade': 4.0, 'credits': 5, 'semester': 'Spring', 'year': 2025})
+        assert GPASimulator.get_current_totals() == (50.0, 15)
+        GradeManager.delete_grade(grade_id)
+        assert GPASimulator.get_current_totals() == (30.0, 10)
+
+
+class TestLetterCombinations:
+    """Tests for enumerating minimal letter grade combinations."""
+
+    def test_letter_combinations_match_brute_force(self, transcript):
+        """Test that the pruned search finds exactly the minimal combinations."""
+        system = "4.0 Tek Harf"
+        planned = [{'credits': 4}, {'credits': 2}, {'credits': 3}]
+        target = 3.2
+        values = sorted(set(GPASystem.get_system(system)['scale'].values()))
+        needed = target * 19 - 30
+
+        def reaches(grades):
+            return sum(v * c['credits'] for v, c in zip(grades, planned)) >= needed - 1e-9
+
+        minimal = set()
+        for grades in itertools.product(values, repeat=len(planned)):
+            if not reaches(grades):
+                continue
+            lowered = (
+                grades[:i] + (values[values.index(v) - 1],) + grades[i + 1:]
+                for i, v in enumerate(grades) if values.index(v)
+            )
+            if not any(reaches(g) for g in lowered):
+                minimal.add(grades)
+
+        scale = GPASystem.get_system(system)['scale']
+        combinations = GPASimulator.letter_combinations(planned, target, system, limit=100)
+        found = {tuple(scale[letter] for letter in c['grades']) for c in combinations}
+        assert found == minimal
+        assert [c['gpa'] for c in combinations] == sorted(c['gpa'] for c in combinations)
+
+    def test_letter_combinations_respects_min_point_and_limit(self, transcript):
+        """Test that min_point and limit bound the combinations."""
+        combinations = GPASimulator.letter_combinations([{'credits': 3}] * 4, 3.0, "4.0 Çift Harf", min_point=2.0, limit=3)
+        assert len(combinations) == 3
+        for combination in combinations:
+            assert all(GPASystem.grade_to_point(letter, "4.0 Çift Harf") >= 2.0 for letter in combination['grades'])
+        assert GPASimulator.letter_combinations([{'credits': 1}], 4.0, "4.0 Tek Harf") == []
@@ -0,0 +1,70 @@
+"""
+Tests for the compiled GPASystem lookup tables.
+"""
+import pytest
+from utils.gpa_systems import GPASystem
+
+
+def reference_gpa(grades, system_name):
+    """Per-grade dictionary loop the compiled version must match."""
+    scale = GPASystem.get_system(system_name)['scale']
+    total_credits = sum(credits for _, credits in grades)
+    if total_credits == 0:
+        return 0.0
+    return sum(scale.get(grade, 0.0) * credits for grade, credits in grades) / total_credits
+
+
+class TestCompiledScale:
+    """Tests for compiled grade scales and GPA calculation."""
+
+    def test_compile_is_cached_and_interns_letters(self):
+        """Test that compiled scales are cached per system and unknown names use the default."""
+        compiled = GPASystem.compile("4.0 Çift Harf")
+        assert GPASystem.compile("4.0 Çift Harf") is compiled
+        assert compiled.letters[0] is GPASystem.compile("4.0 Çift Harf").letters[0]
+        assert list(compiled.letters) == list(GPASystem.get_system("4.0 Çift Harf")['scale'])
+        # Unknown systems use the default
+        assert GPASystem.compile("Yok Böyle Sistem") is compiled
+
+    @pytest.mark.parametrize("system_name", list(GPASystem.SYSTEMS))
+    def test_calculate_gpa_matches_reference(self, system_name):
+        """Test that the compiled GPA matches the per-grade dictionary loop."""
+        letters = GPASystem.get_grade_options(system_name)
+        grades = [(letter, credits) for letter, credits in zip(letters * 3, [2, 3, 4, 5, 6] * 10)]
+        grades.append(("BİLİNMEYEN", 4))
+        assert GPASystem.calculate_gpa(grades, system_name) == pytest.approx(reference_gpa(grades, system_name))
+
+    def test_calculate_gpa_empty_and_zero_credits(self):
+        """Test that no grades or zero credits give a GPA of 0."""
+        assert GPASystem.calculate_gpa([], "4.0 Çift Harf") == 0.0
+        assert GPASystem.calculate_gpa([("AA", 0)], "4.0 Çift Harf") == 0.0
+
+    def test_grade_to_point_and_validate(self):
+        """Test letter lookups and validation within one system."""
+        assert GPASystem.grade_to_point("A-", "4.0 Artı/Eksi") == 3.7
+        assert GPASystem.grade_to_point("ZZ", "4.0 Artı/Eksi") == 0.0
+        assert GPASystem.validate_grade("A-", "4.0 Artı/Eksi")
+        assert not GPASystem.validate_grade("A-", "4.0 Tek Harf")
+
+
+class TestConversion:
+    """Tests for converting letters between grading systems."""
+
+    def test_convert_grades_between_systems(self):
+        """Test that letters map to the highest target letter not above their point."""
+        assert GPASystem.convert_grades(["A+", "A", "A-", "B+", "F"], "4.0 Artı/Eksi", "4.0 Tek Harf") == \
+            ["A", "A", "B", "B", "F"]
+        # 5.0 scale points are scaled to 4.0 before mapping
+        assert GPASystem.convert_grades(["5", "4", "3", "2"], "5.0 Sistem", "4.0 Çift Harf") == \
+            ["AA", "BB", "CC", "DC"]
+
+    def test_convert_grades_keeps_order_and_marks_unknown(self):
+        """Test that unknown letters become None in place."""
+        assert GPASystem.convert_grades(["AA", "ZZ", "FF"], "4.0 Çift Harf", "4.0 Tek Harf") == ["A", None, "F"]
+        assert GPASystem.convert_grades([], "4.0 Çift Harf", "4.0 Tek Harf") == []
+
+    def test_conversion_table_is_cached_per_pair(self):
+        """Test that each ordered system pair has its own cached table."""
+        table = GPASystem.conversion_table("4.0 Artı/Eksi", "4.0 Tek Harf")
+        assert GPASystem.conversion_table("4.0 Artı/Eksi", "4.0 Tek Harf") is table
+        assert GPASystem.conversion_table("4.0 Tek Harf", "4.0 Artı/Eksi") is not table
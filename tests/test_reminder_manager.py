@@ -0,0 +1,106 @@
+"""
+Tests for ReminderManager and the incremental ReminderEngine.
+"""
+from datetime import datetime, timedelta
+from utils.assignment_manager import AssignmentManager
+from utils.reminder_manager import ReminderManager
+
+
+def add(title, hours, status='pending'):
+    """Add an assignment due in the given number of hours."""
+    return AssignmentManager.add_assignment({
+        'title': title,
+        'due_date': (datetime.now() + timedelta(hours=hours)).isoformat(),
+        'type': 'assignment',
+        'status': status
+    })
+
+
+class TestReminderQueries:
+    """Tests for reminder query results."""
+
+    def test_window_order_and_scores(self, empty_storage):
+        """Test reminders are ordered by urgency then due date."""
+        overdue = add('Gecikmiş', -30)
+        today = add('Bugün', 5)
+        week = add('Hafta', 24 * 5 + 2)
+        add('Uzak', 24 * 30)
+        add('Bitmiş', 2, status='completed')
+
+        reminders = ReminderManager.get_reminders(days_ahead=7)
+        assert [r['id'] for r in reminders] == [overdue, today, week]
+        assert [r['urgency_score'] for r in reminders] == [5, 4, 1]
+        assert reminders[1]['hours_remaining'] == 4
+
+    def test_counts_match_reminders(self, empty_storage):
+        """Test bucket counts agree with a full recomputation."""
+        for hours in [-50, -1, 2, 20, 30, 60, 90, 120, 150, 200, 400]:
+            add(f'Ödev {hours}', hours)
+
+        reminders = ReminderManager.get_reminders(days_ahead=7)
+        expected = {
+            'urgent': sum(1 for r in reminders if r['urgency_score'] >= 4),
+            'soon': sum(1 for r in reminders if 2 <= r['urgency_score'] < 4),
+            'later': sum(1 for r in reminders if r['urgency_score'] < 2),
+            'total': len(reminders)
+        }
+        assert ReminderManager.get_reminder_count() == expected
+        assert expected == {'urgent': 4, 'soon': 3, 'later': 2, 'total': 9}
+
+    def test_reminder_by_id(self, empty_storage):
+        """Test direct lookup by assignment ID."""
+        near = add('Yakın', 10)
+        far = add('Çok Uzak', 24 * 400)
+        done = add('Bitmiş', 10, status='completed')
+
+        assert ReminderManager.get_reminder_by_id(near)['title'] == 'Yakın'
+        assert ReminderManager.get_reminder_by_id(far) is None
+        assert ReminderManager.get_reminder_by_id(done) is None
+        assert ReminderManager.get_reminder_by_id(9999) is None
+
+
+class TestReminderEngineCaching:
+    """Tests that the engine is reused until data or time changes."""
+
+    def test_engine_reused_without_changes(self, empty_storage):
+        """Test that repeated queries reuse the same engine and reminders."""
+        assignment_id = add('Ödev', 10)
+        first = ReminderManager.get_reminder_by_id(assignment_id)
+        engine = ReminderManager.get_engine()
+
+        ReminderManager.get_reminder_count()
+        assert ReminderManager.get_engine() is engine
+        assert ReminderManager.get_reminder_by_id(assignment_id) is first
+
+    def test_engine_rebuilt_on_change(self, empty_storage):
+        """Test that assignment mutations are reflected immediately."""
+        assignment_id = add('Ödev', 10)
+        engine = ReminderManager.get_engine()
+        assert ReminderManager.get_reminder_count()['urgent'] == 1
+
+        AssignmentManager.update_assignment(assignment_id, {'status': 'completed'})
+        assert ReminderManager.get_engine() is not engine
+        assert ReminderManager.get_reminder_count()['urgent'] == 0
+        assert ReminderManager.get_reminders() == []
+
+    def test_reminder_refreshed_after_hour_boundary(self, empty_storage):
+        """Test cached reminders are rebuilt once their hour boundary passes."""
+        assignment_id = add('Ödev', 10.5)
+        engine = ReminderManager.get_engine()
+        now = datetime.now()
+
+        first = engine.get_reminder(assignment_id, now)
+        assert engine.get_reminder(assignment_id, now + timedelta(minutes=10)) is first
+
+        later = engine.get_reminder(assignment_id, now + timedelta(hours=1))
+        assert later is not first
+        assert later['hours_remaining'] == first['hours_remaining'] - 1
+
+    def test_counts_refreshed_after_bucket_boundary(self, empty_storage):
+        """Test counts change when an assignment crosses into a new bucket."""
+        add('Ödev', 30)
+        engine = ReminderManager.get_engine()
+        now = datetime.now()
+
+        assert engine.get_counts(now)['urgent'] == 0
+        assert engine.get_counts(now + timedelta(hours=7))['urgent'] == 1
@@ -0,0 +1,165 @@
+"""
+Tests for ScheduleIndex, WeekOccupancy and CourseManager conflict detection.
+"""
+import random
+from utils.schedule_index import ScheduleIndex
+from utils.week_mask import time_to_minutes, meeting_mask
+from utils.course_manager import CourseManager
+from utils.storage_manager import StorageManager
+
+
+def add(code, day, start, end):
+    """Add a course in the given slot."""
+    return CourseManager.add_course({
+        'course_name': f'Ders {code}', 'course_code': code, 'day': day, 'start_time': start, 'end_time': end
+    })
+
+
+def format_minutes(minutes):
+    """Format minutes after midnight as HH:MM."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class TestScheduleIndex:
+    """Tests for the interval index itself."""
+
+    def test_matches_linear_scan(self):
+        """Test that indexed overlap queries agree with a brute-force scan."""
+        rng = random.Random(7)
+        courses = {}
+        for course_id in range(1, 200):
+            start = rng.randrange(480, 1200)
+            courses[course_id] = {
+                'id': course_id,
+                'day': rng.choice(['Monday', 'Tuesday']),
+                'start_time': format_minutes(start),
+                'end_time': format_minutes(start + rng.choice([30, 50, 110, 180]))
+            }
+        index = ScheduleIndex(courses)
+
+        for _ in range(200):
+            day = rng.choice(['Monday', 'Tuesday'])
+            start = rng.randrange(420, 1260)
+            end = start + rng.randrange(1, 240)
+            expected = sorted(
+                (time_to_minutes(c['start_time']), time_to_minutes(c['end_time']), c['id']) for c in courses.values()
+                if c['day'] == day
+                and start < time_to_minutes(c['end_time']) and end > time_to_minutes(c['start_time'])
+            )
+            assert index.overlapping(day, start, end) == [course_id for _, _, course_id in expected]
+
+    def test_touching_slots_do_not_overlap(self):
+        """Test that back-to-back courses are not conflicts."""
+        index = ScheduleIndex({1: {'id': 1, 'day': 'Monday', 'start_time': '09:00', 'end_time': '10:00'}})
+        assert index.overlapping('Monday', 600, 660) == []
+        assert index.overlapping('Monday', 480, 540) == []
+        assert index.overlapping('Monday', 599, 660) == [1]
+
+    def test_remove_shrinks_max_duration(self):
+        """Test that removing the longest course narrows later searches."""
+        index = ScheduleIndex({
+            1: {'id': 1, 'day': 'Monday', 'start_time': '08:00', 'end_time': '12:00'},
+            2: {'id': 2, 'day': 'Monday', 'start_time': '13:00', 'end_time': '14:00'}
+        })
+        index.remove(1)
+        assert index.max_duration['Monday'] == 60
+        assert index.overlapping('Monday', 600, 840) == [2]
+
+    def test_invalid_times_skipped(self):
+        """Test that records with malformed times are not indexed."""
+        index = ScheduleIndex({1: {'id': 1, 'day': 'Monday', 'start_time': 'sabah', 'end_time': '10:00'}})
+        assert index.entries == {}
+
+
+class TestCourseConflicts:
+    """Tests for CourseManager conflict queries."""
+
+    def test_reports_all_conflicts(self, empty_storage):
+        """Test that every overlapping course is returned, ordered by start."""
+        first = add('FIZ101', 'Monday', '09:00', '10:30')
+        second = add('KIM101', 'Monday', '10:00', '11:00')
+        add('TAR101', 'Monday', '11:00', '12:00')
+
+        conflicts = CourseManager.find_conflicts('Monday', '10:15', '11:00')
+        assert [course['id'] for course in conflicts] == [first, second]
+        assert CourseManager.check_time_conflict('Monday', '10:15', '11:00') == (True, conflicts[0])
+
+    def test_exclude_and_updates(self, empty_storage):
+        """Test that edits are reflected and the edited course is excluded."""
+        course_id = add('FIZ101', 'Monday', '09:00', '10:00')
+        assert CourseManager.check_time_conflict('Monday', '09:30', '10:30', exclude_course_id=course_id) == (False, None)
+
+        CourseManager.update_course(course_id, {'start_time': '14:00', 'end_time': '15:00'})
+        assert CourseManager.find_conflicts('Monday', '09:30', '10:30') == []
+        assert len(CourseManager.find_conflicts('Monday', '14:30', '15:30')) == 1
+
+        CourseManager.delete_course(course_id)
+        assert CourseManager.find_conflicts('Monday', '14:30', '15:30') == []
+
+    def test_index_rebuilt_after_import(self, empty_storage):
+        """Test that importing a backup replaces the index."""
+        add('FIZ101', 'Friday', '09:00', '10:00')
+        exported = StorageManager.export_data()
+        StorageManager.clear_all_data()
+        assert CourseManager.find_conflicts('Friday', '09:00', '10:00') == []
+
+        StorageManager.import_data(exported)
+        assert len(CourseManager.find_conflicts('Friday', '09:00', '10:00')) == 1
+
+    def test_batch_check(self, empty_storage):
+        """Test that a timetable is checked against existing courses and itself."""
+        add('FIZ101', 'Monday', '09:00', '10:00')
+        moved = add('KIM101', 'Monday', '10:30', '11:30')
+        timetable = [
+            {'course_code': 'A', 'day': 'Monday', 'start_time': '09:30', 'end_time': '10:30'},
+            {'course_code': 'B', 'day': 'Monday', 'start_time': '10:15', 'end_time': '11:00'},
+            {'course_code': 'C', 'day': 'Tuesday', 'start_time': '10:15', 'end_time': '11:00'},
+            {'id': moved, 'course_code': 'KIM101', 'day': 'Monday', 'start_time': '12:00', 'end_time': '13:00'}
+        ]
+
+        conflicts = CourseManager.check_conflicts_batch(timetable)
+        assert [(position, course['course_code']) for position, course in conflicts] == [
+            (0, 'FIZ101'), (1, 'A')
+        ]
+
+
+class TestWeekOccupancy:
+    """Tests for the minute bitset kept alongside the schedule index."""
+
+    def test_totals_and_busiest_day(self, empty_storage):
+        """Test that overlaps count once and the busiest day is by minutes."""
+        add('FIZ101', 'Monday', '09:00', '10:00')
+        add('KIM101', 'Monday', '09:30', '10:30')
+        add('TAR101', 'Tuesday', '13:00', '16:00')
+
+        occupancy = CourseManager.get_occupancy()
+        assert occupancy.total_minutes('Monday') == 90
+        assert occupancy.total_minutes() == 270
+        assert occupancy.busiest_day() == 'Tuesday'
+
+    def test_free_slots_follow_updates(self, empty_storage):
+        """Test that free ranges reflect edits and deletions."""
+        first = add('FIZ101', 'Monday', '09:00', '10:00')
+        add('KIM101', 'Monday', '11:00', '12:00')
+        occupancy = CourseManager.get_occupancy()
+
+        assert occupancy.free_slots('Monday', start=480, end=780) == [(480, 540), (600, 660), (720, 780)]
+        assert occupancy.free_slots('Monday', min_minutes=61, start=480, end=780) == []
+
+        CourseManager.update_course(first, {'start_time': '10:00', 'end_time': '11:00'})
+        assert not occupancy.is_free('Monday', 600, 630)
+        assert occupancy.free_slots('Monday', start=480, end=780) == [(480, 600), (720, 780)]
+
+        CourseManager.delete_course(first)
+        assert occupancy.total_minutes() == 60
+        assert occupancy.is_free('Monday', 540, 660)
+
+    def test_week_mask_matches_courses(self, empty_storage):
+        """Test that the combined mask equals the union of course masks."""
+        add('FIZ101', 'Friday', '08:30', '10:20')
+        add('KIM101', 'Sunday', '23:00', '23:59')
+
+        expected = 0
+        for course in CourseManager.get_all_courses():
+            expected |= meeting_mask(course)
+        assert CourseManager.get_occupancy().week_mask() == expected
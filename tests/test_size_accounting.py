@@ -0,0 +1,68 @@
+"""
+Tests for incremental storage size accounting.
+"""
+import sys
+from utils.size_accounting import SizeLedger, deep_sizeof
+from utils.storage_manager import StorageManager
+from utils.course_manager import CourseManager
+from utils.grade_manager import GradeManager
+
+
+def add_grade(name):
+    """Add a grade for the given course name."""
+    return GradeManager.add_grade({'course_name': name, 'grade': 3.0, 'credits': 3, 'semester': 'Fall', 'year': 2024})
+
+
+class TestDeepSizeof:
+    """Tests for recursive size measurement."""
+
+    def test_counts_nested_values(self):
+        """Test that contained values are included."""
+        text = 'x' * 1000
+        assert deep_sizeof({'a': [text]}) > sys.getsizeof(text)
+
+    def test_shared_objects_counted_once(self):
+        """Test that the same object reached twice is not double counted."""
+        text = 'y' * 1000
+        pair = [text, text]
+        assert deep_sizeof(pair) == sys.getsizeof(pair) + sys.getsizeof(text)
+
+
+class TestSizeLedger:
+    """Tests for the running per-entity totals."""
+
+    def test_matches_full_measurement(self, empty_storage):
+        """Test that incremental updates equal a full re-measurement."""
+        ids = [add_grade(f'Ders {i}') for i in range(20)]
+        GradeManager.update_grade(ids[3], {'course_name': 'Çok uzun bir ders adı ' * 20})
+        GradeManager.delete_grade(ids[7])
+
+        ledger = StorageManager.get_size_ledger('grades')
+        assert ledger.total == SizeLedger(StorageManager.get_collection('grades')).total
+
+    def test_storage_info_uses_ledgers(self, empty_storage):
+        """Test that storage info reports per-entity byte counts."""
+        add_grade('Fizik')
+        CourseManager.add_course({'course_name': 'Kimya', 'course_code': 'CHE101', 'day': 'Monday',
+                                  'start_time': '09:00', 'end_time': '10:00'})
+
+        info = StorageManager.get_storage_info()
+        assert info['entity_bytes']['grades'] > 0
+        assert info['entity_bytes']['courses'] > 0
+        assert info['entity_bytes']['reminders'] == 0
+        assert info['size_bytes'] >= sum(info['entity_bytes'].values())
+
+    def test_deep_refresh_picks_up_untracked_changes(self, empty_storage):
+        """Test that deep sampling resynchronizes after in-place edits."""
+        grade_id = add_grade('Tarih')
+        before = StorageManager.get_storage_info()['entity_bytes']['grades']
+
+        StorageManager.get_collection('grades')[grade_id]['notes'] = 'n' * 5000
+        assert StorageManager.get_storage_info()['entity_bytes']['grades'] == before
+        assert StorageManager.get_storage_info(deep=True)['entity_bytes']['grades'] > before + 5000
+
+    def test_rebuilt_after_clear(self, empty_storage):
+        """Test that a replaced collection gets a fresh ledger."""
+        add_grade('Biyoloji')
+        StorageManager.clear_all_data()
+        assert StorageManager.get_storage_info()['entity_bytes']['grades'] == 0
@@ -0,0 +1,161 @@
+"""
+Tests for pluggable storage backends.
+Tests SQLite persistence and StorageManager write-through behavior.
+"""
+import sqlite3
+import pytest
+from datetime import datetime, timedelta
+from utils.storage_backend import SQLiteBackend, MemoryBackend, create_backend
+from utils.storage_manager import StorageManager
+from utils.course_manager import CourseManager
+from utils.assignment_manager import AssignmentManager
+from utils.grade_manager import GradeManager
+from utils.user_manager import UserManager
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    """Use a temporary SQLite backend for the duration of a test."""
+    db_path = str(tmp_path / "dersly.db")
+    backend = SQLiteBackend(db_path)
+    StorageManager.set_backend(backend)
+    yield db_path
+    backend.close()
+    StorageManager.set_backend(MemoryBackend())
+
+
+def reopen(db_path):
+    """Simulate a new session/process reading the same database."""
+    backend = SQLiteBackend(db_path)
+    StorageManager.set_backend(backend)
+    return backend
+
+
+class TestSQLiteBackend:
+    """Tests for the SQLite backend itself."""
+
+    def test_wal_mode_enabled(self, tmp_path):
+        """Test that the database uses WAL journaling."""
+        backend = SQLiteBackend(str(tmp_path / "wal.db"))
+        mode = backend._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == 'wal'
+        backend.close()
+
+    def test_record_roundtrip(self, tmp_path):
+        """Test saving, loading and deleting records."""
+        backend = SQLiteBackend(str(tmp_path / "rt.db"))
+        backend.save_record('courses', {'id': 1, 'course_name': 'Fizik', 'day': 'Monday', 'start_time': '09:00'})
+        backend.save_record('courses', {'id': 2, 'course_name': 'Kimya', 'day': 'Friday', 'start_time': '10:00'})
+
+        assert set(backend.load_collection('courses')) == {1, 2}
+
+        backend.delete_record('courses', 1)
+        assert list(backend.load_collection('courses')) == [2]
+        backend.close()
+
+    def test_databases_with_column_schema_still_open(self, tmp_path):
+        """Test that files created with the former indexed columns remain writable."""
+        db_path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE courses (id INTEGER PRIMARY KEY, day TEXT, start_time TEXT, data TEXT NOT NULL)")
+        conn.execute("""INSERT INTO courses VALUES (1, 'Monday', '09:00', '{"id": 1, "day": "Monday"}')""")
+        conn.commit()
+        conn.close()
+
+        backend = SQLiteBackend(db_path)
+        backend.save_record('courses', {'id': 2, 'day': 'Friday'})
+        assert [c['day'] for c in backend.load_collection('courses').values()] == ['Monday', 'Friday']
+        backend.close()
+
+    def test_create_backend(self, tmp_path):
+        """Test backend selection by name."""
+        assert isinstance(create_backend('memory'), MemoryBackend)
+        assert isinstance(create_backend(None), MemoryBackend)
+        backend = create_backend('sqlite', str(tmp_path / "c.db"))
+        assert isinstance(backend, SQLiteBackend)
+        backend.close()
+
+
+class TestStorageManagerPersistence:
+    """Tests that manager writes survive a new session."""
+
+    def test_manager_data_persists(self, sqlite_storage):
+        """Test that courses, assignments, grades and profile are persisted."""
+        course_id = CourseManager.add_course({
+            'course_name': 'Veri Yapıları',
+            'course_code': 'CS201',
+            'day': 'Monday',
+            'start_time': '09:00',
+            'end_time': '10:30'
+        })
+        assignment_id = AssignmentManager.add_assignment({
+            'title': 'Ödev 1',
+            'due_date': (datetime.now() + timedelta(days=3)).isoformat(),
+            'type': 'assignment'
+        })
+        GradeManager.add_grade({
+            'course_name': 'Fizik', 'grade': 3.5, 'credits': 4, 'semester': 'Fall', 'year': 2024
+        })
+        UserManager.create_profile(name='Test User', email='test@university.edu')
+        AssignmentManager.update_assignment(assignment_id, {'status': 'completed'})
+
+        backend = reopen(sqlite_storage)
+
+        assert CourseManager.get_course(course_id)['course_code'] == 'CS201'
+        assert AssignmentManager.get_assignment(assignment_id)['status'] == 'completed'
+        assert GradeManager.calculate_gpa() == 3.5
+        assert UserManager.get_profile()['name'] == 'Test User'
+
+        # Counters continue from the persisted value
+        assert CourseManager.add_course({
+            'course_name': 'Algoritmalar',
+            'course_code': 'CS301',
+            'day': 'Tuesday',
+            'start_time': '09:00',
+            'end_time': '10:30'
+        }) == course_id + 1
+        backend.close()
+
+    def test_delete_and_clear_persist(self, sqlite_storage):
+        """Test that deletions and clearing reach the backend."""
+        grade_id = GradeManager.add_grade({
+            'course_name': 'Fizik', 'grade': 3.0, 'credits': 3, 'semester': 'Fall', 'year': 2024
+        })
+        assert GradeManager.delete_grade(grade_id) is True
+        CourseManager.add_course({
+            'course_name': 'Fizik',
+            'course_code': 'PHY101',
+            'day': 'Monday',
+            'start_time': '09:00',
+            'end_time': '10:30'
+        })
+
+        backend = reopen(sqlite_storage)
+        assert GradeManager.get_grade_count() == 0
+        assert CourseManager.get_course_count() == 1
+
+        StorageManager.clear_all_data()
+        backend.close()
+
+        backend = reopen(sqlite_storage)
+        assert StorageManager.has_data() is False
+        backend.close()
+
+    def test_import_replaces_backend_data(self, sqlite_storage):
+        """Test that imported data is persisted in one operation."""
+        success, _ = StorageManager.import_data({
+            'version': StorageManager.DATA_VERSION,
+            'exported_at': datetime.now().isoformat(),
+            'user_profile': None,
+            'courses': [{'id': 7, 'course_name': 'Fizik', 'day': 'Monday', 'start_time': '09:00', 'end_time': '10:00'}],
+            'assignments': [],
+            'grades': [],
+            'reminders': [],
+            'next_course_id': 8
+        })
+        assert success is True
+
+        backend = reopen(sqlite_storage)
+        assert list(StorageManager.get_collection('courses')) == [7]
+        assert StorageManager.next_id('courses') == 8
+        backend.close()
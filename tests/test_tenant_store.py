@@ -0,0 +1,306 @@
+"""
+Tests for the process-level tenant store and per-user data isolation.
+"""
+import os
+import threading
+import time
+import pytest
+import streamlit as st
+from utils.tenant_store import TenantStore
+from utils.storage_manager import StorageManager
+from utils.grade_manager import GradeManager
+from utils.user_manager import UserManager
+
+
+@pytest.fixture
+def tenant_store(tmp_path):
+    """Use a small tenant store in a temporary directory."""
+    previous_store = StorageManager._tenants
+    previous_handle = st.session_state.get(StorageManager.TENANT_HANDLE_KEY)
+
+    store = TenantStore(StorageManager._snapshot, data_dir=str(tmp_path), capacity=1, min_idle_seconds=0)
+    StorageManager.set_tenant_store(store)
+    yield store
+
+    StorageManager.set_tenant_store(previous_store)
+    if previous_handle is not None:
+        st.session_state[StorageManager.TENANT_HANDLE_KEY] = previous_handle
+
+
+def new_session():
+    """Simulate a new browser session without a tenant handle."""
+    st.session_state.pop(StorageManager.TENANT_HANDLE_KEY, None)
+
+
+def switch_session(handle):
+    """Simulate the browser session that owns a tenant handle."""
+    st.session_state[StorageManager.TENANT_HANDLE_KEY] = handle
+
+
+def add_grade(name):
+    """Add a grade for the given course name."""
+    return GradeManager.add_grade({'course_name': name, 'grade': 3.0, 'credits': 3, 'semester': 'Fall', 'year': 2024})
+
+
+class TestTenantIsolation:
+    """Tests that users only see their own data."""
+
+    def test_sessions_isolated(self, tenant_store):
+        """Test that two anonymous sessions have separate data."""
+        new_session()
+        add_grade('Fizik')
+        first = StorageManager.get_tenant_handle()
+
+        new_session()
+        assert GradeManager.get_grade_count() == 0
+        add_grade('Kimya')
+        add_grade('Tarih')
+
+        switch_session(first)
+        assert GradeManager.get_grade_count() == 1
+
+    def test_session_state_holds_only_handle(self, tenant_store):
+        """Test that data is kept in the tenant, not in session state."""
+        new_session()
+        add_grade('Fizik')
+
+        assert 'grades' not in st.session_state
+        assert 'grades' in StorageManager.state()
+
+
+class TestTenantHandle:
+    """Tests that tenants are keyed on a per-session secret only."""
+
+    def test_handles_are_random_and_not_in_url(self, tenant_store):
+        """Test that new sessions get distinct unguessable handles kept out of the URL."""
+        new_session()
+        first = StorageManager.get_tenant_handle()
+        new_session()
+        second = StorageManager.get_tenant_handle()
+
+        assert first != second
+        assert len(first) >= 24
+        assert TenantStore.is_valid_key(StorageManager.get_tenant_key())
+        assert 'u' not in st.query_params
+
+    def test_profile_keeps_session_data(self, tenant_store):
+        """Test that creating a profile keeps the session on its own tenant."""
+        new_session()
+        add_grade('Fizik')
+        handle = StorageManager.get_tenant_handle()
+        UserManager.create_profile(name='Ayşe', email='Ayse@Universite.edu.tr ')
+
+        assert StorageManager.get_tenant_handle() == handle
+        assert GradeManager.get_grade_count() == 1
+
+    def test_same_email_does_not_reach_other_tenant(self, tenant_store):
+        """Test that typing another user's email does not expose or overwrite their data."""
+        new_session()
+        UserManager.create_profile(name='Ayşe', email='ayse@uni.edu.tr')
+        add_grade('Fizik')
+        victim = StorageManager.get_tenant_handle()
+
+        new_session()
+        UserManager.create_profile(name='Mallory', email='AYSE@uni.edu.tr ')
+        assert StorageManager.get_tenant_handle() != victim
+        assert GradeManager.get_grade_count() == 0
+
+        switch_session(victim)
+        assert UserManager.get_profile()['name'] == 'Ayşe'
+        assert GradeManager.get_grade_count() == 1
+
+    def test_url_parameter_ignored(self, tenant_store):
+        """Test that a handle in the URL does not attach a new session to a tenant."""
+        new_session()
+        add_grade('Fizik')
+        handle = StorageManager.get_tenant_handle()
+
+        new_session()
+        st.query_params['u'] = handle
+        try:
+            assert StorageManager.get_tenant_handle() != handle
+            assert GradeManager.get_grade_count() == 0
+        finally:
+            st.query_params.clear()
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    """Use a SQLite tenant store in a temporary directory, restartable with reopen()."""
+    previous_store = StorageManager._tenants
+    previous_handle = st.session_state.get(StorageManager.TENANT_HANDLE_KEY)
+
+    def reopen():
+        if StorageManager._tenants is not previous_store:
+            StorageManager._tenants.evict_all()
+        store = TenantStore(StorageManager._snapshot, backend_name='sqlite', data_dir=str(tmp_path),
+                            flush_interval=3600)
+        StorageManager.set_tenant_store(store)
+        return store
+
+    reopen()
+    yield reopen
+
+    StorageManager._tenants.evict_all()
+    StorageManager.set_tenant_store(previous_store)
+    if previous_handle is not None:
+        st.session_state[StorageManager.TENANT_HANDLE_KEY] = previous_handle
+
+
+class TestRecoveryCode:
+    """Tests for returning to a tenant from a new session with its recovery code."""
+
+    def test_data_survives_new_session_for_same_user(self, sqlite_store):
+        """Test that a restarted process and a new session reach the data with the code."""
+        new_session()
+        UserManager.create_profile(name='Ayşe', email='ayse@uni.edu.tr')
+        add_grade('Fizik')
+        code = StorageManager.get_tenant_handle()
+
+        sqlite_store()
+        new_session()
+        assert GradeManager.get_grade_count() == 0
+
+        success, message = StorageManager.restore_session(code)
+        assert success, message
+        assert StorageManager.get_tenant_handle() == code
+        assert GradeManager.get_grade_count() == 1
+        assert UserManager.get_profile()['name'] == 'Ayşe'
+
+    def test_unknown_and_malformed_codes_rejected(self, tenant_store):
+        """Test that only codes with existing data attach the session."""
+        new_session()
+        own = StorageManager.get_tenant_handle()
+
+        for code in ['x' * 24, '../../etc/passwd', '', 'ayse@uni.edu.tr']:
+            success, message = StorageManager.restore_session(code)
+            assert not success
+            assert message.startswith('❌')
+        assert StorageManager.get_tenant_handle() == own
+
+    def test_files_do_not_reveal_codes(self, sqlite_store, tmp_path):
+        """Test that tenant files are named by the code's hash, not the code."""
+        new_session()
+        add_grade('Fizik')
+        code = StorageManager.get_tenant_handle()
+
+        names = [path.name for path in tmp_path.iterdir()]
+        assert f"{StorageManager.tenant_key_for(code)}.db" in names
+        assert not any(code in name for name in names)
+
+
+class TestGarbageCollection:
+    """Tests that unreachable tenant files do not accumulate."""
+
+    def test_empty_sqlite_tenants_removed_on_eviction(self, sqlite_store, tmp_path):
+        """Test that sessions that never stored data leave no files behind."""
+        store = sqlite_store()
+        new_session()
+        StorageManager.initialize_storage()
+        assert list(tmp_path.iterdir())
+
+        store.evict_all()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_expired_files_collected(self, sqlite_store, tmp_path):
+        """Test that files not opened within the retention period are deleted."""
+        store = sqlite_store()
+        new_session()
+        add_grade('Eski')
+        old_key = StorageManager.get_tenant_key()
+        new_session()
+        add_grade('Yeni')
+        store.evict(old_key)
+
+        store.retention_seconds = 3600
+        stale = time.time() - 7200
+        for path in tmp_path.iterdir():
+            if path.name.startswith(old_key):
+                os.utime(path, (stale, stale))
+
+        assert store.collect_garbage() == 1
+        assert not any(path.name.startswith(old_key) for path in tmp_path.iterdir())
+        assert GradeManager.get_grade_count() == 1
+
+
+class TestEviction:
+    """Tests for LRU eviction to disk."""
+
+    def test_idle_tenant_spilled_and_restored(self, tenant_store):
+        """Test that an evicted in-memory tenant is reloaded from disk."""
+        new_session()
+        grade_id = add_grade('Fizik')
+        first = StorageManager.get_tenant_handle()
+
+        new_session()
+        add_grade('Kimya')
+        assert tenant_store.resident_keys() == [StorageManager.get_tenant_key()]
+
+        switch_session(first)
+        assert GradeManager.get_grade(grade_id)['course_name'] == 'Fizik'
+        assert add_grade('Tarih') == grade_id + 1
+
+    def test_empty_tenants_not_written(self, tenant_store, tmp_path):
+        """Test that tenants without data leave nothing on disk."""
+        new_session()
+        StorageManager.initialize_storage()
+        new_session()
+        StorageManager.initialize_storage()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_active_tenants_not_evicted(self, tenant_store):
+        """Test that recently used tenants stay resident over capacity."""
+        tenant_store.min_idle_seconds = 3600
+        new_session()
+        StorageManager.initialize_storage()
+        new_session()
+        StorageManager.initialize_storage()
+
+        assert len(tenant_store.resident_keys()) == 2
+
+    def test_stale_tenant_reacquired_after_eviction(self, tmp_path):
+        """Test that a write after another session evicted the tenant reopens its backend."""
+        store = TenantStore(StorageManager._snapshot, backend_name='sqlite', data_dir=str(tmp_path),
+                            flush_interval=3600)
+        stale = store.acquire('stale')
+        stale.backend.set_value('user_profile', {'name': 'Ayşe'})
+        store.evict('stale')
+        assert stale.evicted
+
+        with store.locked('stale') as tenant:
+            assert tenant is not stale
+            tenant.backend.set_value('next_grade_id', 5)
+            assert tenant.backend.get_value('user_profile') == {'name': 'Ayşe'}
+        store.evict_all()
+
+    def test_busy_tenant_not_evicted_while_idle_eviction_runs(self, tenant_store):
+        """Test that capacity eviction skips a tenant another thread is writing to."""
+        new_session()
+        add_grade('Fizik')
+        busy = StorageManager.get_tenant()
+        locked, release = threading.Event(), threading.Event()
+
+        def writer():
+            with busy.lock:
+                locked.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        locked.wait(5)
+        try:
+            new_session()
+            add_grade('Kimya')
+            assert busy.key in tenant_store.resident_keys()
+            assert not busy.evicted
+        finally:
+            release.set()
+            thread.join()
+
+    def test_invalid_keys_rejected(self, tenant_store):
+        """Test that handles are restricted to a file-name safe alphabet."""
+        assert TenantStore.is_valid_key('abc_123-X')
+        assert not TenantStore.is_valid_key('../etc/passwd')
+        with pytest.raises(ValueError):
+            tenant_store.path_for('a/b')
@@ -0,0 +1,131 @@
+"""
+Tests for week masks and the timetable solver.
+"""
+import itertools
+import random
+import time
+from utils.week_mask import slot_mask, meeting_mask, day_profile, count_minutes
+from utils.timetable_solver import TimetableSolver, sections_from_slots, schedule_to_courses
+
+
+def section(name, *meetings):
+    """Build a section from (day, start, end) tuples."""
+    return {'section': name, 'meetings': [{'day': d, 'start_time': s, 'end_time': e} for d, s, e in meetings]}
+
+
+def random_requests(seed, courses=6, sections=5):
+    """Build course requests with random two-meeting sections."""
+    rng = random.Random(seed)
+    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+    requests = []
+    for number in range(courses):
+        options = []
+        for index in range(sections):
+            first, second = rng.sample(days, 2)
+            start = rng.choice(['08:30', '09:30', '10:30', '13:30', '14:30', '15:30'])
+            end = f"{int(start[:2]) + 1}:20"
+            options.append(section(str(index), (first, start, end), (second, start, end)))
+        requests.append({'course_code': f'D{number}', 'course_name': f'Ders {number}', 'sections': options})
+    return requests
+
+
+class TestWeekMask:
+    """Tests for minute bitsets."""
+
+    def test_slot_overlap(self):
+        """Test that overlapping slots share bits and touching ones do not."""
+        monday_nine = slot_mask('Monday', 540, 600)
+        assert monday_nine & slot_mask('Monday', 599, 660)
+        assert not monday_nine & slot_mask('Monday', 600, 660)
+        assert not monday_nine & slot_mask('Tuesday', 540, 600)
+
+    def test_day_profile(self):
+        """Test first/last minutes, busy time and gaps of a day."""
+        mask = meeting_mask({'day': 'Wednesday', 'start_time': '09:00', 'end_time': '10:00'}) | \
+            meeting_mask({'day': 'Wednesday', 'start_time': '11:00', 'end_time': '12:00'})
+        assert count_minutes(mask) == 120
+        assert day_profile(mask) == [{'day_number': 2, 'first': 540, 'last': 719, 'busy': 120, 'gap': 60}]
+
+
+class TestTimetableSolver:
+    """Tests for schedule search and ranking."""
+
+    def test_avoids_conflicts_and_fixed_courses(self):
+        """Test that chosen sections never overlap each other or taken courses."""
+        requests = [
+            {'course_code': 'FIZ101', 'course_name': 'Fizik', 'sections': [
+                section('1', ('Monday', '09:00', '10:30')),
+                section('2', ('Tuesday', '09:00', '10:30'))
+            ]},
+            {'course_code': 'KIM101', 'course_name': 'Kimya', 'sections': [
+                section('1', ('Monday', '10:00', '11:00'))
+            ]}
+        ]
+        fixed = [{'day': 'Tuesday', 'start_time': '10:00', 'end_time': '12:00'}]
+
+        results = TimetableSolver().solve(requests, fixed_courses=fixed)
+        assert len(results) == 0
+
+        results = TimetableSolver().solve(requests)
+        assert [choice['section'] for choice in results[0]['sections']] == ['2', '1']
+
+    def test_ranking_prefers_compact_days(self):
+        """Test that adjacent classes rank first and a long gap costs more than an extra day."""
+        requests = [
+            {'course_code': 'A', 'course_name': 'A', 'sections': [section('1', ('Monday', '10:00', '11:00'))]},
+            {'course_code': 'B', 'course_name': 'B', 'sections': [
+                section('uzak', ('Monday', '15:00', '16:00')),
+                section('bitisik', ('Monday', '11:00', '12:00')),
+                section('baska-gun', ('Friday', '11:00', '12:00'))
+            ]}
+        ]
+        results = TimetableSolver(limit=3).solve(requests)
+
+        assert [r['sections'][1]['section'] for r in results] == ['bitisik', 'baska-gun', 'uzak']
+        assert results[0]['gap_minutes'] == 0 and results[0]['days_on_campus'] == 1
+
+    def test_matches_brute_force(self):
+        """Test that pruning never loses the best schedules."""
+        requests = random_requests(seed=3)
+        solver = TimetableSolver(limit=3)
+        results = solver.solve(requests)
+
+        scores = []
+        for combination in itertools.product(*(r['sections'] for r in requests)):
+            masks = [0]
+            for chosen in combination:
+                bits = 0
+                for meeting in chosen['meetings']:
+                    bits |= meeting_mask(meeting)
+                masks.append(bits)
+            total = 0
+            if any(masks[i] & masks[j] for i in range(len(masks)) for j in range(i)):
+                continue
+            for bits in masks:
+                total |= bits
+            gaps, early, days = solver._measure(total)
+            scores.append(gaps + early + days * 120.0)
+
+        assert [r['score'] for r in results] == sorted(scores)[:3]
+        assert solver.nodes < 6 ** 5
+
+    def test_large_search_is_fast(self):
+        """Test that tens of thousands of combinations are solved in well under a second."""
+        requests = random_requests(seed=11, courses=6, sections=6)
+        solver = TimetableSolver()
+        started = time.perf_counter()
+        results = solver.solve(requests)
+        assert time.perf_counter() - started < 0.5
+        assert results and solver.nodes < 6 ** 6 // 4
+
+    def test_slot_candidates_and_course_records(self):
+        """Test building sections from common slots and exporting a result."""
+        sections = sections_from_slots(['Monday', 'Thursday'], duration=110)
+        assert sections and all(
+            meeting['day'] in ('Monday', 'Thursday') for s in sections for meeting in s['meetings']
+        )
+
+        requests = [{'course_code': 'CS201', 'course_name': 'Veri Yapıları', 'credits': 4, 'sections': sections}]
+        courses = schedule_to_courses(TimetableSolver().solve(requests)[0])
+        assert courses[0]['course_code'] == 'CS201' and courses[0]['credits'] == 4
+        assert courses[0]['start_time'] >= '09:00'
@@ -0,0 +1,64 @@
+"""
+Tests for converting transcripts between GPA systems.
+"""
+from utils.gpa_systems import GPASystem
+from utils.grade_manager import GradeManager
+from utils.transcript_converter import TranscriptConverter
+
+
+def grade(points, credits, name='Ders'):
+    """Build a grade entry with the given points and credits."""
+    return {'course_name': name, 'grade': points, 'credits': credits, 'semester': 'Fall', 'year': 2024}
+
+
+class TestConvertGrades:
+    """Tests for TranscriptConverter.convert_grades."""
+
+    def test_convert_grades_per_course_and_aggregate(self):
+        """Test per-course letters and points plus the aggregate GPAs."""
+        result = TranscriptConverter.convert_grades(
+            [grade(4.0, 3, 'Kalkülüs'), grade(3.3, 4, 'Fizik'), grade(0.0, 2, 'Kimya')],
+            "4.0 Artı/Eksi", "4.0 Çift Harf"
+        )
+        courses = result['courses']
+        assert [c['source_letter'] for c in courses] == ['A+', 'B+', 'F']
+        assert [c['target_letter'] for c in courses] == ['AA', 'BB', 'FF']
+        assert [c['target_point'] for c in courses] == [4.0, 3.0, 0.0]
+        assert courses[1]['course_name'] == 'Fizik'
+        assert result['grade_count'] == 3
+        assert result['total_credits'] == 9
+        assert result['source_gpa'] == round((12 + 13.2) / 9, 2)
+        assert result['target_gpa'] == round((12 + 12) / 9, 2)
+
+    def test_points_between_letters_snap_down(self):
+        """Test that a point between two letters maps to the lower one."""
+        result = TranscriptConverter.convert_grades([grade(3.4, 3)], "4.0 Çift Harf", "4.0 Çift Harf")
+        assert result['courses'][0]['source_letter'] == 'BB'
+        assert result['courses'][0]['target_letter'] == 'BB'
+
+    def test_matches_letter_conversion(self):
+        """Test that transcript conversion agrees with GPASystem.convert_grades."""
+        system = "5.0 Sistem"
+        letters = GPASystem.get_grade_options(system)
+        grades = [grade(GPASystem.grade_to_point(letter, system), 3) for letter in letters]
+        result = TranscriptConverter.convert_grades(grades, system, "4.0 Çift Harf")
+        assert [c['target_letter'] for c in result['courses']] == \
+            GPASystem.convert_grades(letters, system, "4.0 Çift Harf")
+
+    def test_empty_transcript(self):
+        """Test that an empty transcript converts to no courses and zero GPAs."""
+        result = TranscriptConverter.convert_grades([], "4.0 Çift Harf", "4.0 Tek Harf")
+        assert result['courses'] == []
+        assert result['source_gpa'] == result['target_gpa'] == 0.0
+
+
+class TestConvertTranscript:
+    """Tests for converting the stored transcript."""
+
+    def test_convert_transcript_reads_grade_manager(self, empty_storage):
+        """Test that the stored grades are converted with their IDs."""
+        GradeManager.add_grade(grade(3.7, 3, 'Algoritmalar'))
+        GradeManager.add_grade(grade(2.0, 2, 'Tarih'))
+        result = TranscriptConverter.convert_transcript("4.0 Artı/Eksi", "4.0 Tek Harf")
+        assert [c['target_letter'] for c in result['courses']] == ['B', 'C']
+        assert all(c['grade_id'] is not None for c in result['courses'])
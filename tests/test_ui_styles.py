@@ -0,0 +1,66 @@
+"""
+Tests for CSS minification and the cached CSS bundle.
+"""
+import re
+from utils import ui_styles
+from utils.ui_styles import minify_css, get_css_bundle, get_modern_css
+
+
+class TestMinifyCSS:
+    """Tests for minify_css."""
+
+    def test_comments_and_whitespace_removed(self):
+        """Test that comments, style tags and redundant whitespace are dropped."""
+        css = "<style>\n  /* başlık */\n  .a {\n    color: red;\n    margin: 0;\n  }\n</style>"
+        assert minify_css(css) == ".a{color: red;margin: 0}"
+
+    def test_selectors_kept(self):
+        """Test that combinators, pseudo-classes and attribute selectors survive."""
+        css = '.a > .b  .c:hover, [data-testid="stSidebar"] ~ p::before { color: red; }'
+        assert minify_css(css) == '.a > .b .c:hover,[data-testid="stSidebar"] ~ p::before{color: red}'
+
+    def test_strings_kept(self):
+        """Test that whitespace, commas and comment markers inside quotes are untouched."""
+        css = """.a { content: "x ,  y; } /* not a comment */"; font-family: 'Open  Sans', sans-serif; }"""
+        minified = minify_css(css)
+        assert '"x ,  y; } /* not a comment */"' in minified
+        assert "'Open  Sans',sans-serif" in minified
+
+    def test_calc_spacing_kept(self):
+        """Test that the spaces calc() requires around + and - are preserved."""
+        minified = minify_css(".a { width: calc(100% - 2 * 1rem); height: calc(1px + 50vh); }")
+        assert "calc(100% - 2 * 1rem)" in minified
+        assert "calc(1px + 50vh)" in minified
+
+    def test_modern_css_only_shrinks_whitespace(self):
+        """Test that minifying the app stylesheet keeps every non-whitespace character outside comments."""
+        source = re.sub(r'/\*.*?\*/', '', get_modern_css("light"), flags=re.DOTALL)
+        source = re.sub(r'</?style>|\s', '', source).replace(';}', '}')
+        assert re.sub(r'\s', '', minify_css(get_modern_css("light"))) == source
+
+
+class TestCSSBundle:
+    """Tests for get_css_bundle."""
+
+    def test_hash_tags_style_block(self):
+        """Test that the style block carries its content hash."""
+        block, content_hash = get_css_bundle("light")
+        assert block.startswith(f'<style data-dersly-css="{content_hash}">')
+        assert get_css_bundle("light") == (block, content_hash)
+
+    def test_hash_changes_with_content(self, monkeypatch):
+        """Test that different CSS yields a different hash and equal CSS the same one."""
+        build = get_css_bundle.__wrapped__
+
+        monkeypatch.setattr(ui_styles, 'get_modern_css', lambda theme: ".a { color: red; }")
+        _, red = build("light")
+        assert build("dark")[1] == red
+
+        monkeypatch.setattr(ui_styles, 'get_modern_css', lambda theme: ".a { color: blue; }")
+        _, blue = build("light")
+        assert blue != red
+
+    def test_themes_and_mobile_have_distinct_hashes(self):
+        """Test that each theme and the mobile variant get their own hash."""
+        hashes = {get_css_bundle(theme, mobile)[1] for theme in ("light", "dark") for mobile in (False, True)}
+        assert len(hashes) == 4
@@ -0,0 +1,141 @@
+"""
+Tests for version-keyed memoization of manager read methods.
+"""
+import pytest
+import streamlit as st
+from utils.storage_manager import StorageManager
+from utils.versioned_cache import versioned_cache, get_cache_stats
+from utils.tenant_store import TenantStore
+from utils.course_manager import CourseManager
+from utils.grade_manager import GradeManager
+
+
+@pytest.fixture(autouse=True)
+def clean_data():
+    """Start every test with empty data and empty caches."""
+    StorageManager.clear_all_data()
+    for method in [CourseManager.get_weekly_schedule, CourseManager.get_courses_by_day,
+                   GradeManager.calculate_gpa, GradeManager.get_semesters]:
+        method.cache_clear()
+    yield
+    StorageManager.clear_all_data()
+
+
+def add_course(day='Monday', start='09:00', end='10:00'):
+    """Add a course on the given day."""
+    return CourseManager.add_course({
+        'course_name': 'Fizik', 'course_code': 'FIZ101', 'day': day, 'start_time': start, 'end_time': end
+    })
+
+
+def add_grade(grade=3.0, semester='Fall'):
+    """Add a three-credit grade."""
+    return GradeManager.add_grade({'course_name': 'Fizik', 'grade': grade, 'credits': 3, 'semester': semester, 'year': 2024})
+
+
+class TestMemoization:
+    """Tests for cache hits and invalidation."""
+
+    def test_rerun_without_changes_hits(self):
+        """Test that repeated reads of unchanged data are not recomputed."""
+        add_course()
+        add_grade()
+        for _ in range(3):
+            CourseManager.get_weekly_schedule()
+            GradeManager.calculate_gpa()
+
+        assert CourseManager.get_weekly_schedule.cache_info()['misses'] == 1
+        assert CourseManager.get_weekly_schedule.cache_info()['hits'] == 2
+        assert GradeManager.calculate_gpa.cache_info()['misses'] == 1
+
+    def test_mutation_invalidates(self):
+        """Test that add, update and delete are reflected immediately."""
+        grade_id = add_grade(2.0)
+        assert GradeManager.calculate_gpa() == 2.0
+
+        GradeManager.update_grade(grade_id, {'grade': 4.0})
+        assert GradeManager.calculate_gpa() == 4.0
+
+        add_grade(2.0, semester='Spring')
+        assert GradeManager.calculate_gpa() == 3.0
+        assert set(GradeManager.get_semesters()) == {('Fall', 2024), ('Spring', 2024)}
+
+        GradeManager.delete_grade(grade_id)
+        assert GradeManager.get_semesters() == [('Spring', 2024)]
+
+    def test_unrelated_entity_keeps_cache(self):
+        """Test that grade changes do not invalidate course results."""
+        add_course()
+        CourseManager.get_courses_by_day('Monday')
+        add_grade()
+        CourseManager.get_courses_by_day('Monday')
+
+        assert CourseManager.get_courses_by_day.cache_info()['hits'] == 1
+
+    def test_arguments_are_part_of_key(self):
+        """Test that each day argument gets its own result."""
+        add_course('Monday')
+        add_course('Friday', '13:00', '14:00')
+
+        assert [c['day'] for c in CourseManager.get_courses_by_day('Monday')] == ['Monday']
+        assert [c['day'] for c in CourseManager.get_courses_by_day('Friday')] == ['Friday']
+
+    def test_import_invalidates(self):
+        """Test that importing a backup replaces cached results."""
+        add_grade(4.0)
+        exported = StorageManager.export_data()
+        StorageManager.clear_all_data()
+        assert GradeManager.calculate_gpa() == 0.0
+
+        StorageManager.import_data(exported)
+        assert GradeManager.calculate_gpa() == 4.0
+
+
+class TestBounds:
+    """Tests for size limits and statistics."""
+
+    def test_lru_bound(self):
+        """Test that the cache never holds more than maxsize results."""
+        calls = []
+
+        @versioned_cache('courses', maxsize=2)
+        def echo(value):
+            calls.append(value)
+            return value
+
+        for value in [1, 2, 3, 1]:
+            echo(value)
+
+        assert echo.cache_info()['size'] == 2
+        assert calls == [1, 2, 3, 1]
+
+    def test_stats_listed(self):
+        """Test that manager caches appear in the global statistics."""
+        names = {stats['name'] for stats in get_cache_stats()}
+        assert 'GradeManager.calculate_gpa' in names
+        assert 'CourseManager.get_weekly_schedule' in names
+
+
+class TestTenantIsolation:
+    """Tests that cached results never cross users."""
+
+    def test_users_do_not_share_results(self, tmp_path):
+        """Test that two users with different grades get their own GPA."""
+        previous_store = StorageManager._tenants
+        previous_handle = st.session_state.get(StorageManager.TENANT_HANDLE_KEY)
+        StorageManager.set_tenant_store(TenantStore(StorageManager._snapshot, data_dir=str(tmp_path)))
+        try:
+            st.session_state[StorageManager.TENANT_HANDLE_KEY] = 'birinci'
+            add_grade(4.0)
+            assert GradeManager.calculate_gpa() == 4.0
+
+            st.session_state[StorageManager.TENANT_HANDLE_KEY] = 'ikinci'
+            add_grade(1.0)
+            assert GradeManager.calculate_gpa() == 1.0
+
+            st.session_state[StorageManager.TENANT_HANDLE_KEY] = 'birinci'
+            assert GradeManager.calculate_gpa() == 4.0
+        finally:
+            StorageManager.set_tenant_store(previous_store)
+            if previous_handle is not None:
+                st.session_state[StorageManager.TENANT_HANDLE_KEY] = previous_handle
@@ -0,0 +1,232 @@
+"""
+Tests for the write-behind persistence queue.
+"""
+import threading
+import time
+import pytest
+import streamlit as st
+from datetime import datetime, timedelta
+from utils.storage_backend import SQLiteBackend
+from utils.tenant_store import TenantStore
+from utils import write_behind
+from utils.write_behind import WriteBehindBackend, _QUEUES
+from utils.storage_manager import StorageManager
+from utils.assignment_manager import AssignmentManager
+
+
+class CountingBackend(SQLiteBackend):
+    """SQLite backend that counts batch transactions and can fail once."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.transactions = 0
+        self.fail_next = False
+
+    def apply_batch(self, operations):
+        if self.fail_next:
+            self.fail_next = False
+            raise OSError("disk full")
+        self.transactions += 1
+        super().apply_batch(operations)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Write-behind queue with a long timer so flushes are explicit."""
+    backend = CountingBackend(str(tmp_path / "dersly.db"))
+    queue = WriteBehindBackend(backend, journal_path=str(tmp_path / "dersly.db.wbq"), flush_interval=3600)
+    yield queue
+    queue.close()
+
+
+def crash(queue):
+    """Simulate a process crash: drop the queue without flushing."""
+    with queue._lock:
+        queue._pending = {}
+        queue._closed = True
+    queue._scheduler.cancel(queue)
+    queue._journal.close()
+    _QUEUES.discard(queue)
+
+
+class TestBatching:
+    """Tests for queued, coalesced writes."""
+
+    def test_writes_applied_in_one_transaction(self, queue):
+        """Test that many writes become a single batch."""
+        for i in range(50):
+            queue.save_record('assignments', {'id': i, 'status': 'pending'})
+        for i in range(50):
+            queue.save_record('assignments', {'id': i, 'status': 'completed'})
+
+        assert queue.pending_count() == 50
+        assert queue.backend.transactions == 0
+
+        queue.flush()
+        assert queue.backend.transactions == 1
+        assert {r['status'] for r in queue.backend.load_collection('assignments').values()} == {'completed'}
+
+    def test_reads_see_queued_writes(self, queue):
+        """Test that reads flush pending writes first."""
+        queue.save_record('grades', {'id': 1, 'grade': 3.0})
+        queue.set_value('next_grade_id', 2)
+        queue.delete_record('grades', 1)
+
+        assert queue.load_collection('grades') == {}
+        assert queue.get_value('next_grade_id') == 2
+
+    def test_values_snapshotted(self, queue):
+        """Test that in-place changes after set_value are not persisted."""
+        metadata = {'last_export': None}
+        queue.set_value('metadata', metadata)
+        metadata['last_export'] = 'sonra'
+
+        assert queue.get_value('metadata') == {'last_export': None}
+
+    def test_size_threshold_wakes_worker(self, tmp_path):
+        """Test that a full batch is flushed without waiting for the timer."""
+        queue = WriteBehindBackend(CountingBackend(str(tmp_path / "t.db")), flush_interval=3600, max_batch=10)
+        for i in range(10):
+            queue.save_record('courses', {'id': i})
+
+        deadline = time.monotonic() + 5
+        while queue.pending_count() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert queue.backend.transactions == 1
+        queue.close()
+
+    def test_queues_share_worker_pool(self, tmp_path):
+        """Test that opening many queues does not start a thread per queue."""
+        queues = [WriteBehindBackend(CountingBackend(str(tmp_path / f"{i}.db")), flush_interval=0.01)
+                  for i in range(20)]
+        for i, queue in enumerate(queues):
+            queue.save_record('courses', {'id': i})
+
+        deadline = time.monotonic() + 5
+        while any(queue.pending_count() for queue in queues) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert all(queue.backend.transactions == 1 for queue in queues)
+
+        workers = [thread for thread in threading.enumerate() if thread.name.startswith('dersly-write-behind')]
+        assert len(workers) <= write_behind.WORKERS + 1
+        for queue in queues:
+            queue.close()
+
+    def test_failed_batch_requeued(self, queue):
+        """Test that a failed flush keeps the writes, newer ones winning."""
+        queue.save_record('courses', {'id': 1, 'course_name': 'Eski'})
+        queue.backend.fail_next = True
+        with pytest.raises(OSError):
+            queue.flush()
+
+        queue.save_record('courses', {'id': 1, 'course_name': 'Yeni'})
+        queue.flush()
+        assert queue.backend.load_collection('courses')[1]['course_name'] == 'Yeni'
+
+
+class TestJournal:
+    """Tests for crash-safe journaling."""
+
+    def test_replayed_after_crash(self, tmp_path):
+        """Test that acknowledged writes survive a crash before flushing."""
+        db_path = str(tmp_path / "dersly.db")
+        queue = WriteBehindBackend(SQLiteBackend(db_path), journal_path=db_path + '.wbq', flush_interval=3600)
+        queue.save_record('grades', {'id': 1, 'grade': 4.0})
+        queue.set_value('next_grade_id', 2)
+        crash(queue)
+
+        assert SQLiteBackend(db_path).load_collection('grades') == {}
+
+        reopened = WriteBehindBackend(SQLiteBackend(db_path), journal_path=db_path + '.wbq')
+        assert reopened.load_collection('grades') == {1: {'id': 1, 'grade': 4.0}}
+        assert reopened.get_value('next_grade_id') == 2
+        reopened.close()
+
+    def test_journal_fsynced_once_per_flush(self, queue, monkeypatch):
+        """Test that writes are not fsynced when queued, only once per applied batch."""
+        synced = []
+        fsync = write_behind.os.fsync
+        monkeypatch.setattr(write_behind.os, 'fsync', lambda fd: synced.append(fd) or fsync(fd))
+
+        for i in range(50):
+            queue.save_record('courses', {'id': i})
+        queue.apply_batch([('save_record', 'courses', {'id': i}) for i in range(50, 60)])
+        assert synced == []
+
+        queue.flush()
+        assert len(synced) == 1
+        assert len(queue.backend.load_collection('courses')) == 60
+
+    def test_writes_after_failed_batch_replayed_in_order(self, tmp_path):
+        """Test that a failed batch's journal stays ahead of later writes after a crash."""
+        db_path = str(tmp_path / "dersly.db")
+        backend = CountingBackend(db_path)
+        queue = WriteBehindBackend(backend, journal_path=db_path + '.wbq', flush_interval=3600)
+        queue.save_record('courses', {'id': 1, 'course_name': 'Eski'})
+        backend.fail_next = True
+        with pytest.raises(OSError):
+            queue.flush()
+
+        queue.save_record('courses', {'id': 1, 'course_name': 'Yeni'})
+        queue.save_record('courses', {'id': 2, 'course_name': 'Kimya'})
+        backend.fail_next = True
+        with pytest.raises(OSError):
+            queue.flush()
+        crash(queue)
+
+        reopened = WriteBehindBackend(SQLiteBackend(db_path), journal_path=db_path + '.wbq')
+        courses = reopened.load_collection('courses')
+        assert courses[1]['course_name'] == 'Yeni' and 2 in courses
+        reopened.close()
+
+    def test_torn_line_ignored(self, tmp_path):
+        """Test that a partially written final line is skipped on replay."""
+        db_path = str(tmp_path / "dersly.db")
+        with open(db_path + '.wbq', 'w', encoding='utf-8') as journal:
+            journal.write('["save_record", "courses", {"id": 1}]\n["save_record", "cour')
+
+        queue = WriteBehindBackend(SQLiteBackend(db_path), journal_path=db_path + '.wbq')
+        assert list(queue.load_collection('courses')) == [1]
+        queue.close()
+
+    def test_replace_all_discards_queue(self, queue):
+        """Test that a full replacement supersedes queued writes."""
+        queue.save_record('courses', {'id': 1})
+        queue.replace_all({'courses': [{'id': 2}]}, {})
+
+        assert queue.pending_count() == 0
+        assert list(queue.load_collection('courses')) == [2]
+
+
+class TestManagerIntegration:
+    """Tests that manager mutations go through the queue."""
+
+    def test_bulk_status_update_is_one_transaction(self, tmp_path):
+        """Test that marking 50 assignments completed costs one batch."""
+        previous_store = StorageManager._tenants
+        previous_handle = st.session_state.get(StorageManager.TENANT_HANDLE_KEY)
+        StorageManager.set_tenant_store(TenantStore(
+            StorageManager._snapshot, backend_name='sqlite', data_dir=str(tmp_path), flush_interval=3600
+        ))
+        st.session_state[StorageManager.TENANT_HANDLE_KEY] = 'bulk'
+        try:
+            due_date = (datetime.now() + timedelta(days=3)).isoformat()
+            ids = [AssignmentManager.add_assignment({'title': f'Ödev {i}', 'due_date': due_date}) for i in range(50)]
+            backend = StorageManager.get_backend()
+            backend.flush()
+            batches = backend.batches_applied
+
+            for assignment_id in ids:
+                AssignmentManager.update_assignment(assignment_id, {'status': 'completed'})
+            backend.flush()
+
+            assert backend.batches_applied == batches + 1
+            store = StorageManager.get_tenant_store()
+            store.evict(StorageManager.get_tenant_key())
+            reopened = store.acquire(StorageManager.get_tenant_key()).backend.load_collection('assignments')
+            assert reopened[ids[-1]]['status'] == 'completed'
+        finally:
+            StorageManager.get_tenant_store().evict_all()
+            StorageManager.set_tenant_store(previous_store)
+            if previous_handle is not None:
+                st.session_state[StorageManager.TENANT_HANDLE_KEY] = previous_handle
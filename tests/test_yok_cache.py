@@ -0,0 +1,98 @@
+"""
+Tests for the YÖK disk cache and YokAPI read-through.
+"""
+import time
+from utils.yok_api import YokAPI
+from utils.yok_cache import YokCache, content_version
+
+
+class TestYokCache:
+    """Tests for the disk-backed YÖK cache."""
+
+    def test_put_get_and_versions(self, tmp_path):
+        """Test content versions, freshness and fetch-time renewal."""
+        cache = YokCache(str(tmp_path / 'nested' / 'cache.db'), ttl=60)
+        assert cache.get('universities') is None
+
+        version = cache.put('universities', [{'name': 'A'}])
+        assert version == content_version([{'name': 'A'}])
+        entry = cache.get('universities')
+        assert entry['data'] == [{'name': 'A'}]
+        assert entry['fresh']
+
+        # Same content keeps its version; only the fetch time moves
+        assert cache.put('universities', [{'name': 'A'}], fetched_at=0) == version
+        assert not cache.get('universities')['fresh']
+        assert cache.stat('universities') == (version, 0)
+
+        assert cache.put('universities', [{'name': 'B'}]) != version
+        cache.close()
+
+    def test_entries_survive_reopen(self, tmp_path):
+        """Test that entries persist across reopening the file."""
+        path = str(tmp_path / 'cache.db')
+        cache = YokCache(path)
+        cache.put('departments', {'Fakülte': ['Bölüm']})
+        cache.close()
+
+        reopened = YokCache(path)
+        assert reopened.get('departments')['data'] == {'Fakülte': ['Bölüm']}
+        reopened.close()
+
+
+class TestYokAPIReadThrough:
+    """Tests for YokAPI reads through the disk cache."""
+
+    def test_cold_start_uses_static_data_without_remote(self, yok_stand_in):
+        """Test that an empty cache serves static data without network calls."""
+        cache, client = yok_stand_in
+        assert YokAPI.get_all_universities() == YokAPI.UNIVERSITIES
+        assert YokAPI.get_all_departments() == YokAPI.DEPARTMENTS
+        assert client.calls == 0
+
+    def test_cached_entries_are_read_first(self, yok_stand_in, monkeypatch):
+        """Test that fresh cached entries are served before any remote fetch."""
+        cache, client = yok_stand_in
+        cache.put('universities', [{'id': 1, 'name': 'Önbellek Üniversitesi', 'city': 'Bursa', 'type': 'Devlet'}])
+        monkeypatch.setattr(YokAPI, 'remote_enabled', True)
+
+        assert YokAPI.get_cities() == ['Bursa']
+        assert YokAPI.get_university_by_name('Önbellek Üniversitesi')['city'] == 'Bursa'
+        assert client.calls == 0
+
+    def test_expired_entry_is_refetched_when_remote_enabled(self, yok_stand_in, monkeypatch):
+        """Test that expired entries are refetched only when remote fetching is on."""
+        cache, client = yok_stand_in
+        cache.put('universities', [{'id': 1, 'name': 'Eski', 'city': 'Bursa', 'type': 'Devlet'}], fetched_at=0)
+
+        # Remote disabled: stale data is still served
+        assert YokAPI.get_all_universities()[0]['name'] == 'Eski'
+        assert client.calls == 0
+
+        monkeypatch.setattr(YokAPI, 'remote_enabled', True)
+        names = [uni['name'] for uni in YokAPI.get_all_universities()]
+        assert names == ['Test Üniversitesi', 'Örnek Vakıf Üniversitesi']
+        assert client.calls == 1
+        assert cache.get('universities')['fresh']
+
+        # Fresh now: no further remote calls
+        YokAPI.get_universities_by_type('Vakıf')
+        assert client.calls == 1
+
+    def test_version_change_on_disk_is_picked_up(self, yok_stand_in):
+        """Test that another process's write replaces the in-process copy."""
+        cache, _ = yok_stand_in
+        cache.put('universities', [{'id': 1, 'name': 'A', 'city': 'X', 'type': 'Devlet'}])
+        assert YokAPI.get_all_universities()[0]['name'] == 'A'
+
+        # Another process refreshed the cache
+        cache.put('universities', [{'id': 1, 'name': 'B', 'city': 'X', 'type': 'Devlet'}])
+        assert YokAPI.get_all_universities()[0]['name'] == 'B'
+
+    def test_refresh_fetches_regardless_of_age(self, yok_stand_in):
+        """Test that refresh() fetches even when the entry is fresh."""
+        cache, client = yok_stand_in
+        YokAPI.refresh()
+        assert client.calls == 1
+        assert cache.get('universities')['data'][0]['name'] == 'Test Üniversitesi'
+        assert cache.get('universities')['fetched_at'] <= time.time()
@@ -0,0 +1,118 @@
+"""
+Tests for the Turkish-aware YÖK search indexes.
+"""
+import random
+from utils.yok_api import YokAPI
+from utils.yok_index import NameIndex, PrefixTrie, UniversityIndex, DepartmentIndex, normalize_name, turkish_lower
+
+
+class TestNormalization:
+    """Tests for Turkish case folding and the prefix trie."""
+
+    def test_turkish_case_folding(self):
+        """Test Turkish lowercasing and accent-insensitive normalization."""
+        assert turkish_lower("İSTANBUL") == "istanbul"
+        assert turkish_lower("ISPARTA") == "ısparta"
+        assert normalize_name("BOĞAZİÇİ Üniversitesi") == "bogazici universitesi"
+        assert normalize_name("Radyo, Televizyon  ve Sinema") == "radyo televizyon ve sinema"
+        assert normalize_name("ŞIRNAK") == normalize_name("şırnak") == "sirnak"
+
+    def test_prefix_trie_lookup(self):
+        """Test that prefix lookups return every item with a matching word."""
+        trie = PrefixTrie()
+        trie.insert("bilgisayar", 0)
+        trie.insert("bilim", 1)
+        trie.insert("fizik", 2)
+        assert trie.lookup("bil") == {0, 1}
+        assert trie.lookup("bilg") == {0}
+        assert trie.lookup("x") == set()
+
+
+class TestNameIndex:
+    """Tests for ranked name search."""
+
+    def test_search_ranking(self):
+        """Test exact, prefix, word-prefix then substring ranking and limits."""
+        index = NameIndex(["Yazılım Mühendisliği", "Bilgisayar Mühendisliği", "Mühendislik", "Kimya Mühendisliği"])
+        names = lambda query, limit=None: [index.names[p] for p in index.search(query, limit)]
+        assert names("muhendis") == ["Mühendislik", "Yazılım Mühendisliği", "Bilgisayar Mühendisliği", "Kimya Mühendisliği"]
+        assert names("bilg muh") == ["Bilgisayar Mühendisliği"]
+        # Substring matches inside words still count, after prefix matches
+        assert names("disli") == ["Yazılım Mühendisliği", "Bilgisayar Mühendisliği", "Mühendislik", "Kimya Mühendisliği"]
+        assert names("", limit=2) == ["Yazılım Mühendisliği", "Bilgisayar Mühendisliği"]
+        assert names("müh", limit=1) == ["Mühendislik"]
+        assert index.find("YAZILIM MÜHENDİSLİĞİ") == 0
+
+    def test_search_covers_old_substring_results(self, yok_stand_in):
+        """Test that full searches include every old substring match."""
+        rng = random.Random(7)
+        names = YokAPI.get_all_departments_flat()
+        index = NameIndex(names)
+        for _ in range(200):
+            name = rng.choice(names)
+            start = rng.randrange(len(name))
+            query = name[start:start + rng.randint(1, 6)].lower()
+            old = {n for n in names if query in n.lower()}
+            assert old <= {names[p] for p in index.search(query)}
+
+
+class TestEntityIndexes:
+    """Tests for the university and department indexes."""
+
+    def test_university_inverted_indexes(self, yok_stand_in):
+        """Test city, type and name lookups against the university list."""
+        index = UniversityIndex(YokAPI.UNIVERSITIES)
+        assert index.get_by_city("İstanbul") == [u for u in YokAPI.UNIVERSITIES if u['city'] == "İstanbul"]
+        assert index.get_by_city("istanbul") == index.get_by_city("İSTANBUL")
+        assert index.get_by_type("Vakıf") == [u for u in YokAPI.UNIVERSITIES if u['type'] == "Vakıf"]
+        assert index.get_by_name("orta dogu teknik universitesi")['id'] == 4
+        assert index.cities == sorted({u['city'] for u in YokAPI.UNIVERSITIES})
+
+    def test_department_index_flattens_distinct_names(self):
+        """Test that departments are flattened without duplicates."""
+        index = DepartmentIndex({"A": ["Fizik", "Kimya"], "B": ["Fizik"]})
+        assert index.flat == ["Fizik", "Kimya"]
+        assert index.search("fiz") == ["Fizik"]
+
+
+class TestYokAPISearch:
+    """Tests for index reuse and search through YokAPI."""
+
+    def test_yok_api_reuses_index_until_data_changes(self, yok_stand_in):
+        """Test that the index is rebuilt only when the cached list changes."""
+        cache, _ = yok_stand_in
+        first = YokAPI.get_university_index()
+        assert YokAPI.get_university_index() is first
+        assert YokAPI.search_universities("bogazici")[0]['name'] == "Boğaziçi Üniversitesi"
+        assert YokAPI.search_universities("üni", limit=3) == YokAPI.UNIVERSITIES[:3]
+
+        cache.put('universities', [{'id': 1, 'name': 'Işık Üniversitesi', 'city': 'İstanbul', 'type': 'Vakıf'}])
+        assert YokAPI.get_university_index() is not first
+        assert YokAPI.search_universities("isik")[0]['name'] == 'Işık Üniversitesi'
+        assert YokAPI.get_universities_by_type("Devlet") == []
+
+    def test_version_check_memoized_between_keystrokes(self, yok_stand_in, monkeypatch):
+        """Test that the disk version is checked once per interval."""
+        cache, _ = yok_stand_in
+        monkeypatch.setattr(YokAPI, 'version_check_interval', 60)
+        stats = []
+        stat = cache.stat
+        monkeypatch.setattr(cache, 'stat', lambda key: stats.append(key) or stat(key))
+
+        for query in ["b", "bo", "bog"]:
+            YokAPI.search_universities(query)
+        assert stats == ['universities']
+
+        # Within the interval another process's write is not seen yet
+        cache.put('universities', [{'id': 1, 'name': 'Işık Üniversitesi', 'city': 'İstanbul', 'type': 'Vakıf'}])
+        assert YokAPI.search_universities("isik") == []
+
+        monkeypatch.setattr(YokAPI, 'version_check_interval', 0)
+        assert YokAPI.search_universities("isik")[0]['name'] == 'Işık Üniversitesi'
+
+    def test_search_helpers_limit_results(self, yok_stand_in):
+        """Test that search helpers default to SEARCH_LIMIT results."""
+        cache, _ = yok_stand_in
+        cache.put('departments', {'Fakülte': [f"Bölüm {i}" for i in range(YokAPI.SEARCH_LIMIT + 10)]})
+        assert len(YokAPI.search_departments("bolum")) == YokAPI.SEARCH_LIMIT
+        assert len(YokAPI.search_departments("bolum", limit=None)) == YokAPI.SEARCH_LIMIT + 10
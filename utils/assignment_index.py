@@ -0,0 +1,194 @@
+"""
+Assignment Index for DERSLY Streamlit application.
+Maintains secondary indexes over assignments for status and due-date queries.
+"""
+import bisect
+import sys
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+
+
+def parse_due_date(due_date_str: Any) -> Optional[datetime]:
+    """
+    Parse an ISO due date string into a naive local datetime.
+
+    Args:
+        due_date_str: ISO 8601 date/datetime string (may end with 'Z')
+
+    Returns:
+        Parsed datetime, or None if the value is not a valid date
+    """
+    try:
+        if 'T' in due_date_str:
+            due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
+        else:
+            due_date = datetime.fromisoformat(due_date_str)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+    # Normalize timezone-aware values so all dates compare with datetime.now()
+    if due_date.tzinfo is not None:
+        due_date = due_date.astimezone().replace(tzinfo=None)
+
+    return due_date
+
+
+# Private record field holding the cached (due_date string, parsed datetime) pair
+DUE_DATE_CACHE_FIELD = '_due_at'
+
+
+def get_due_date(assignment: Dict[str, Any]) -> Optional[datetime]:
+    """
+    Get the parsed due date of an assignment, parsing it at most once.
+    The result is cached on the assignment together with the source string,
+    so it is recomputed automatically when 'due_date' changes.
+
+    Args:
+        assignment: Assignment dictionary
+
+    Returns:
+        Parsed due date, or None if the assignment has no valid date
+    """
+    due_date_str = assignment.get('due_date')
+    cached = assignment.get(DUE_DATE_CACHE_FIELD)
+    if cached is not None and cached[0] == due_date_str:
+        return cached[1]
+
+    due_date = parse_due_date(due_date_str)
+    assignment[DUE_DATE_CACHE_FIELD] = (due_date_str, due_date)
+    return due_date
+
+
+class AssignmentIndex:
+    """
+    Secondary indexes over the assignments collection.
+    Keeps per-status ID lists ordered by due date string and a sorted
+    list of parsed due dates, updated incrementally on every mutation.
+    """
+
+    def __init__(self, source: Dict[int, Dict[str, Any]]):
+        """
+        Build indexes for an assignments collection.
+
+        Args:
+            source: Assignments dictionary keyed by ID
+        """
+        # Collection the index was built from (replaced on import/clear)
+        self.source = source
+
+        # status -> sorted list of (due_date string, id)
+        self.by_status: Dict[str, List[Tuple[str, int]]] = {}
+
+        # Sorted list of (parsed due date, id) for assignments with valid dates
+        self.by_due_date: List[Tuple[datetime, int]] = []
+
+        # id -> (status, due_date string, parsed due date) currently indexed
+        self.entries: Dict[int, Tuple[str, str, Optional[datetime]]] = {}
+
+        # Incremented on every mutation
+        self.version = 0
+
+        for assignment in source.values():
+            self._insert(assignment)
+
+        # Bulk build: sort once instead of per-insert
+        for entries in self.by_status.values():
+            entries.sort()
+        self.by_due_date.sort()
+
+    def _insert(self, assignment: Dict[str, Any], keep_sorted: bool = False) -> None:
+        assignment_id = assignment['id']
+        status = assignment.get('status')
+        due_date_str = assignment.get('due_date') or ''
+        due_date = get_due_date(assignment)
+
+        status_entries = self.by_status.setdefault(status, [])
+        if keep_sorted:
+            bisect.insort(status_entries, (due_date_str, assignment_id))
+            if due_date is not None:
+                bisect.insort(self.by_due_date, (due_date, assignment_id))
+        else:
+            status_entries.append((due_date_str, assignment_id))
+            if due_date is not None:
+                self.by_due_date.append((due_date, assignment_id))
+
+        self.entries[assignment_id] = (status, due_date_str, due_date)
+
+    @staticmethod
+    def _remove_sorted(entries: List[tuple], item: tuple) -> None:
+        position = bisect.bisect_left(entries, item)
+        if position < len(entries) and entries[position] == item:
+            del entries[position]
+
+    def add(self, assignment: Dict[str, Any]) -> None:
+        """
+        Index a new or updated assignment.
+
+        Args:
+            assignment: Assignment dictionary
+        """
+        if assignment['id'] in self.entries:
+            self.remove(assignment['id'])
+        self._insert(assignment, keep_sorted=True)
+        self.version += 1
+
+    def remove(self, assignment_id: int) -> None:
+        """
+        Remove an assignment from the indexes.
+
+        Args:
+            assignment_id: Assignment ID
+        """
+        entry = self.entries.pop(assignment_id, None)
+        if entry is None:
+            return
+
+        status, due_date_str, due_date = entry
+        self._remove_sorted(self.by_status.get(status, []), (due_date_str, assignment_id))
+        if due_date is not None:
+            self._remove_sorted(self.by_due_date, (due_date, assignment_id))
+        self.version += 1
+
+    def ids_by_status(self, status: str) -> List[int]:
+        """
+        Get assignment IDs with a status, ordered by due date.
+
+        Args:
+            status: Assignment status
+
+        Returns:
+            List of assignment IDs
+        """
+        return [assignment_id for _, assignment_id in self.by_status.get(status, [])]
+
+    def count_by_status(self, status: str) -> int:
+        """
+        Get number of assignments with a status.
+
+        Args:
+            status: Assignment status
+
+        Returns:
+            Number of assignments
+        """
+        return len(self.by_status.get(status, []))
+
+    def ids_due_between(self, start: datetime, end: datetime) -> List[int]:
+        """
+        Get assignment IDs due within a time range (inclusive), ordered by due date.
+
+        Args:
+            start: Range start
+            end: Range end
+
+        Returns:
+            List of assignment IDs
+        """
+        low = bisect.bisect_left(self.by_due_date, (start, -sys.maxsize))
+        high = bisect.bisect_right(self.by_due_date, (end, sys.maxsize))
+        return [assignment_id for _, assignment_id in self.by_due_date[low:high]]
+
+    def status_of(self, assignment_id: int) -> Optional[str]:
+        """Get the indexed status of an assignment."""
+        entry = self.entries.get(assignment_id)
+        return entry[0] if entry else None
@@ -1,19 +1,55 @@
 """
 Assignment Manager for DERSLY Streamlit application.
-Manages assignment data operations using session state.
+Manages assignment data operations through StorageManager.
 """
-import streamlit as st
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from utils.storage_manager import StorageManager
+from utils.assignment_index import AssignmentIndex, get_due_date, DUE_DATE_CACHE_FIELD
 
 
 class AssignmentManager:
     """
-    Manages assignment data in session state.
+    Manages assignment data in the user's state.
     Provides CRUD operations for assignments.
+    Status and due-date queries are served from AssignmentIndex.
     """
     
+    @staticmethod
+    def get_index() -> AssignmentIndex:
+        """
+        Get the assignment index for the current user.
+        Rebuilds it when the assignments collection has been replaced
+        (e.g., after import or clearing all data).
+        
+        Returns:
+            AssignmentIndex for the assignments collection
+        """
+        StorageManager.initialize_storage()
+        assignments = StorageManager.get_collection('assignments')
+        
+        state = StorageManager.state()
+        index = state.get('assignment_index')
+        if index is None or index.source is not assignments:
+            index = AssignmentIndex(assignments)
+            state['assignment_index'] = index
+        
+        return index
+    
+    @staticmethod
+    def get_due_date(assignment: Dict[str, Any]) -> Optional[datetime]:
+        """
+        Get the parsed due date of an assignment.
+        Parsed once and cached on the record; invalidated when due_date changes.
+        
+        Args:
+            assignment: Assignment dictionary
+        
+        Returns:
+            Due date as naive local datetime, or None if invalid
+        """
+        return get_due_date(assignment)
+    
     @staticmethod
     def add_assignment(assignment_data: Dict[str, Any]) -> int:
         """
@@ -30,8 +66,7 @@ class AssignmentManager:
         StorageManager.initialize_storage()
         
         # Get next ID
-        assignment_id = st.session_state['next_assignment_id']
-        st.session_state['next_assignment_id'] += 1
+        assignment_id = StorageManager.next_id('assignments')
         
         # Create assignment with ID
         assignment = {
@@ -46,8 +81,12 @@ class AssignmentManager:
             'created_at': datetime.now().isoformat()
         }
         
-        # Store in session state
-        st.session_state['assignments'][assignment_id] = assignment
+        # Parse due date once at write time
+        get_due_date(assignment)
+        
+        # Index first, so the version bump of save_record never exposes stale status counts
+        AssignmentManager.get_index().add(assignment)
+        StorageManager.save_record('assignments', assignment)
         
         return assignment_id
     
@@ -63,7 +102,7 @@ class AssignmentManager:
             Assignment dictionary if found, None otherwise
         """
         StorageManager.initialize_storage()
-        return st.session_state['assignments'].get(assignment_id)
+        return StorageManager.get_collection('assignments').get(assignment_id)
     
     @staticmethod
     def get_all_assignments() -> List[Dict[str, Any]]:
@@ -74,7 +113,7 @@ class AssignmentManager:
             List of all assignment dictionaries
         """
         StorageManager.initialize_storage()
-        return list(st.session_state['assignments'].values())
+        return list(StorageManager.get_collection('assignments').values())
     
     @staticmethod
     def update_assignment(assignment_id: int, updates: Dict[str, Any]) -> bool:
@@ -90,7 +129,7 @@ class AssignmentManager:
         """
         StorageManager.initialize_storage()
         
-        assignment = st.session_state['assignments'].get(assignment_id)
+        assignment = StorageManager.get_collection('assignments').get(assignment_id)
         if assignment is None:
             return False
         
@@ -100,7 +139,13 @@ class AssignmentManager:
             if key in allowed_fields:
                 assignment[key] = value
         
-        st.session_state['assignments'][assignment_id] = assignment
+        # Refresh cached due date if it changed
+        if 'due_date' in updates:
+            assignment.pop(DUE_DATE_CACHE_FIELD, None)
+            get_due_date(assignment)
+        
+        AssignmentManager.get_index().add(assignment)
+        StorageManager.save_record('assignments', assignment)
         return True
     
     @staticmethod
@@ -116,10 +161,12 @@ class AssignmentManager:
         """
         StorageManager.initialize_storage()
         
-        if assignment_id in st.session_state['assignments']:
-            del st.session_state['assignments'][assignment_id]
-            return True
-        return False
+        index = AssignmentManager.get_index()
+        if assignment_id not in StorageManager.get_collection('assignments'):
+            return False
+        
+        index.remove(assignment_id)
+        return StorageManager.delete_record('assignments', assignment_id)
     
     @staticmethod
     def get_assignments_by_status(status: str) -> List[Dict[str, Any]]:
@@ -132,17 +179,11 @@ class AssignmentManager:
         Returns:
             List of assignments with the specified status
         """
-        StorageManager.initialize_storage()
-        
-        assignments = []
-        for assignment in st.session_state['assignments'].values():
-            if assignment.get('status') == status:
-                assignments.append(assignment)
+        index = AssignmentManager.get_index()
+        assignments = StorageManager.get_collection('assignments')
         
-        # Sort by due date
-        assignments.sort(key=lambda x: x.get('due_date', ''))
-        
-        return assignments
+        # Index keeps IDs sorted by due date
+        return [assignments[assignment_id] for assignment_id in index.ids_by_status(status)]
     
     @staticmethod
     def get_upcoming_assignments(days: int = 7) -> List[Dict[str, Any]]:
@@ -155,36 +196,18 @@ class AssignmentManager:
         Returns:
             List of upcoming assignments
         """
-        StorageManager.initialize_storage()
+        index = AssignmentManager.get_index()
+        assignments = StorageManager.get_collection('assignments')
         
         now = datetime.now()
         future = now + timedelta(days=days)
         
-        upcoming = []
-        for assignment in st.session_state['assignments'].values():
-            # Skip completed assignments
-            if assignment.get('status') == 'completed':
-                continue
-            
-            # Parse due date
-            try:
-                due_date_str = assignment.get('due_date', '')
-                if 'T' in due_date_str:
-                    due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-                else:
-                    due_date = datetime.fromisoformat(due_date_str)
-                
-                # Check if within range
-                if now <= due_date <= future:
-                    upcoming.append(assignment)
-            except (ValueError, AttributeError):
-                # Skip assignments with invalid dates
-                continue
-        
-        # Sort by due date
-        upcoming.sort(key=lambda x: x.get('due_date', ''))
-        
-        return upcoming
+        # Range lookup on the sorted due-date index, skipping completed assignments
+        return [
+            assignments[assignment_id]
+            for assignment_id in index.ids_due_between(now, future)
+            if index.status_of(assignment_id) != 'completed'
+        ]
     
     @staticmethod
     def get_assignment_count() -> int:
@@ -195,7 +218,7 @@ class AssignmentManager:
             Number of assignments
         """
         StorageManager.initialize_storage()
-        return len(st.session_state['assignments'])
+        return len(StorageManager.get_collection('assignments'))
     
     @staticmethod
     def get_pending_count() -> int:
@@ -205,9 +228,4 @@ class AssignmentManager:
         Returns:
             Number of pending assignments
         """
-        StorageManager.initialize_storage()
-        count = 0
-        for assignment in st.session_state['assignments'].values():
-            if assignment.get('status') == 'pending':
-                count += 1
-        return count
+        return AssignmentManager.get_index().count_by_status('pending')
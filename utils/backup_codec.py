@@ -0,0 +1,378 @@
+"""
+Binary Backup Codec for DERSLY Streamlit application.
+Packs backups into a compact columnar, compressed container.
+
+Layout:
+    MAGIC (8 bytes) | header length (4 bytes, big-endian) | header JSON | compressed payload
+
+The header is stored uncompressed so it can be previewed without touching the
+payload. The payload holds one column table per entity type, so record keys
+are written once per entity instead of once per record:
+
+    table count (u16) | per table: name | rows (u32) | column count (u16) | columns
+    column: name | kind (1 byte) | missing rows | None rows | values
+
+Names are u16 length-prefixed UTF-8 and row lists are a u32 count followed by
+u32 row numbers. Values cover the remaining rows: int64/float64/bool columns
+are packed little-endian with struct, text columns are u32 character lengths
+followed by one length-prefixed UTF-8 block (decoded in a single call).
+Columns mixing types or holding lists/dicts fall back to JSON text per value.
+"""
+import json
+import lzma
+import struct
+import zlib
+from itertools import accumulate
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# File signature of binary backups
+MAGIC = b"DRSLYBK2"
+
+# Supported compression codecs
+CODECS = {
+    'zlib': (lambda data: zlib.compress(data, 9), zlib.decompress),
+    'lzma': (lambda data: lzma.compress(data, preset=9), lzma.decompress)
+}
+
+_HEADER_LENGTH = struct.Struct('>I')
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+
+# Column kinds; numeric kinds double as their struct format character
+KIND_INT = b'q'
+KIND_FLOAT = b'd'
+KIND_BOOL = b'?'
+KIND_TEXT = b's'
+KIND_JSON = b'j'
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def encode_columns(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert a list of records into a column table.
+    Keys missing from a record are listed per column so they are restored as
+    missing (not as None) on decode.
+
+    Args:
+        records: List of flat record dictionaries
+
+    Returns:
+        Column table with row count, column values and missing row indices
+    """
+    columns: Dict[str, List[Any]] = {}
+    missing: Dict[str, List[int]] = {}
+
+    for row, record in enumerate(records):
+        for key in record:
+            if key not in columns:
+                # Column first seen on this row: earlier rows did not have it
+                columns[key] = [None] * row
+                missing[key] = list(range(row))
+        for key, values in columns.items():
+            if key in record:
+                values.append(record[key])
+            else:
+                values.append(None)
+                missing[key].append(row)
+
+    table = {'rows': len(records), 'columns': columns}
+    sparse = {key: rows for key, rows in missing.items() if rows}
+    if sparse:
+        table['missing'] = sparse
+    return table
+
+
+def decode_columns(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Convert a column table back into a list of records.
+
+    Args:
+        table: Column table produced by encode_columns
+
+    Returns:
+        List of record dictionaries
+    """
+    rows = table.get('rows', 0)
+    columns = table.get('columns', {})
+    for key, values in columns.items():
+        if len(values) != rows:
+            raise ValueError(f"'{key}' sütunu {len(values)} değer içeriyor, {rows} bekleniyordu")
+
+    names = list(columns)
+    records = [dict(zip(names, values)) for values in zip(*columns.values())] if names else [{} for _ in range(rows)]
+
+    for key, missing_rows in table.get('missing', {}).items():
+        for row in missing_rows:
+            records[row].pop(key, None)
+
+    return records
+
+
+def _column_kind(values: List[Any]) -> bytes:
+    """Pick the storage kind of a column from its non-None values."""
+    kinds = {type(value) for value in values if value is not None}
+    if kinds == {bool}:
+        return KIND_BOOL
+    if kinds == {int} and all(_INT64_MIN <= value <= _INT64_MAX for value in values if value is not None):
+        return KIND_INT
+    if kinds == {float}:
+        return KIND_FLOAT
+    if kinds <= {str}:
+        return KIND_TEXT
+    return KIND_JSON
+
+
+def _put_name(out: bytearray, name: str) -> None:
+    """Append a u16 length-prefixed UTF-8 name."""
+    encoded = name.encode('utf-8')
+    out += _U16.pack(len(encoded)) + encoded
+
+
+def _put_rows(out: bytearray, rows: List[int]) -> None:
+    """Append a u32 count followed by u32 row numbers."""
+    out += _U32.pack(len(rows)) + struct.pack(f'<{len(rows)}I', *rows)
+
+
+def _put_texts(out: bytearray, texts: List[str]) -> None:
+    """Append u32 character lengths, then the concatenated text as one UTF-8 block."""
+    encoded = ''.join(texts).encode('utf-8', 'surrogatepass')
+    out += struct.pack(f'<{len(texts)}I', *(len(text) for text in texts))
+    out += _U32.pack(len(encoded)) + encoded
+
+
+def _encode_payload(tables: Dict[str, Dict[str, Any]]) -> bytes:
+    """Serialize entity column tables into the binary payload layout."""
+    out = bytearray(_U16.pack(len(tables)))
+    for entity, table in tables.items():
+        rows = table.get('rows', 0)
+        columns = table.get('columns', {})
+        missing = table.get('missing', {})
+
+        _put_name(out, entity)
+        out += _U32.pack(rows) + _U16.pack(len(columns))
+
+        for key, values in columns.items():
+            missing_rows = missing.get(key, [])
+            absent = set(missing_rows)
+            null_rows = [row for row, value in enumerate(values) if value is None and row not in absent]
+            present = [value for value in values if value is not None]
+            kind = _column_kind(present)
+
+            _put_name(out, key)
+            out += kind
+            _put_rows(out, missing_rows)
+            _put_rows(out, null_rows)
+
+            if kind == KIND_TEXT:
+                _put_texts(out, present)
+            elif kind == KIND_JSON:
+                _put_texts(out, [json.dumps(value, ensure_ascii=False, separators=(',', ':')) for value in present])
+            else:
+                out += struct.pack(f'<{len(present)}{kind.decode()}', *present)
+
+    return bytes(out)
+
+
+class _Reader:
+    """Cursor over the binary payload; short reads raise ValueError."""
+
+    def __init__(self, data: bytes):
+        """Start reading at the beginning of `data`."""
+        self.data = data
+        self.offset = 0
+
+    def take(self, size: int) -> bytes:
+        """Read `size` raw bytes."""
+        end = self.offset + size
+        if end > len(self.data):
+            raise ValueError("Yedek dosyası eksik veya bozuk")
+        chunk = self.data[self.offset:end]
+        self.offset = end
+        return chunk
+
+    def values(self, code: str, count: int) -> Tuple[Any, ...]:
+        """Read `count` little-endian values of a struct format character."""
+        layout = struct.Struct(f'<{count}{code}')
+        return layout.unpack(self.take(layout.size))
+
+    def u16(self) -> int:
+        """Read an unsigned 16-bit integer."""
+        return _U16.unpack(self.take(_U16.size))[0]
+
+    def u32(self) -> int:
+        """Read an unsigned 32-bit integer."""
+        return _U32.unpack(self.take(_U32.size))[0]
+
+    def name(self) -> str:
+        """Read a length-prefixed UTF-8 name."""
+        return self.take(self.u16()).decode('utf-8')
+
+    def rows(self) -> Tuple[int, ...]:
+        """Read a counted row number list."""
+        return self.values('I', self.u32())
+
+    def texts(self, count: int) -> List[str]:
+        """Read `count` strings: one UTF-8 decode, then slicing by character lengths."""
+        lengths = self.values('I', count)
+        text = self.take(self.u32()).decode('utf-8', 'surrogatepass')
+        if sum(lengths) != len(text):
+            raise ValueError("Metin sütunu uzunlukları tutarsız")
+        offsets = list(accumulate(lengths, initial=0))
+        return [text[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+def _decode_payload(data: bytes) -> Dict[str, Dict[str, Any]]:
+    """Read entity column tables back from the binary payload layout."""
+    reader = _Reader(data)
+    tables: Dict[str, Dict[str, Any]] = {}
+
+    for _ in range(reader.u16()):
+        entity = reader.name()
+        rows = reader.u32()
+        columns: Dict[str, List[Any]] = {}
+        missing: Dict[str, List[int]] = {}
+
+        for _ in range(reader.u16()):
+            key = reader.name()
+            kind = reader.take(1)
+            missing_rows = reader.rows()
+            null_rows = reader.rows()
+            count = rows - len(missing_rows) - len(null_rows)
+            if count < 0:
+                raise ValueError(f"'{key}' sütunu satır sayısını aşıyor")
+
+            if kind == KIND_TEXT:
+                present = reader.texts(count)
+            elif kind == KIND_JSON:
+                present = [json.loads(text) for text in reader.texts(count)]
+            elif kind in (KIND_INT, KIND_FLOAT, KIND_BOOL):
+                present = list(reader.values(kind.decode(), count))
+            else:
+                raise ValueError(f"Bilinmeyen sütun türü: {kind!r}")
+
+            if count == rows:
+                values = present
+            else:
+                # Scatter values around the missing/None rows
+                absent = set(missing_rows) | set(null_rows)
+                values = [None] * rows
+                filled = iter(present)
+                for row in range(rows):
+                    if row not in absent:
+                        values[row] = next(filled)
+
+            columns[key] = values
+            if missing_rows:
+                missing[key] = list(missing_rows)
+
+        tables[entity] = {'rows': rows, 'columns': columns}
+        if missing:
+            tables[entity]['missing'] = missing
+
+    if reader.offset != len(data):
+        raise ValueError("Yedek dosyasında fazladan veri var")
+    return tables
+
+
+def pack(header: Dict[str, Any], tables: Dict[str, Dict[str, Any]], codec: str = 'zlib') -> bytes:
+    """
+    Build a binary backup from a header and entity column tables.
+
+    Args:
+        header: JSON-serializable header (counts, version, profile, ...)
+        tables: Entity name -> column table
+        codec: Compression codec name ('zlib' or 'lzma')
+
+    Returns:
+        Binary backup bytes
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Desteklenmeyen sıkıştırma türü: {codec}")
+
+    compressed = CODECS[codec][0](_encode_payload(tables))
+
+    header = {**header, 'codec': codec, 'payload_crc32': zlib.crc32(compressed)}
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    return MAGIC + _HEADER_LENGTH.pack(len(header_bytes)) + header_bytes + compressed
+
+
+def is_binary_backup(data: bytes) -> bool:
+    """
+    Check whether raw bytes start with the binary backup signature.
+
+    Args:
+        data: Raw file contents (or at least the first 8 bytes)
+
+    Returns:
+        True if the data is a binary backup
+    """
+    return bytes(data[:len(MAGIC)]) == MAGIC
+
+
+def read_header(data: bytes) -> Tuple[Dict[str, Any], int]:
+    """
+    Read the uncompressed header of a binary backup.
+
+    Args:
+        data: Binary backup bytes (the payload may be omitted)
+
+    Returns:
+        Tuple of (header dictionary, payload offset)
+    """
+    if not is_binary_backup(data):
+        raise ValueError("Dosya DERSLY ikili yedeği değil")
+
+    start = len(MAGIC) + _HEADER_LENGTH.size
+    (header_length,) = _HEADER_LENGTH.unpack(bytes(data[len(MAGIC):start]))
+    header = json.loads(bytes(data[start:start + header_length]).decode('utf-8'))
+    return header, start + header_length
+
+
+def read_header_from_stream(stream, prefix: bytes = b"") -> Dict[str, Any]:
+    """
+    Read the header of a binary backup from a file object.
+    Only the signature, length and header bytes are read; the payload is not.
+
+    Args:
+        stream: Binary file object
+        prefix: Bytes already consumed from the start of the stream
+
+    Returns:
+        Header dictionary
+    """
+    start = prefix + stream.read(len(MAGIC) + _HEADER_LENGTH.size - len(prefix))
+    if not is_binary_backup(start):
+        raise ValueError("Dosya DERSLY ikili yedeği değil")
+    (header_length,) = _HEADER_LENGTH.unpack(start[len(MAGIC):])
+    return json.loads(stream.read(header_length).decode('utf-8'))
+
+
+def unpack(data: bytes) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Read the header and decompress the entity column tables.
+
+    Args:
+        data: Binary backup bytes
+
+    Returns:
+        Tuple of (header dictionary, entity name -> column table)
+    """
+    header, offset = read_header(data)
+
+    codec = header.get('codec')
+    if codec not in CODECS:
+        raise ValueError(f"Desteklenmeyen sıkıştırma türü: {codec}")
+
+    compressed = bytes(data[offset:])
+    expected_crc: Optional[int] = header.get('payload_crc32')
+    if expected_crc is not None and zlib.crc32(compressed) != expected_crc:
+        raise ValueError("Yedek dosyası bozuk (sağlama toplamı uyuşmuyor)")
+
+    try:
+        tables = _decode_payload(CODECS[codec][1](compressed))
+    except (struct.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Yedek dosyası bozuk: {e}") from e
+    return header, tables
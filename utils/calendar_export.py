@@ -5,6 +5,7 @@ Export assignments and courses to iCalendar (.ics) format for mobile calendar in
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 import base64
+from utils.assignment_index import get_due_date
 
 
 class CalendarExport:
@@ -88,14 +89,9 @@ END:VCALENDAR"""
         Returns:
             iCalendar format string
         """
-        # Parse due date
-        due_date_str = assignment.get('due_date', '')
-        try:
-            if 'T' in due_date_str:
-                due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-            else:
-                due_date = datetime.fromisoformat(due_date_str)
-        except:
+        # Cached due date (default to one week ahead if missing)
+        due_date = get_due_date(assignment)
+        if due_date is None:
             due_date = datetime.now() + timedelta(days=7)
         
         # Get assignment details
@@ -288,12 +284,10 @@ METHOD:PUBLISH
         # Add each assignment as an event
         for assignment in assignments:
             try:
-                # Parse due date
-                due_date_str = assignment.get('due_date', '')
-                if 'T' in due_date_str:
-                    due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-                else:
-                    due_date = datetime.fromisoformat(due_date_str)
+                # Cached due date
+                due_date = get_due_date(assignment)
+                if due_date is None:
+                    continue
                 
                 # Get details
                 title = assignment.get('title', 'Ödev')
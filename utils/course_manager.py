@@ -1,19 +1,53 @@
 """
 Course Manager for DERSLY Streamlit application.
-Manages course data operations using session state.
+Manages course data operations through StorageManager.
 """
-import streamlit as st
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from utils.storage_manager import StorageManager
+from utils.versioned_cache import versioned_cache
+from utils.schedule_index import ScheduleIndex
+from utils.week_mask import WeekOccupancy, time_to_minutes
 
 
 class CourseManager:
     """
-    Manages course data in session state.
+    Manages course data in the user's state.
     Provides CRUD operations for courses.
+    Time conflict queries are served from ScheduleIndex.
     """
     
+    @staticmethod
+    def get_schedule_index() -> ScheduleIndex:
+        """
+        Get the schedule index for the current user.
+        Rebuilds it when the courses collection has been replaced
+        (e.g., after import or clearing all data).
+        
+        Returns:
+            ScheduleIndex for the courses collection
+        """
+        StorageManager.initialize_storage()
+        courses = StorageManager.get_collection('courses')
+        
+        state = StorageManager.state()
+        index = state.get('schedule_index')
+        if index is None or index.source is not courses:
+            index = ScheduleIndex(courses)
+            state['schedule_index'] = index
+        
+        return index
+    
+    @staticmethod
+    def get_occupancy() -> WeekOccupancy:
+        """
+        Get the minute-resolution weekly occupancy of the current user's courses.
+        
+        Returns:
+            WeekOccupancy (read-only; maintained by CourseManager)
+        """
+        return CourseManager.get_schedule_index().occupancy
+    
     @staticmethod
     def add_course(course_data: Dict[str, Any]) -> int:
         """
@@ -30,8 +64,7 @@ class CourseManager:
         StorageManager.initialize_storage()
         
         # Get next ID
-        course_id = st.session_state['next_course_id']
-        st.session_state['next_course_id'] += 1
+        course_id = StorageManager.next_id('courses')
         
         # Create course with ID
         course = {
@@ -46,8 +79,9 @@ class CourseManager:
             'created_at': datetime.now().isoformat()
         }
         
-        # Store in session state
-        st.session_state['courses'][course_id] = course
+        # Index first, so the version bump of save_record never exposes a stale schedule
+        CourseManager.get_schedule_index().add(course)
+        StorageManager.save_record('courses', course)
         
         return course_id
     
@@ -63,7 +97,7 @@ class CourseManager:
             Course dictionary if found, None otherwise
         """
         StorageManager.initialize_storage()
-        return st.session_state['courses'].get(course_id)
+        return StorageManager.get_collection('courses').get(course_id)
     
     @staticmethod
     def get_all_courses() -> List[Dict[str, Any]]:
@@ -74,7 +108,7 @@ class CourseManager:
             List of all course dictionaries
         """
         StorageManager.initialize_storage()
-        return list(st.session_state['courses'].values())
+        return list(StorageManager.get_collection('courses').values())
     
     @staticmethod
     def update_course(course_id: int, updates: Dict[str, Any]) -> bool:
@@ -90,7 +124,7 @@ class CourseManager:
         """
         StorageManager.initialize_storage()
         
-        course = st.session_state['courses'].get(course_id)
+        course = StorageManager.get_collection('courses').get(course_id)
         if course is None:
             return False
         
@@ -100,7 +134,8 @@ class CourseManager:
             if key in allowed_fields:
                 course[key] = value
         
-        st.session_state['courses'][course_id] = course
+        CourseManager.get_schedule_index().add(course)
+        StorageManager.save_record('courses', course)
         return True
     
     @staticmethod
@@ -114,14 +149,15 @@ class CourseManager:
         Returns:
             True if deletion successful, False if course not found
         """
-        StorageManager.initialize_storage()
+        index = CourseManager.get_schedule_index()
+        if course_id not in StorageManager.get_collection('courses'):
+            return False
         
-        if course_id in st.session_state['courses']:
-            del st.session_state['courses'][course_id]
-            return True
-        return False
+        index.remove(course_id)
+        return StorageManager.delete_record('courses', course_id)
     
     @staticmethod
+    @versioned_cache('courses')
     def get_courses_by_day(day: str) -> List[Dict[str, Any]]:
         """
         Get courses for specific day.
@@ -135,7 +171,7 @@ class CourseManager:
         StorageManager.initialize_storage()
         
         courses = []
-        for course in st.session_state['courses'].values():
+        for course in StorageManager.get_collection('courses').values():
             if course.get('day') == day:
                 courses.append(course)
         
@@ -153,7 +189,27 @@ class CourseManager:
             Number of courses
         """
         StorageManager.initialize_storage()
-        return len(st.session_state['courses'])
+        return len(StorageManager.get_collection('courses'))
+    
+    @staticmethod
+    def find_conflicts(day: str, start_time: str, end_time: str, exclude_course_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get all courses overlapping a time slot.
+        
+        Args:
+            day: Day of week
+            start_time: Start time in HH:MM format
+            end_time: End time in HH:MM format
+            exclude_course_id: Course ID to exclude from conflict check (for updates)
+        
+        Returns:
+            List of conflicting courses sorted by start time
+        """
+        index = CourseManager.get_schedule_index()
+        courses = StorageManager.get_collection('courses')
+        
+        course_ids = index.overlapping(day, time_to_minutes(start_time), time_to_minutes(end_time), exclude_course_id)
+        return [courses[course_id] for course_id in course_ids]
     
     @staticmethod
     def check_time_conflict(day: str, start_time: str, end_time: str, exclude_course_id: Optional[int] = None) -> tuple[bool, Optional[Dict[str, Any]]]:
@@ -167,39 +223,53 @@ class CourseManager:
             exclude_course_id: Course ID to exclude from conflict check (for updates)
         
         Returns:
-            Tuple of (has_conflict, conflicting_course)
+            Tuple of (has_conflict, first conflicting course)
         """
-        StorageManager.initialize_storage()
-        
-        # Convert times to minutes for easier comparison
-        def time_to_minutes(time_str: str) -> int:
-            hours, minutes = map(int, time_str.split(':'))
-            return hours * 60 + minutes
+        conflicts = CourseManager.find_conflicts(day, start_time, end_time, exclude_course_id)
+        if conflicts:
+            return True, conflicts[0]
+        return False, None
+    
+    @staticmethod
+    def check_conflicts_batch(courses: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        Check a whole timetable (e.g., an import) for time conflicts at once.
+        Each course is checked against existing courses and against the other
+        courses of the batch. A course carrying an existing 'id' replaces that
+        course, so it is not reported as conflicting with itself.
         
-        new_start = time_to_minutes(start_time)
-        new_end = time_to_minutes(end_time)
+        Args:
+            courses: Course dictionaries with day, start_time and end_time
         
-        # Check all courses on the same day
-        for course in st.session_state['courses'].values():
-            # Skip if this is the course being updated
-            if exclude_course_id and course['id'] == exclude_course_id:
-                continue
-            
-            # Only check courses on the same day
-            if course.get('day') != day:
-                continue
+        Returns:
+            List of (batch position, conflicting course) tuples, where the
+            conflicting course is an existing course or another batch entry
+        """
+        index = CourseManager.get_schedule_index()
+        existing = StorageManager.get_collection('courses')
+        replaced = {course['id'] for course in courses if course.get('id') in existing}
+        
+        # Batch entries are indexed by position while they are checked
+        batch_index = ScheduleIndex({})
+        conflicts = []
+        
+        for position, course in enumerate(courses):
+            day = course['day']
+            start = time_to_minutes(course['start_time'])
+            end = time_to_minutes(course['end_time'])
             
-            existing_start = time_to_minutes(course['start_time'])
-            existing_end = time_to_minutes(course['end_time'])
+            for course_id in index.overlapping(day, start, end):
+                if course_id not in replaced:
+                    conflicts.append((position, existing[course_id]))
+            for other in batch_index.overlapping(day, start, end):
+                conflicts.append((position, courses[other]))
             
-            # Check for overlap
-            # Overlap occurs if: new_start < existing_end AND new_end > existing_start
-            if new_start < existing_end and new_end > existing_start:
-                return True, course
+            batch_index.add({**course, 'id': position})
         
-        return False, None
+        return conflicts
     
     @staticmethod
+    @versioned_cache('courses')
     def get_weekly_schedule() -> Dict[str, List[Dict[str, Any]]]:
         """
         Get all courses organized by day of week.
@@ -212,7 +282,7 @@ class CourseManager:
         days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         schedule = {day: [] for day in days}
         
-        for course in st.session_state['courses'].values():
+        for course in StorageManager.get_collection('courses').values():
             day = course.get('day')
             if day in schedule:
                 schedule[day].append(course)
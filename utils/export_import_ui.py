@@ -2,6 +2,7 @@
 Export/Import UI components for DERSLY Streamlit application.
 Provides user interface for data backup and restore operations.
 """
+import io
 import streamlit as st
 import json
 from datetime import datetime
@@ -14,7 +15,7 @@ def show_export_button() -> None:
     Generates JSON file with timestamp and triggers download.
     """
     st.markdown("### 📥 Verileri Dışa Aktar")
-    st.markdown("Tüm verilerinizi JSON dosyası olarak indirin ve yedekleyin.")
+    st.markdown("Tüm verilerinizi JSON (NDJSON) veya sıkıştırılmış yedek dosyası olarak indirin.")
     
     # Get storage info
     info = StorageManager.get_storage_info()
@@ -29,25 +30,43 @@ def show_export_button() -> None:
     - 🔔 Hatırlatıcılar: {info['num_reminders']} adet
     """)
     
+    # Backup format selection
+    export_format = st.radio(
+        "Yedek formatı",
+        ["JSON (NDJSON)", "Sıkıştırılmış (.dersly)"],
+        horizontal=True,
+        help="Sıkıştırılmış format çok daha küçük dosyalar üretir ve daha hızlı içe aktarılır"
+    )
+    
     # Export button
     if st.button("📥 Verileri İndir", type="primary", use_container_width=True):
         try:
-            # Get export data
-            export_data = StorageManager.export_data()
-            
-            # Convert to JSON
-            json_str = json.dumps(export_data, indent=2, ensure_ascii=False)
-            
             # Generate filename with timestamp
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            filename = f"dersly_backup_{timestamp}.json"
+            
+            if export_format.startswith("JSON"):
+                # Encode records line by line into a single buffer. st.download_button
+                # serves the finished file from memory, so one encoded copy of the
+                # backup is held until the download is done (no intermediate
+                # string list or joined copy).
+                export_bytes = io.BytesIO()
+                for line in StorageManager.export_ndjson():
+                    export_bytes.write(line.encode('utf-8'))
+                export_bytes.seek(0)
+                filename = f"dersly_backup_{timestamp}.ndjson"
+                mime = "application/x-ndjson"
+            else:
+                # Columnar, compressed backup
+                export_bytes = StorageManager.export_binary(codec='lzma')
+                filename = f"dersly_backup_{timestamp}.dersly"
+                mime = "application/octet-stream"
             
             # Create download button
             st.download_button(
                 label="💾 Dosyayı Kaydet",
-                data=json_str,
+                data=export_bytes,
                 file_name=filename,
-                mime="application/json",
+                mime=mime,
                 use_container_width=True
             )
             
@@ -72,7 +91,7 @@ def show_import_button() -> None:
     Shows file uploader with validation and confirmation dialog.
     """
     st.markdown("### 📤 Verileri İçe Aktar")
-    st.markdown("Daha önce dışa aktardığınız JSON dosyasını yükleyin.")
+    st.markdown("Daha önce dışa aktardığınız JSON, NDJSON veya .dersly dosyasını yükleyin.")
     
     # Warning about overwriting data
     has_data = StorageManager.has_data()
@@ -81,26 +100,45 @@ def show_import_button() -> None:
     
     # File uploader
     uploaded_file = st.file_uploader(
-        "JSON dosyası seçin",
-        type=['json'],
+        "Yedek dosyası seçin",
+        type=['json', 'ndjson', 'dersly'],
         help="Daha önce dışa aktardığınız DERSLY yedek dosyasını seçin"
     )
     
     if uploaded_file is not None:
         try:
-            # Read and parse JSON
-            json_str = uploaded_file.read().decode('utf-8')
-            import_data = json.loads(json_str)
+            # Streamed and binary backups are previewed from their header only
+            header = StorageManager.read_backup_header(uploaded_file)
+            uploaded_file.seek(0)
+            
+            if header is not None:
+                import_data = None
+                if header.get('format') == StorageManager.BINARY_FORMAT:
+                    import_data = uploaded_file.getvalue()
+                counts = header.get('counts', {})
+                preview = {
+                    'user_profile': header.get('user_profile'),
+                    'exported_at': header.get('exported_at'),
+                    **{entity: counts.get(entity, 0) for entity in StorageManager.COLLECTIONS}
+                }
+            else:
+                # Legacy single-document JSON backup
+                import_data = json.load(uploaded_file)
+                preview = {
+                    'user_profile': import_data.get('user_profile'),
+                    'exported_at': import_data.get('exported_at'),
+                    **{entity: len(import_data.get(entity, [])) for entity in StorageManager.COLLECTIONS}
+                }
             
             # Show preview of data
             st.info(f"""
             **Dosyada bulunan veriler:**
-            - 👤 Kullanıcı Profili: {'✅ Var' if import_data.get('user_profile') else '❌ Yok'}
-            - 📚 Dersler: {len(import_data.get('courses', []))} adet
-            - 📝 Ödevler: {len(import_data.get('assignments', []))} adet
-            - 📊 Notlar: {len(import_data.get('grades', []))} adet
-            - 🔔 Hatırlatıcılar: {len(import_data.get('reminders', []))} adet
-            - 📅 Dışa aktarma tarihi: {import_data.get('exported_at', 'Bilinmiyor')}
+            - 👤 Kullanıcı Profili: {'✅ Var' if preview['user_profile'] else '❌ Yok'}
+            - 📚 Dersler: {preview['courses']} adet
+            - 📝 Ödevler: {preview['assignments']} adet
+            - 📊 Notlar: {preview['grades']} adet
+            - 🔔 Hatırlatıcılar: {preview['reminders']} adet
+            - 📅 Dışa aktarma tarihi: {preview['exported_at'] or 'Bilinmiyor'}
             """)
             
             # Confirmation required if data exists
@@ -121,7 +159,10 @@ def show_import_button() -> None:
             with col2:
                 if st.button("📤 Verileri İçe Aktar", type="primary", use_container_width=True):
                     # Perform import
-                    success, message = StorageManager.import_data(import_data)
+                    if import_data is None:
+                        success, message = StorageManager.import_ndjson(uploaded_file)
+                    else:
+                        success, message = StorageManager.import_data(import_data)
                     
                     if success:
                         st.success(message)
@@ -147,6 +188,43 @@ def show_import_button() -> None:
             pass
 
 
+def show_recovery_code() -> None:
+    """
+    Display the session's recovery code.
+    The code is the only way back to this data from a new session or
+    another device, so it is shown on demand rather than always.
+    """
+    st.markdown("### 🔑 Kurtarma Kodu")
+    st.markdown(
+        "Bu kodu güvenli bir yerde saklayın. Sayfayı yenilediğinizde veya başka bir cihazda "
+        "**Kurtarma koduyla devam et** bölümüne girerek verilerinize geri dönebilirsiniz."
+    )
+    st.warning("⚠️ Kodu bilen herkes verilerinize erişebilir; kimseyle paylaşmayın.")
+    
+    if st.checkbox("Kurtarma kodunu göster", key="show_recovery_code"):
+        st.code(StorageManager.get_tenant_handle(), language=None)
+
+
+def show_session_restore() -> None:
+    """
+    Display the form that attaches this session to an existing recovery code.
+    """
+    st.markdown("### 🔁 Kurtarma Koduyla Devam Et")
+    st.markdown("Daha önce kaydettiğiniz kurtarma kodunu girerek verilerinize geri dönün.")
+    
+    with st.form("restore_session_form"):
+        code = st.text_input("🔑 Kurtarma Kodu", type="password")
+        submitted = st.form_submit_button("🔁 Devam Et", use_container_width=True)
+    
+    if submitted:
+        success, message = StorageManager.restore_session(code)
+        if success:
+            st.success(message)
+            st.rerun()
+        else:
+            st.error(message)
+
+
 def show_clear_data_button() -> None:
     """
     Display clear data button with strong warning and confirmation.
@@ -239,7 +317,13 @@ def show_storage_info() -> None:
     else:
         size_str = f"{info['size_mb']} MB"
     
-    st.caption(f"Tahmini depolama boyutu: {size_str}")
+    st.caption(f"Bellekteki veri boyutu: {size_str}")
+    
+    # Per-entity breakdown
+    entity_labels = {'courses': '📚 Dersler', 'assignments': '📝 Ödevler', 'grades': '📊 Notlar', 'reminders': '🔔 Hatırlatıcılar'}
+    st.caption(" · ".join(
+        f"{entity_labels[entity]}: {round(size / 1024, 1)} KB" for entity, size in info['entity_bytes'].items()
+    ))
     
     # Storage warning (if approaching limits)
     # Assuming 5MB limit for session state (conservative estimate)
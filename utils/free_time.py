@@ -0,0 +1,138 @@
+"""
+Free Time Finder for DERSLY Streamlit application.
+Computes free study windows between now and each pending deadline from the
+weekly course occupancy (see utils/week_mask.py) and the assignment index.
+"""
+import bisect
+from datetime import datetime, timedelta, time
+from typing import Optional, Dict, Any, List, Tuple
+from utils.storage_manager import StorageManager
+from utils.course_manager import CourseManager
+from utils.assignment_manager import AssignmentManager
+from utils.versioned_cache import versioned_cache
+from utils.week_mask import free_runs, time_to_minutes
+
+Window = Tuple[datetime, datetime]
+
+
+class FreeTimeFinder:
+    """
+    Finds study time before assignment deadlines.
+    Free windows are the minutes inside daily study hours that no course
+    occupies. They are generated once, in time order, for the whole horizon
+    and then swept together with the deadlines (also in time order), so
+    each deadline costs a bisect instead of a walk over the schedule.
+    """
+    
+    @staticmethod
+    def free_windows(start: datetime, end: datetime, day_start: str = "08:00",
+                     day_end: str = "23:00", min_minutes: int = 30) -> List[Window]:
+        """
+        Get free windows between two moments.
+        
+        Args:
+            start: Range start
+            end: Range end
+            day_start: Earliest study time of a day (HH:MM)
+            day_end: Latest study time of a day (HH:MM, "24:00" for midnight)
+            min_minutes: Shortest window to report
+        
+        Returns:
+            List of (start, end) windows ordered by start
+        """
+        occupancy = CourseManager.get_occupancy()
+        first_minute = time_to_minutes(day_start)
+        last_minute = time_to_minutes(day_end)
+        
+        # Free minute ranges of each weekday, computed once from the bitsets
+        runs_by_weekday = [free_runs(bits, first_minute, last_minute) for bits in occupancy.days]
+        
+        windows: List[Window] = []
+        date = start.date()
+        while date <= end.date():
+            midnight = datetime.combine(date, time())
+            for run_start, run_end in runs_by_weekday[date.weekday()]:
+                window_start = max(midnight + timedelta(minutes=run_start), start)
+                window_end = min(midnight + timedelta(minutes=run_end), end)
+                if window_end <= window_start:
+                    continue
+                if windows and windows[-1][1] == window_start:
+                    # Free time continuing past midnight
+                    windows[-1] = (windows[-1][0], window_end)
+                else:
+                    windows.append((window_start, window_end))
+            date += timedelta(days=1)
+        
+        min_length = timedelta(minutes=min_minutes)
+        return [window for window in windows if window[1] - window[0] >= min_length]
+    
+    @staticmethod
+    def get_study_windows(days: Optional[int] = None, min_minutes: int = 30,
+                          day_start: str = "08:00", day_end: str = "23:00") -> List[Dict[str, Any]]:
+        """
+        Get free study windows before each pending deadline.
+        Results are cached until courses or assignments change (and for at
+        most one minute, since they start at the current time).
+        
+        Args:
+            days: Only include deadlines in the next N days (default: all)
+            min_minutes: Shortest window to report
+            day_start: Earliest study time of a day (HH:MM)
+            day_end: Latest study time of a day (HH:MM)
+        
+        Returns:
+            List ordered by due date of dictionaries with 'assignment',
+            'due_date', 'windows' (list of (start, end) datetimes) and
+            'free_minutes'
+        """
+        now = datetime.now().replace(second=0, microsecond=0)
+        return FreeTimeFinder._study_windows(now, days, min_minutes, day_start, day_end)
+    
+    @staticmethod
+    @versioned_cache('courses', 'assignments', maxsize=32)
+    def _study_windows(now: datetime, days: Optional[int], min_minutes: int,
+                       day_start: str, day_end: str) -> List[Dict[str, Any]]:
+        """Compute get_study_windows() for a fixed current time."""
+        index = AssignmentManager.get_index()
+        assignments = StorageManager.get_collection('assignments')
+        until = now + timedelta(days=days) if days is not None else datetime.max
+        
+        # Pending deadlines in due-date order
+        deadlines = [
+            (index.entries[assignment_id][2], assignments[assignment_id])
+            for assignment_id in index.ids_due_between(now, until)
+            if index.status_of(assignment_id) != 'completed'
+        ]
+        if not deadlines:
+            return []
+        
+        windows = FreeTimeFinder.free_windows(now, deadlines[-1][0], day_start, day_end, min_minutes)
+        window_ends = [window[1] for window in windows]
+        
+        # Prefix sums of free minutes, so each deadline's total is O(1)
+        totals = [0]
+        for window_start, window_end in windows:
+            totals.append(totals[-1] + int((window_end - window_start).total_seconds() // 60))
+        
+        min_length = timedelta(minutes=min_minutes)
+        results = []
+        for due_date, assignment in deadlines:
+            # Windows ending by the deadline are complete; the next one may be cut
+            complete = bisect.bisect_right(window_ends, due_date)
+            due_windows = windows[:complete]
+            free_minutes = totals[complete]
+            
+            if complete < len(windows) and windows[complete][0] < due_date:
+                partial = (windows[complete][0], due_date)
+                if partial[1] - partial[0] >= min_length:
+                    due_windows.append(partial)
+                    free_minutes += int((partial[1] - partial[0]).total_seconds() // 60)
+            
+            results.append({
+                'assignment': assignment,
+                'due_date': due_date,
+                'windows': due_windows,
+                'free_minutes': free_minutes
+            })
+        
+        return results
@@ -0,0 +1,293 @@
+"""
+GPA Engine for DERSLY Streamlit application.
+Keeps grades in NumPy columns (points, credits, semester codes) together with
+semester-ordered totals and prefix sums, so overall, per-semester and
+cumulative GPA are available without rescanning the grades.
+"""
+import bisect
+from typing import Optional, Dict, Any, List, Tuple
+import numpy as np
+
+
+# Semester label: (semester name, year)
+Semester = Tuple[str, int]
+
+
+def semester_sort_key(label: Semester) -> tuple:
+    """Order semesters by year, then name (the order of GradeManager.get_semesters)."""
+    return label[1], label[0]
+
+
+def _ratio(points: float, credits: float) -> float:
+    """Credit-weighted average rounded like GradeManager (0.0 without credits)."""
+    if credits == 0:
+        return 0.0
+    return round(float(points) / float(credits), 2)
+
+
+def _trend(change: float) -> str:
+    """Direction of a GPA change at the displayed precision."""
+    if change > 0.005:
+        return 'up'
+    if change < -0.005:
+        return 'down'
+    return 'flat'
+
+
+class GradeColumns:
+    """
+    Columnar copy of the grades collection.
+    Each grade is one row of parallel arrays; grade and credit values are
+    converted once when the row is written. Rows are appended into spare
+    capacity and deleted by moving the last row into the gap.
+
+    Semester codes are positions in chronological order. Per-semester
+    totals and their prefix sums are kept in arrays of that order: a grade
+    change adjusts its semester's totals and the prefix sums from that
+    semester on, so the GPA timeline is O(semesters) to read and update.
+    """
+
+    def __init__(self, source: Dict[int, Dict[str, Any]]):
+        """
+        Build columns for a grades collection.
+
+        Args:
+            source: Grades dictionary keyed by ID
+        """
+        # Collection the columns were built from (replaced on import/clear)
+        self.source = source
+
+        grades = list(source.values())
+        self.size = len(grades)
+        capacity = max(16, self.size)
+
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.points = np.zeros(capacity, dtype=np.float64)
+        self.credits = np.zeros(capacity, dtype=np.int64)
+        self.semester_codes = np.full(capacity, -1, dtype=np.int64)
+
+        # id -> row
+        self.rows: Dict[int, int] = {}
+
+        # Semester labels in chronological order (index = semester code)
+        self.labels: List[Semester] = sorted(
+            {label for label in map(self._label, grades) if label is not None},
+            key=semester_sort_key
+        )
+        self._keys = [semester_sort_key(label) for label in self.labels]
+        codes = {label: code for code, label in enumerate(self.labels)}
+
+        for row, grade in enumerate(grades):
+            label = self._label(grade)
+            self._write(row, grade, codes[label] if label is not None else -1)
+
+        # Bulk build of the totals with grouped reductions
+        size = self.size
+        weighted = self.points[:size] * self.credits[:size]
+        codes_column = self.semester_codes[:size]
+        dated = codes_column >= 0
+        count = len(self.labels)
+
+        self.total_points = float(weighted.sum())
+        self.total_credits = int(self.credits[:size].sum())
+        self.semester_points = np.bincount(
+            codes_column[dated], weights=weighted[dated], minlength=count
+        ).astype(np.float64)
+        self.semester_credits = np.bincount(
+            codes_column[dated], weights=self.credits[:size][dated], minlength=count
+        ).astype(np.float64)
+        self.semester_counts = np.bincount(codes_column[dated], minlength=count).astype(np.int64)
+        self.prefix_points = np.cumsum(self.semester_points)
+        self.prefix_credits = np.cumsum(self.semester_credits)
+
+    @staticmethod
+    def _label(grade: Dict[str, Any]) -> Optional[Semester]:
+        semester = grade.get('semester')
+        year = grade.get('year')
+        if not (semester and year):
+            return None
+        return semester, year
+
+    def _semester_code(self, label: Optional[Semester]) -> int:
+        """Get the code of a semester, inserting it in chronological order if new."""
+        if label is None:
+            return -1
+
+        key = semester_sort_key(label)
+        position = bisect.bisect_left(self._keys, key)
+        if position < len(self.labels) and self.labels[position] == label:
+            return position
+
+        # New semester: later codes shift by one
+        self.labels.insert(position, label)
+        self._keys.insert(position, key)
+        codes = self.semester_codes[:self.size]
+        codes[codes >= position] += 1
+
+        prefix_points = self.prefix_points[position - 1] if position else 0.0
+        prefix_credits = self.prefix_credits[position - 1] if position else 0.0
+        self.semester_points = np.insert(self.semester_points, position, 0.0)
+        self.semester_credits = np.insert(self.semester_credits, position, 0.0)
+        self.semester_counts = np.insert(self.semester_counts, position, 0)
+        self.prefix_points = np.insert(self.prefix_points, position, prefix_points)
+        self.prefix_credits = np.insert(self.prefix_credits, position, prefix_credits)
+        return position
+
+    def _write(self, row: int, grade: Dict[str, Any], code: int) -> None:
+        self.ids[row] = grade['id']
+        self.points[row] = float(grade.get('grade', 0))
+        self.credits[row] = int(grade.get('credits', 0))
+        self.semester_codes[row] = code
+        self.rows[grade['id']] = row
+
+    def _account(self, row: int, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) a row's contribution to the totals."""
+        credits = int(self.credits[row])
+        weighted = float(self.points[row]) * credits
+        self.total_points += sign * weighted
+        self.total_credits += sign * credits
+
+        code = int(self.semester_codes[row])
+        if code >= 0:
+            self.semester_points[code] += sign * weighted
+            self.semester_credits[code] += sign * credits
+            self.semester_counts[code] += sign
+            self.prefix_points[code:] += sign * weighted
+            self.prefix_credits[code:] += sign * credits
+
+    def _grow(self) -> None:
+        capacity = len(self.ids) * 2
+        for name in ('ids', 'points', 'credits', 'semester_codes'):
+            column = getattr(self, name)
+            grown = np.full(capacity, -1 if name == 'semester_codes' else 0, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+
+    def add(self, grade: Dict[str, Any]) -> None:
+        """
+        Write a new or updated grade.
+
+        Args:
+            grade: Grade dictionary
+        """
+        code = self._semester_code(self._label(grade))
+
+        row = self.rows.get(grade['id'])
+        if row is None:
+            if self.size == len(self.ids):
+                self._grow()
+            row = self.size
+            self.size += 1
+        else:
+            self._account(row, -1)
+
+        self._write(row, grade, code)
+        self._account(row, 1)
+
+    def remove(self, grade_id: int) -> None:
+        """
+        Remove a grade.
+
+        Args:
+            grade_id: Grade ID
+        """
+        row = self.rows.pop(grade_id, None)
+        if row is None:
+            return
+
+        self._account(row, -1)
+        last = self.size - 1
+        if row != last:
+            for column in (self.ids, self.points, self.credits, self.semester_codes):
+                column[row] = column[last]
+            self.rows[int(self.ids[row])] = row
+        self.semester_codes[last] = -1
+        self.size = last
+
+    def timeline(self) -> List[Dict[str, Any]]:
+        """
+        Get the GPA of each semester and the running GPA after it.
+        Reads only the semester totals and prefix sums: O(semesters).
+
+        Returns:
+            List ordered by (year, semester) of dictionaries with semester,
+            year, gpa, credits, grade_count, cumulative_gpa,
+            cumulative_credits, gpa_change and cumulative_change (versus the
+            previous semester, 0.0 for the first) and trend ('up', 'down' or
+            'flat', for the cumulative GPA). Semesters without grades are
+            omitted.
+        """
+        entries = []
+        previous = None
+        for code, (semester, year) in enumerate(self.labels):
+            if not self.semester_counts[code]:
+                continue
+
+            gpa = _ratio(self.semester_points[code], self.semester_credits[code])
+            cumulative_gpa = _ratio(self.prefix_points[code], self.prefix_credits[code])
+            gpa_change = round(gpa - previous['gpa'], 2) if previous else 0.0
+            cumulative_change = round(cumulative_gpa - previous['cumulative_gpa'], 2) if previous else 0.0
+
+            previous = {
+                'semester': semester,
+                'year': year,
+                'gpa': gpa,
+                'credits': int(round(self.semester_credits[code])),
+                'grade_count': int(self.semester_counts[code]),
+                'cumulative_gpa': cumulative_gpa,
+                'cumulative_credits': int(round(self.prefix_credits[code])),
+                'gpa_change': gpa_change,
+                'cumulative_change': cumulative_change,
+                'trend': _trend(cumulative_change)
+            }
+            entries.append(previous)
+        return entries
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get overall GPA with the semester timeline and each semester's grades.
+
+        Returns:
+            Dictionary with 'gpa', 'total_credits', 'grade_count' and
+            'semesters' (the timeline() entries, each with 'grade_ids').
+            GPAs are rounded to two decimals.
+        """
+        size = self.size
+        codes = self.semester_codes[:size]
+        dated = codes >= 0
+
+        # Grade IDs grouped by semester code
+        grouped_ids = np.split(
+            self.ids[:size][dated][np.argsort(codes[dated], kind='stable')],
+            np.cumsum(self.semester_counts)[:-1]
+        )
+
+        semesters = self.timeline()
+        non_empty = [code for code in range(len(self.labels)) if self.semester_counts[code]]
+        for entry, code in zip(semesters, non_empty):
+            entry['grade_ids'] = grouped_ids[code].tolist()
+
+        return {
+            'gpa': _ratio(self.total_points, self.total_credits),
+            'total_credits': self.total_credits,
+            'grade_count': size,
+            'semesters': semesters
+        }
+
+
+def find_semester(summary: Dict[str, Any], semester: str, year: int) -> Optional[Dict[str, Any]]:
+    """
+    Get one semester's entry of a GPA summary.
+
+    Args:
+        summary: Result of GradeColumns.summary()
+        semester: Semester name (e.g., "Fall")
+        year: Year (e.g., 2024)
+
+    Returns:
+        Semester dictionary, or None if the semester has no grades
+    """
+    for entry in summary['semesters']:
+        if entry['semester'] == semester and entry['year'] == year:
+            return entry
+    return None
@@ -0,0 +1,227 @@
+"""
+GPA Simulator for DERSLY Streamlit application.
+Answers "what if" questions about planned courses: the projected GNO for
+expected grades, the grades needed to reach a target GNO and the letter
+grade combinations that reach it.
+"""
+from typing import Optional, Dict, Any, List, Tuple
+from utils.gpa_systems import GPASystem, CompiledScale
+from utils.grade_manager import GradeManager
+
+# Tolerance for comparing point sums
+EPSILON = 1e-9
+
+
+class GPASimulator:
+    """
+    What-if GPA calculations on top of the current transcript.
+    The current grade points and credits are read from the running totals
+    of GradeColumns (updated on every grade change), so a simulation only
+    costs work proportional to the planned courses.
+    """
+    
+    @staticmethod
+    def get_current_totals() -> Tuple[float, int]:
+        """
+        Get the credit-weighted grade points and credits of the transcript.
+        
+        Returns:
+            Tuple of (total grade points, total credits)
+        """
+        columns = GradeManager.get_columns()
+        return columns.total_points, columns.total_credits
+    
+    @staticmethod
+    def required_average(target_gpa: float, planned_credits: int,
+                         current: Optional[Tuple[float, int]] = None) -> Optional[float]:
+        """
+        Get the average grade the planned credits need for a target GNO.
+        Closed form: (target * (C + P) - points) / P.
+        
+        Args:
+            target_gpa: Target GNO
+            planned_credits: Total credits of the planned courses
+            current: (grade points, credits) to start from (default: transcript)
+        
+        Returns:
+            Required average (may be above the scale or below zero), or None
+            without planned credits
+        """
+        if planned_credits <= 0:
+            return None
+        
+        points, credits = current if current is not None else GPASimulator.get_current_totals()
+        return (target_gpa * (credits + planned_credits) - points) / planned_credits
+    
+    @staticmethod
+    def simulate(planned: List[Dict[str, Any]], target_gpa: Optional[float] = None,
+                 system_name: str = "4.0 Çift Harf") -> Dict[str, Any]:
+        """
+        Project the GNO with planned courses and solve for a target.
+        
+        Args:
+            planned: Planned courses with credits and an optional expected
+                'grade' (letter in the system); courses without a grade are
+                the ones solved for
+            target_gpa: Target GNO (optional)
+            system_name: GPA system of the letters
+        
+        Returns:
+            Dictionary with:
+                - current_gpa, current_credits
+                - projected_gpa: GNO with the expected grades (courses without
+                  a grade are left out), rounded to two decimals
+                - projected_credits
+                - required_average: Average needed on the open courses (None
+                  without a target or open courses)
+                - required_letter: Lowest letter reaching that average in every
+                  open course (None if none does)
+                - feasible: Whether the target can be reached (None without target)
+                - courses: Planned courses, each open one with 'min_point' and
+                  'min_letter': its lowest grade if every other open course
+                  gets the top grade
+        """
+        compiled = GPASystem.compile(system_name)
+        max_point = compiled.max_point
+        
+        points, credits = GPASimulator.get_current_totals()
+        current_gpa = round(points / credits, 2) if credits else 0.0
+        current_credits = credits
+        
+        # Fold expected grades into the running totals
+        open_credits = 0
+        for course in planned:
+            if course.get('grade'):
+                points += GPASystem.grade_to_point(course['grade'], system_name) * course['credits']
+                credits += course['credits']
+            else:
+                open_credits += course['credits']
+        
+        result = {
+            'current_gpa': current_gpa,
+            'current_credits': current_credits,
+            'projected_gpa': round(points / credits, 2) if credits else 0.0,
+            'projected_credits': credits,
+            'required_average': None,
+            'required_letter': None,
+            'feasible': None,
+            'courses': [dict(course) for course in planned]
+        }
+        
+        if target_gpa is None:
+            return result
+        
+        if not open_credits:
+            result['feasible'] = credits > 0 and points / credits >= target_gpa - EPSILON
+            return result
+        
+        required = GPASimulator.required_average(target_gpa, open_credits, (points, credits))
+        result['required_average'] = round(required, 2)
+        result['feasible'] = required <= max_point + EPSILON
+        result['required_letter'] = GPASimulator._lowest_letter(compiled, required)
+        
+        # Points still needed from the open courses
+        needed = required * open_credits
+        for course in result['courses']:
+            if course.get('grade'):
+                continue
+            others = open_credits - course['credits']
+            min_point = max(0.0, (needed - max_point * others) / course['credits'])
+            course['min_point'] = round(min_point, 2)
+            course['min_letter'] = GPASimulator._lowest_letter(compiled, min_point)
+        
+        return result
+    
+    @staticmethod
+    def _lowest_letter(compiled: CompiledScale, point: float) -> Optional[str]:
+        """Get the lowest letter whose point is at least `point`, or None."""
+        for value in compiled.sorted_points.tolist():
+            if value >= point - EPSILON:
+                return compiled.letter_for_point[value]
+        return None
+    
+    @staticmethod
+    def letter_combinations(planned: List[Dict[str, Any]], target_gpa: float,
+                            system_name: str = "4.0 Çift Harf", min_point: float = 0.0,
+                            limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Enumerate the minimal letter grades of the planned courses that reach a target.
+        A combination is minimal when lowering any single grade by one step
+        misses the target. Branches are cut as soon as the top grade in every
+        remaining course can no longer reach the target, and once the target
+        is met the remaining courses take the lowest grade.
+        
+        Args:
+            planned: Planned courses with credits (expected grades are ignored)
+            target_gpa: Target GNO
+            system_name: GPA system of the letters
+            min_point: Lowest grade point to consider (e.g., the passing grade)
+            limit: Maximum number of combinations returned
+        
+        Returns:
+            Up to `limit` combinations (the first found, lower grades first)
+            ordered by projected GNO, each with 'grades' (letters in planned
+            order) and 'gpa'
+        """
+        compiled = GPASystem.compile(system_name)
+        values = [value for value in compiled.sorted_points.tolist() if value >= min_point - EPSILON]
+        if not planned or not values:
+            return []
+        
+        points, credits = GPASimulator.get_current_totals()
+        planned_credits = [course['credits'] for course in planned]
+        total_credits = credits + sum(planned_credits)
+        if total_credits == 0:
+            return []
+        
+        # Grade points the planned courses must add
+        needed = target_gpa * total_credits - points
+        top = values[-1]
+        
+        # Branch on heavier courses first: they move the GNO the most
+        order = sorted(range(len(planned)), key=lambda i: -planned_credits[i])
+        remaining_credits = [0] * (len(order) + 1)
+        for depth in range(len(order) - 1, -1, -1):
+            remaining_credits[depth] = remaining_credits[depth + 1] + planned_credits[order[depth]]
+        
+        steps = {value: step for step, value in enumerate(values)}
+        found: List[Tuple[float, List[float]]] = []
+        chosen = [0.0] * len(planned)
+        
+        def is_minimal(total: float) -> bool:
+            for position, value in enumerate(chosen):
+                step = steps[value]
+                if step and total - (value - values[step - 1]) * planned_credits[position] >= needed - EPSILON:
+                    return False
+            return True
+        
+        def search(depth: int, total: float) -> None:
+            if len(found) >= limit:
+                return
+            if total + top * remaining_credits[depth] < needed - EPSILON:
+                return
+            
+            if total >= needed - EPSILON:
+                # Target met: the rest take the lowest grade
+                for rest in order[depth:]:
+                    chosen[rest] = values[0]
+                total += values[0] * remaining_credits[depth]
+                if is_minimal(total):
+                    found.append((total, list(chosen)))
+                return
+            
+            position = order[depth]
+            for value in values:
+                chosen[position] = value
+                search(depth + 1, total + value * planned_credits[position])
+        
+        search(0, 0.0)
+        
+        found.sort(key=lambda item: item[0])
+        return [
+            {
+                'grades': [compiled.letter_for_point[value] for value in grades],
+                'gpa': round((points + total) / total_credits, 2)
+            }
+            for total, grades in found[:limit]
+        ]
@@ -2,7 +2,57 @@
 GPA Calculation Systems for DERSLY.
 Support for different grading scales used by Turkish universities.
 """
-from typing import Dict, List, Tuple
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+
+class CompiledScale:
+    """
+    Lookup tables of one grade scale, built once per system.
+    Letter grades are interned and numbered in scale order; `points[code]`
+    is the point value of a letter and the extra last entry (0.0) stands for
+    unknown grades, so whole transcripts can be encoded and reduced with
+    NumPy instead of per-grade dictionary lookups.
+    """
+    
+    def __init__(self, name: str, system: Dict):
+        """
+        Compile a system from GPASystem.SYSTEMS.
+        
+        Args:
+            name: System name
+            system: System configuration
+        """
+        self.name = name
+        self.letters: Tuple[str, ...] = tuple(sys.intern(letter) for letter in system['scale'])
+        self.codes: Dict[str, int] = {letter: code for code, letter in enumerate(self.letters)}
+        self.unknown_code = len(self.letters)
+        self.points = np.array([*system['scale'].values(), 0.0], dtype=np.float64)
+        self.max_point = float(self.points.max())
+        
+        # Reverse map: point -> first letter with that point in scale order
+        self.letter_for_point: Dict[float, str] = {}
+        for letter, point in system['scale'].items():
+            self.letter_for_point.setdefault(point, letter)
+        
+        # Distinct points ascending, with their letter codes, for nearest-lower lookups
+        self.sorted_points = np.array(sorted(self.letter_for_point), dtype=np.float64)
+        self.sorted_codes = np.array(
+            [self.codes[self.letter_for_point[point]] for point in self.sorted_points.tolist()],
+            dtype=np.int64
+        )
+    
+    def encode(self, grades: Sequence[str]) -> np.ndarray:
+        """Convert letter grades to codes (unknown grades get `unknown_code`)."""
+        codes = self.codes
+        unknown = self.unknown_code
+        return np.fromiter((codes.get(grade, unknown) for grade in grades), dtype=np.int64, count=len(grades))
+    
+    def codes_for(self, points: np.ndarray) -> np.ndarray:
+        """Map points to the code of the letter with the highest point not above each value."""
+        positions = np.searchsorted(self.sorted_points, points + 1e-9, side='right') - 1
+        return self.sorted_codes[np.clip(positions, 0, len(self.sorted_points) - 1)]
 
 
 class GPASystem:
@@ -105,6 +155,50 @@ class GPASystem:
         "Yıldız Teknik Üniversitesi": "4.0 Çift Harf"
     }
     
+    # Compiled lookup tables by system name (built on first use)
+    _compiled: Dict[str, CompiledScale] = {}
+    
+    # Source code -> target code tables by (source, target) system name
+    _conversions: Dict[Tuple[str, str], np.ndarray] = {}
+    
+    @staticmethod
+    def compile(system_name: str) -> CompiledScale:
+        """Get the compiled lookup tables of a system (unknown names use the default system)."""
+        compiled = GPASystem._compiled.get(system_name)
+        if compiled is None:
+            if system_name not in GPASystem.SYSTEMS:
+                return GPASystem.compile("4.0 Çift Harf")
+            compiled = CompiledScale(system_name, GPASystem.SYSTEMS[system_name])
+            GPASystem._compiled[system_name] = compiled
+        return compiled
+    
+    @staticmethod
+    def conversion_table(from_system: str, to_system: str) -> np.ndarray:
+        """
+        Get the letter conversion table between two systems (built once per pair).
+        Each source letter's point is scaled by the systems' highest points
+        (e.g., 4.0 vs 5.0) and mapped to the target letter with the highest
+        point not above the scaled value.
+        
+        Args:
+            from_system: Source system name
+            to_system: Target system name
+        
+        Returns:
+            Array of target letter codes indexed by source letter code; the
+            source unknown code maps to the target unknown code
+        """
+        source = GPASystem.compile(from_system)
+        target = GPASystem.compile(to_system)
+        key = (source.name, target.name)
+        
+        table = GPASystem._conversions.get(key)
+        if table is None:
+            scaled = source.points[:-1] * (target.max_point / source.max_point)
+            table = np.append(target.codes_for(scaled), target.unknown_code)
+            GPASystem._conversions[key] = table
+        return table
+    
     @staticmethod
     def get_system_names() -> List[str]:
         """Get list of available system names."""
@@ -124,8 +218,8 @@ class GPASystem:
     @staticmethod
     def grade_to_point(grade: str, system_name: str) -> float:
         """Convert grade to GPA point."""
-        system = GPASystem.get_system(system_name)
-        return system['scale'].get(grade, 0.0)
+        compiled = GPASystem.compile(system_name)
+        return float(compiled.points[compiled.codes.get(grade, compiled.unknown_code)])
     
     @staticmethod
     def calculate_gpa(grades: List[Tuple[str, int]], system_name: str) -> float:
@@ -142,18 +236,35 @@ class GPASystem:
         if not grades:
             return 0.0
         
-        total_points = 0.0
-        total_credits = 0
-        
-        for grade, credits in grades:
-            point = GPASystem.grade_to_point(grade, system_name)
-            total_points += point * credits
-            total_credits += credits
+        compiled = GPASystem.compile(system_name)
+        letters, credits = zip(*grades)
+        credits = np.asarray(credits, dtype=np.float64)
         
+        total_credits = credits.sum()
         if total_credits == 0:
             return 0.0
         
-        return total_points / total_credits
+        return float(compiled.points[compiled.encode(letters)] @ credits / total_credits)
+    
+    @staticmethod
+    def convert_grades(grades: Sequence[str], from_system: str, to_system: str) -> List[Optional[str]]:
+        """
+        Convert a whole transcript of letter grades between systems
+        (see conversion_table).
+        
+        Args:
+            grades: Letter grades in the source system
+            from_system: Source system name
+            to_system: Target system name
+        
+        Returns:
+            Target letter grades in input order (None for unknown source grades)
+        """
+        source = GPASystem.compile(from_system)
+        target_letters = GPASystem.compile(to_system).letters
+        
+        converted = GPASystem.conversion_table(from_system, to_system)[source.encode(grades)]
+        return [target_letters[code] if code < len(target_letters) else None for code in converted.tolist()]
     
     @staticmethod
     def get_university_system(university: str) -> str:
@@ -169,8 +280,7 @@ class GPASystem:
     @staticmethod
     def validate_grade(grade: str, system_name: str) -> bool:
         """Check if grade is valid for the system."""
-        system = GPASystem.get_system(system_name)
-        return grade in system['scale']
+        return grade in GPASystem.compile(system_name).codes
     
     @staticmethod
     def get_passing_grade(system_name: str) -> float:
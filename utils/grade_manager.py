@@ -1,19 +1,67 @@
 """
 Grade Manager for DERSLY Streamlit application.
-Manages grade data operations and GPA calculations using session state.
+Manages grade data operations and GPA calculations through StorageManager.
 """
-import streamlit as st
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from utils.storage_manager import StorageManager
+from utils.versioned_cache import versioned_cache
+from utils.gpa_engine import GradeColumns, find_semester
 
 
 class GradeManager:
     """
     Manages grade entries and GPA calculations.
     Provides CRUD operations for grades and GPA computation.
+    GPA queries are served from the GradeColumns summary.
     """
     
+    @staticmethod
+    def get_columns() -> GradeColumns:
+        """
+        Get the columnar grade store for the current user.
+        Rebuilds it when the grades collection has been replaced
+        (e.g., after import or clearing all data).
+        
+        Returns:
+            GradeColumns for the grades collection
+        """
+        StorageManager.initialize_storage()
+        grades = StorageManager.get_collection('grades')
+        
+        state = StorageManager.state()
+        columns = state.get('grade_columns')
+        if columns is None or columns.source is not grades:
+            columns = GradeColumns(grades)
+            state['grade_columns'] = columns
+        
+        return columns
+    
+    @staticmethod
+    @versioned_cache('grades')
+    def get_gpa_summary() -> Dict[str, Any]:
+        """
+        Get overall, per-semester and cumulative GPA in one structured result.
+        
+        Returns:
+            Dictionary with gpa, total_credits, grade_count and the ordered
+            list of semesters (see GradeColumns.summary)
+        """
+        return GradeManager.get_columns().summary()
+    
+    @staticmethod
+    def get_gpa_timeline() -> List[Dict[str, Any]]:
+        """
+        Get each semester's GPA and the running GNO after it, with changes
+        versus the previous semester. Served from semester prefix sums that
+        are updated on every grade change, so this is O(semesters).
+        
+        Returns:
+            List of semester dictionaries ordered by (year, semester)
+            (see GradeColumns.timeline)
+        """
+        return GradeManager.get_columns().timeline()
+    
     @staticmethod
     def add_grade(grade_data: Dict[str, Any]) -> int:
         """
@@ -29,8 +77,7 @@ class GradeManager:
         StorageManager.initialize_storage()
         
         # Get next ID
-        grade_id = st.session_state['next_grade_id']
-        st.session_state['next_grade_id'] += 1
+        grade_id = StorageManager.next_id('grades')
         
         # Create grade entry with ID
         grade = {
@@ -43,8 +90,9 @@ class GradeManager:
             'created_at': datetime.now().isoformat()
         }
         
-        # Store in session state
-        st.session_state['grades'][grade_id] = grade
+        # Columns first, so the version bump of save_record never exposes stale GPA data
+        GradeManager.get_columns().add(grade)
+        StorageManager.save_record('grades', grade)
         
         return grade_id
     
@@ -60,7 +108,7 @@ class GradeManager:
             Grade dictionary if found, None otherwise
         """
         StorageManager.initialize_storage()
-        return st.session_state['grades'].get(grade_id)
+        return StorageManager.get_collection('grades').get(grade_id)
     
     @staticmethod
     def get_all_grades() -> List[Dict[str, Any]]:
@@ -71,7 +119,7 @@ class GradeManager:
             List of all grade dictionaries
         """
         StorageManager.initialize_storage()
-        return list(st.session_state['grades'].values())
+        return list(StorageManager.get_collection('grades').values())
     
     @staticmethod
     def update_grade(grade_id: int, updates: Dict[str, Any]) -> bool:
@@ -87,7 +135,7 @@ class GradeManager:
         """
         StorageManager.initialize_storage()
         
-        grade = st.session_state['grades'].get(grade_id)
+        grade = StorageManager.get_collection('grades').get(grade_id)
         if grade is None:
             return False
         
@@ -102,7 +150,8 @@ class GradeManager:
                 else:
                     grade[key] = value
         
-        st.session_state['grades'][grade_id] = grade
+        GradeManager.get_columns().add(grade)
+        StorageManager.save_record('grades', grade)
         return True
     
     @staticmethod
@@ -116,14 +165,15 @@ class GradeManager:
         Returns:
             True if deletion successful, False if grade not found
         """
-        StorageManager.initialize_storage()
+        columns = GradeManager.get_columns()
+        if grade_id not in StorageManager.get_collection('grades'):
+            return False
         
-        if grade_id in st.session_state['grades']:
-            del st.session_state['grades'][grade_id]
-            return True
-        return False
+        columns.remove(grade_id)
+        return StorageManager.delete_record('grades', grade_id)
     
     @staticmethod
+    @versioned_cache('grades')
     def calculate_gpa() -> float:
         """
         Calculate overall GPA (Grade Point Average).
@@ -131,22 +181,7 @@ class GradeManager:
         Returns:
             Overall GPA (0.0 to 4.0 scale)
         """
-        StorageManager.initialize_storage()
-        
-        total_points = 0.0
-        total_credits = 0
-        
-        for grade in st.session_state['grades'].values():
-            grade_value = float(grade.get('grade', 0))
-            credits = int(grade.get('credits', 0))
-            
-            total_points += grade_value * credits
-            total_credits += credits
-        
-        if total_credits == 0:
-            return 0.0
-        
-        return round(total_points / total_credits, 2)
+        return GradeManager.get_gpa_summary()['gpa']
     
     @staticmethod
     def calculate_semester_gpa(semester: str, year: int) -> float:
@@ -160,23 +195,8 @@ class GradeManager:
         Returns:
             Semester GPA (0.0 to 4.0 scale)
         """
-        StorageManager.initialize_storage()
-        
-        total_points = 0.0
-        total_credits = 0
-        
-        for grade in st.session_state['grades'].values():
-            if grade.get('semester') == semester and grade.get('year') == year:
-                grade_value = float(grade.get('grade', 0))
-                credits = int(grade.get('credits', 0))
-                
-                total_points += grade_value * credits
-                total_credits += credits
-        
-        if total_credits == 0:
-            return 0.0
-        
-        return round(total_points / total_credits, 2)
+        entry = find_semester(GradeManager.get_gpa_summary(), semester, year)
+        return entry['gpa'] if entry else 0.0
     
     @staticmethod
     def get_grades_by_semester(semester: str, year: int) -> List[Dict[str, Any]]:
@@ -190,12 +210,12 @@ class GradeManager:
         Returns:
             List of grades for the specified semester
         """
-        StorageManager.initialize_storage()
+        entry = find_semester(GradeManager.get_gpa_summary(), semester, year)
+        if entry is None:
+            return []
         
-        grades = []
-        for grade in st.session_state['grades'].values():
-            if grade.get('semester') == semester and grade.get('year') == year:
-                grades.append(grade)
+        collection = StorageManager.get_collection('grades')
+        grades = [collection[grade_id] for grade_id in entry['grade_ids']]
         
         # Sort by course name
         grades.sort(key=lambda x: x.get('course_name', ''))
@@ -211,7 +231,7 @@ class GradeManager:
             Number of grade entries
         """
         StorageManager.initialize_storage()
-        return len(st.session_state['grades'])
+        return len(StorageManager.get_collection('grades'))
     
     @staticmethod
     def get_total_credits() -> int:
@@ -221,15 +241,10 @@ class GradeManager:
         Returns:
             Total credits
         """
-        StorageManager.initialize_storage()
-        
-        total = 0
-        for grade in st.session_state['grades'].values():
-            total += int(grade.get('credits', 0))
-        
-        return total
+        return GradeManager.get_gpa_summary()['total_credits']
     
     @staticmethod
+    @versioned_cache('grades')
     def get_semesters() -> List[tuple]:
         """
         Get list of unique semesters with grades.
@@ -237,14 +252,4 @@ class GradeManager:
         Returns:
             List of (semester, year) tuples
         """
-        StorageManager.initialize_storage()
-        
-        semesters = set()
-        for grade in st.session_state['grades'].values():
-            semester = grade.get('semester')
-            year = grade.get('year')
-            if semester and year:
-                semesters.add((semester, year))
-        
-        # Sort by year and semester
-        return sorted(list(semesters), key=lambda x: (x[1], x[0]))
+        return [(entry['semester'], entry['year']) for entry in GradeManager.get_gpa_summary()['semesters']]
@@ -219,6 +219,11 @@ class MobileUtils:
         """
     
     @staticmethod
-    def apply_mobile_styles():
-        """Apply mobile-responsive styles to the page."""
-        st.markdown(MobileUtils.get_responsive_css(), unsafe_allow_html=True)
+    def apply_mobile_styles(theme: str = "light"):
+        """
+        Apply mobile-responsive styles to the page.
+        Emitted together with the modern styles as a single cached bundle;
+        do not combine with apply_modern_style() on the same page.
+        """
+        from utils.ui_styles import apply_modern_style
+        apply_modern_style(theme, include_mobile=True)
@@ -2,18 +2,189 @@
 Reminder Manager for DERSLY Streamlit application.
 Manages reminders and calculates urgency for upcoming assignments.
 """
+import bisect
+import math
+import sys
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 from utils.assignment_manager import AssignmentManager
+from utils.assignment_index import AssignmentIndex
+from utils.storage_manager import StorageManager
+
+
+class ReminderEngine:
+    """
+    Incremental reminder state for a session.
+    Keeps pending assignments ordered by due date and caches each reminder
+    until its urgency fields change (every full hour before/after the due
+    date). Rebuilt only when the assignment index changes.
+    
+    Urgency score never increases with a later due date, so due-date order
+    is also the (-urgency_score, due_date) display order.
+    """
+    
+    # Bucket upper bounds relative to now (see calculate_urgency)
+    URGENT_WINDOW = timedelta(days=1)   # score >= 4
+    SOON_WINDOW = timedelta(days=4)     # score 2-3
+    COUNT_WINDOW = timedelta(days=7)    # get_reminder_count window
+    
+    def __init__(self, index: AssignmentIndex):
+        """
+        Build reminder state from the assignment index.
+        
+        Args:
+            index: Current AssignmentIndex
+        """
+        self.index = index
+        self.index_version = index.version
+        
+        # Priority queue of pending assignments: sorted (due date, id)
+        self.queue: List[Tuple[datetime, int]] = [
+            (due_date, assignment_id)
+            for due_date, assignment_id in index.by_due_date
+            if index.status_of(assignment_id) == 'pending'
+        ]
+        self.due_dates: Dict[int, datetime] = {assignment_id: due_date for due_date, assignment_id in self.queue}
+        
+        # id -> (valid_until, reminder)
+        self.reminders: Dict[int, Tuple[datetime, Dict[str, Any]]] = {}
+        
+        # Cached bucket counts and the time they stop being valid
+        self.counts: Optional[Dict[str, int]] = None
+        self.counts_valid_until: Optional[datetime] = None
+    
+    def is_current(self, index: AssignmentIndex) -> bool:
+        """Check whether the engine reflects the given index state."""
+        return self.index is index and self.index_version == index.version
+    
+    def _position(self, moment: datetime, inclusive: bool = False) -> int:
+        if inclusive:
+            return bisect.bisect_right(self.queue, (moment, sys.maxsize))
+        return bisect.bisect_left(self.queue, (moment, -sys.maxsize))
+    
+    def get_reminder(self, assignment_id: int, now: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Get the reminder for a pending assignment, rebuilding it only if stale.
+        
+        Args:
+            assignment_id: Assignment ID
+            now: Reference time
+        
+        Returns:
+            Reminder dictionary, or None if the assignment is not pending
+        """
+        due_date = self.due_dates.get(assignment_id)
+        if due_date is None:
+            return None
+        
+        cached = self.reminders.get(assignment_id)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        
+        # Calculate urgency
+        urgency_color, urgency_label, urgency_score = ReminderManager.calculate_urgency(due_date, now)
+        
+        # Calculate time remaining
+        time_diff = due_date - now
+        hours_left = time_diff.total_seconds() / 3600
+        
+        reminder = {
+            **self.index.source[assignment_id],  # Include all assignment data
+            'urgency_color': urgency_color,
+            'urgency_label': urgency_label,
+            'urgency_score': urgency_score,
+            'days_remaining': time_diff.days,
+            'hours_remaining': int(hours_left),
+            'due_date_obj': due_date
+        }
+        
+        # All urgency fields change only when hours_left crosses an integer
+        valid_until = due_date - timedelta(hours=math.ceil(hours_left) - 1)
+        self.reminders[assignment_id] = (valid_until, reminder)
+        
+        return reminder
+    
+    def get_window(self, days_ahead: int, now: datetime) -> List[Dict[str, Any]]:
+        """
+        Get reminders due within days_ahead (including overdue), most urgent first.
+        
+        Args:
+            days_ahead: Number of days to look ahead
+            now: Reference time
+        
+        Returns:
+            List of reminder dictionaries
+        """
+        end = self._position(now + timedelta(days=days_ahead), inclusive=True)
+        return [self.get_reminder(assignment_id, now) for _, assignment_id in self.queue[:end]]
+    
+    def get_counts(self, now: datetime) -> Dict[str, int]:
+        """
+        Get reminder counts for the 7-day window by urgency bucket.
+        Counts are recomputed only when an assignment crosses a bucket boundary.
+        
+        Args:
+            now: Reference time
+        
+        Returns:
+            Dictionary with 'urgent', 'soon', 'later' and 'total' counts
+        """
+        if self.counts is not None and now < self.counts_valid_until:
+            return dict(self.counts)
+        
+        urgent = self._position(now + self.URGENT_WINDOW)
+        soon_end = self._position(now + self.SOON_WINDOW)
+        total = self._position(now + self.COUNT_WINDOW, inclusive=True)
+        
+        self.counts = {
+            'urgent': urgent,
+            'soon': soon_end - urgent,
+            'later': total - soon_end,
+            'total': total
+        }
+        
+        # Next moment an assignment enters one of the buckets
+        boundaries = [
+            self.queue[position][0] - window
+            for position, window in [
+                (urgent, self.URGENT_WINDOW),
+                (soon_end, self.SOON_WINDOW),
+                (total, self.COUNT_WINDOW)
+            ]
+            if position < len(self.queue)
+        ]
+        self.counts_valid_until = min(boundaries) if boundaries else datetime.max
+        
+        return dict(self.counts)
 
 
 class ReminderManager:
     """Manages reminders for upcoming assignments."""
     
+    @staticmethod
+    def get_engine() -> ReminderEngine:
+        """
+        Get the reminder engine for the current user.
+        Rebuilt only when an assignment has been added, updated or deleted.
+        
+        Returns:
+            ReminderEngine for the current assignments
+        """
+        index = AssignmentManager.get_index()
+        
+        state = StorageManager.state()
+        engine = state.get('reminder_engine')
+        if engine is None or not engine.is_current(index):
+            engine = ReminderEngine(index)
+            state['reminder_engine'] = engine
+        
+        return engine
+    
     @staticmethod
     def get_reminders(days_ahead: int = 7) -> List[Dict[str, Any]]:
         """
         Get reminders for assignments due within specified days.
+        Returned dictionaries are cached by the engine and must not be modified.
         
         Args:
             days_ahead: Number of days to look ahead (default: 7)
@@ -21,51 +192,7 @@ class ReminderManager:
         Returns:
             List of reminder dictionaries with urgency information
         """
-        # Get all pending assignments
-        assignments = AssignmentManager.get_assignments_by_status('pending')
-        
-        now = datetime.now()
-        future = now + timedelta(days=days_ahead)
-        
-        reminders = []
-        for assignment in assignments:
-            try:
-                # Parse due date
-                due_date_str = assignment.get('due_date', '')
-                if 'T' in due_date_str:
-                    due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-                else:
-                    due_date = datetime.fromisoformat(due_date_str)
-                
-                # Check if within range (including overdue)
-                if due_date <= future:
-                    # Calculate urgency
-                    urgency_color, urgency_label, urgency_score = ReminderManager.calculate_urgency(due_date)
-                    
-                    # Calculate time remaining
-                    time_diff = due_date - now
-                    days_remaining = time_diff.days
-                    hours_remaining = int(time_diff.total_seconds() / 3600)
-                    
-                    # Create reminder
-                    reminder = {
-                        **assignment,  # Include all assignment data
-                        'urgency_color': urgency_color,
-                        'urgency_label': urgency_label,
-                        'urgency_score': urgency_score,
-                        'days_remaining': days_remaining,
-                        'hours_remaining': hours_remaining,
-                        'due_date_obj': due_date
-                    }
-                    reminders.append(reminder)
-            except (ValueError, AttributeError):
-                # Skip assignments with invalid dates
-                continue
-        
-        # Sort by urgency score (highest first), then by due date
-        reminders.sort(key=lambda x: (-x['urgency_score'], x['due_date_obj']))
-        
-        return reminders
+        return ReminderManager.get_engine().get_window(days_ahead, datetime.now())
     
     @staticmethod
     def get_urgent_reminders() -> List[Dict[str, Any]]:
@@ -116,12 +243,13 @@ class ReminderManager:
             return []
     
     @staticmethod
-    def calculate_urgency(due_date: datetime) -> Tuple[str, str, int]:
+    def calculate_urgency(due_date: datetime, now: Optional[datetime] = None) -> Tuple[str, str, int]:
         """
         Calculate urgency level for a reminder.
         
         Args:
             due_date: Due date of the assignment
+            now: Reference time (default: current time)
         
         Returns:
             Tuple of (color, label, urgency_score)
@@ -129,7 +257,8 @@ class ReminderManager:
             - label: Turkish label for urgency
             - urgency_score: Numeric score (0-5, higher is more urgent)
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         time_diff = due_date - now
         
         # Overdue
@@ -172,18 +301,7 @@ class ReminderManager:
                 'total': total count
             }
         """
-        reminders = ReminderManager.get_reminders(days_ahead=7)
-        
-        urgent = sum(1 for r in reminders if r['urgency_score'] >= 4)
-        soon = sum(1 for r in reminders if 2 <= r['urgency_score'] < 4)
-        later = sum(1 for r in reminders if r['urgency_score'] < 2)
-        
-        return {
-            'urgent': urgent,
-            'soon': soon,
-            'later': later,
-            'total': len(reminders)
-        }
+        return ReminderManager.get_engine().get_counts(datetime.now())
     
     @staticmethod
     def get_reminder_by_id(reminder_id: int) -> Dict[str, Any]:
@@ -196,8 +314,12 @@ class ReminderManager:
         Returns:
             Reminder dictionary or None if not found
         """
-        reminders = ReminderManager.get_reminders(days_ahead=365)
-        for reminder in reminders:
-            if reminder['id'] == reminder_id:
-                return reminder
-        return None
+        now = datetime.now()
+        engine = ReminderManager.get_engine()
+        
+        # Same horizon as the 'all' period
+        due_date = engine.due_dates.get(reminder_id)
+        if due_date is None or due_date > now + timedelta(days=365):
+            return None
+        
+        return engine.get_reminder(reminder_id, now)
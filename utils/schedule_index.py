@@ -0,0 +1,152 @@
+"""
+Schedule Index for DERSLY Streamlit application.
+Maintains a per-day interval index over courses for time conflict queries.
+"""
+import bisect
+import sys
+from typing import Optional, Dict, Any, List, Tuple
+from utils.week_mask import WeekOccupancy, time_to_minutes
+
+
+def parse_course_times(course: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    """
+    Get the (start, end) minutes of a course.
+
+    Args:
+        course: Course dictionary with start_time and end_time
+
+    Returns:
+        Tuple of (start, end) minutes, or None if a time is missing or invalid
+    """
+    try:
+        return time_to_minutes(course['start_time']), time_to_minutes(course['end_time'])
+    except (KeyError, ValueError, TypeError, AttributeError):
+        return None
+
+
+class ScheduleIndex:
+    """
+    Per-day interval index over the courses collection.
+    Each day holds a list of (start, end, id) sorted by start minute plus the
+    longest course duration of the day, so an overlap query only inspects
+    courses starting within one maximum duration of the slot: O(log n + k).
+    A WeekOccupancy bitset of the same courses is kept alongside for
+    totals and free-time queries. Updated incrementally on every mutation.
+    """
+
+    def __init__(self, source: Dict[int, Dict[str, Any]]):
+        """
+        Build the index for a courses collection.
+
+        Args:
+            source: Courses dictionary keyed by ID
+        """
+        # Collection the index was built from (replaced on import/clear)
+        self.source = source
+
+        # day -> sorted list of (start minute, end minute, id)
+        self.by_day: Dict[str, List[Tuple[int, int, int]]] = {}
+
+        # day -> longest (end - start) among the day's courses
+        self.max_duration: Dict[str, int] = {}
+
+        # id -> (day, start, end) currently indexed
+        self.entries: Dict[int, Tuple[str, int, int]] = {}
+
+        # Minute bitsets of the indexed courses
+        self.occupancy = WeekOccupancy()
+
+        for course in source.values():
+            times = parse_course_times(course)
+            if times is not None:
+                self._insert(course['id'], course.get('day'), *times, keep_sorted=False)
+
+        # Bulk build: sort once instead of per-insert
+        for intervals in self.by_day.values():
+            intervals.sort()
+
+    def _insert(self, record_id: int, day: str, start: int, end: int, keep_sorted: bool = True) -> None:
+        intervals = self.by_day.setdefault(day, [])
+        if keep_sorted:
+            bisect.insort(intervals, (start, end, record_id))
+        else:
+            intervals.append((start, end, record_id))
+
+        self.max_duration[day] = max(self.max_duration.get(day, 0), end - start)
+        self.entries[record_id] = (day, start, end)
+        self.occupancy.add(record_id, day, start, end)
+
+    def add(self, course: Dict[str, Any]) -> None:
+        """
+        Index a new or updated course.
+
+        Args:
+            course: Course dictionary
+        """
+        if course['id'] in self.entries:
+            self.remove(course['id'])
+
+        times = parse_course_times(course)
+        if times is not None:
+            self._insert(course['id'], course.get('day'), *times)
+
+    def remove(self, course_id: int) -> None:
+        """
+        Remove a course from the index.
+
+        Args:
+            course_id: Course ID
+        """
+        entry = self.entries.pop(course_id, None)
+        if entry is None:
+            return
+
+        self.occupancy.remove(course_id)
+        day, start, end = entry
+        intervals = self.by_day[day]
+        position = bisect.bisect_left(intervals, (start, end, course_id))
+        if position < len(intervals) and intervals[position] == (start, end, course_id):
+            del intervals[position]
+
+        if end - start == self.max_duration.get(day):
+            self.max_duration[day] = max((e - s for s, e, _ in intervals), default=0)
+
+    def overlapping(self, day: str, start: int, end: int, exclude_id: Optional[int] = None) -> List[int]:
+        """
+        Get IDs of courses overlapping a time slot, ordered by start time.
+        Touching intervals (one ends when the other starts) do not overlap.
+
+        Args:
+            day: Day of week
+            start: Slot start in minutes
+            end: Slot end in minutes
+            exclude_id: Course ID to ignore (e.g., the course being edited)
+
+        Returns:
+            List of course IDs
+        """
+        intervals = self.by_day.get(day)
+        if not intervals:
+            return []
+
+        # Only courses starting after (start - longest duration) can reach into the slot
+        low = bisect.bisect_right(intervals, (start - self.max_duration[day], sys.maxsize))
+        high = bisect.bisect_left(intervals, (end,))
+
+        return [
+            course_id
+            for course_start, course_end, course_id in intervals[low:high]
+            if course_end > start and course_id != exclude_id
+        ]
+
+    def day_intervals(self, day: str) -> List[Tuple[int, int, int]]:
+        """
+        Get the indexed (start, end, id) intervals of a day, sorted by start.
+
+        Args:
+            day: Day of week
+
+        Returns:
+            List of intervals
+        """
+        return list(self.by_day.get(day, []))
@@ -0,0 +1,78 @@
+"""
+Size Accounting for DERSLY Streamlit application.
+Tracks the in-memory footprint of stored records incrementally.
+"""
+import sys
+from typing import Any, Dict, Optional, Set
+
+
+def deep_sizeof(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Measure the memory footprint of an object and everything it contains.
+    Containers (dict, list, tuple, set) are walked recursively; objects
+    reachable twice are counted once.
+
+    Args:
+        obj: Object to measure
+        seen: IDs of objects already counted (used during recursion)
+
+    Returns:
+        Size in bytes
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += deep_sizeof(key, seen) + deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += deep_sizeof(item, seen)
+
+    return size
+
+
+class SizeLedger:
+    """
+    Running byte total for one entity collection.
+    Each record is measured when it is written, so the total is available in
+    O(1) and updates cost O(size of the changed record).
+    """
+
+    def __init__(self, source: Dict[int, Dict[str, Any]]):
+        """
+        Measure every record of a collection.
+
+        Args:
+            source: Collection dictionary the ledger tracks (records keyed by ID)
+        """
+        self.source = source
+        self.record_sizes: Dict[int, int] = {
+            record_id: deep_sizeof(record) for record_id, record in source.items()
+        }
+        self.total = sum(self.record_sizes.values())
+
+    def update(self, record_id: int, record: Dict[str, Any]) -> None:
+        """
+        Re-measure an inserted or updated record.
+
+        Args:
+            record_id: Record ID
+            record: Current record dictionary
+        """
+        size = deep_sizeof(record)
+        self.total += size - self.record_sizes.get(record_id, 0)
+        self.record_sizes[record_id] = size
+
+    def remove(self, record_id: int) -> None:
+        """
+        Forget a deleted record.
+
+        Args:
+            record_id: Record ID
+        """
+        self.total -= self.record_sizes.pop(record_id, 0)
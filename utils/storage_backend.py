@@ -0,0 +1,260 @@
+"""
+Storage backends for DERSLY Streamlit application.
+Provides pluggable persistence engines used by StorageManager.
+"""
+import json
+import sqlite3
+import threading
+from typing import Dict, Any, Optional, List, Tuple
+
+
+class StorageBackend:
+    """
+    Base class for persistence engines behind StorageManager.
+    Records are plain dictionaries keyed by their integer 'id'.
+    """
+
+    # Entity collections handled by every backend
+    ENTITIES = ['courses', 'assignments', 'grades', 'reminders']
+
+    def load_collection(self, entity: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Load all records of an entity collection.
+
+        Args:
+            entity: Collection name (e.g., "courses")
+
+        Returns:
+            Dictionary of records keyed by ID
+        """
+        return {}
+
+    def save_record(self, entity: str, record: Dict[str, Any]) -> None:
+        """
+        Insert or update a single record.
+
+        Args:
+            entity: Collection name
+            record: Record dictionary containing an 'id' field
+        """
+
+    def delete_record(self, entity: str, record_id: int) -> None:
+        """
+        Delete a single record.
+
+        Args:
+            entity: Collection name
+            record_id: Record ID
+        """
+
+    def get_value(self, key: str) -> Any:
+        """
+        Get a stored key/value entry (profile, metadata, counters).
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Stored value, or None if not found
+        """
+        return None
+
+    def set_value(self, key: str, value: Any) -> None:
+        """
+        Store a key/value entry.
+
+        Args:
+            key: Entry key
+            value: JSON-serializable value
+        """
+
+    def replace_all(self, collections: Dict[str, List[Dict[str, Any]]], values: Dict[str, Any]) -> None:
+        """
+        Replace all stored data in a single operation (used by import).
+
+        Args:
+            collections: Entity name -> list of records
+            values: Key/value entries to store
+        """
+
+    def apply_batch(self, operations: List[Tuple[str, Any, Any]]) -> None:
+        """
+        Apply a batch of writes (used by the write-behind queue).
+
+        Args:
+            operations: List of ("save_record", entity, record),
+                        ("delete_record", entity, id) or ("set_value", key, value)
+        """
+        for name, first, second in operations:
+            getattr(self, name)(first, second)
+
+    def clear(self) -> None:
+        """Delete all stored data."""
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+    @property
+    def is_persistent(self) -> bool:
+        """Whether data survives a session or process restart."""
+        return False
+
+
+class MemoryBackend(StorageBackend):
+    """
+    Default backend that keeps data only in memory (the user's tenant state).
+    All persistence operations are no-ops.
+    """
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    SQLite persistence engine.
+    Uses WAL journaling and one table per entity storing each record as JSON.
+
+    Collections are always loaded whole: every read is served from the
+    tenant's in-memory collection and its derived indexes (ScheduleIndex,
+    AssignmentIndex, GradeManager's columns), so SQL-side filtering or
+    secondary indexes would only add write cost.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS courses (
+        id INTEGER PRIMARY KEY,
+        data TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS assignments (
+        id INTEGER PRIMARY KEY,
+        data TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS grades (
+        id INTEGER PRIMARY KEY,
+        data TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS reminders (
+        id INTEGER PRIMARY KEY,
+        data TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS kv (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    """
+
+    def __init__(self, path: str = "dersly.db"):
+        """
+        Open (or create) the SQLite database.
+
+        Args:
+            path: Database file path (":memory:" for a temporary database)
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    @property
+    def is_persistent(self) -> bool:
+        return True
+
+    def _check_entity(self, entity: str) -> None:
+        if entity not in self.ENTITIES:
+            raise ValueError(f"Unknown entity: {entity}")
+
+    def _row_values(self, entity: str, record: Dict[str, Any]) -> tuple:
+        return (record['id'], json.dumps(record, ensure_ascii=False))
+
+    def _upsert_sql(self, entity: str) -> str:
+        return f"INSERT OR REPLACE INTO {entity} (id, data) VALUES (?, ?)"
+
+    def load_collection(self, entity: str) -> Dict[int, Dict[str, Any]]:
+        self._check_entity(entity)
+        with self._lock:
+            rows = self._conn.execute(f"SELECT id, data FROM {entity} ORDER BY id").fetchall()
+        return {row[0]: json.loads(row[1]) for row in rows}
+
+    def save_record(self, entity: str, record: Dict[str, Any]) -> None:
+        self._check_entity(entity)
+        with self._lock:
+            self._conn.execute(self._upsert_sql(entity), self._row_values(entity, record))
+
+    def delete_record(self, entity: str, record_id: int) -> None:
+        self._check_entity(entity)
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {entity} WHERE id = ?", (record_id,))
+
+    def get_value(self, key: str) -> Any:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def set_value(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)",
+                (key, json.dumps(value, ensure_ascii=False))
+            )
+
+    def replace_all(self, collections: Dict[str, List[Dict[str, Any]]], values: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for entity in self.ENTITIES:
+                    self._conn.execute(f"DELETE FROM {entity}")
+                    records = collections.get(entity, [])
+                    if records:
+                        self._conn.executemany(
+                            self._upsert_sql(entity),
+                            [self._row_values(entity, record) for record in records]
+                        )
+                self._conn.execute("DELETE FROM kv")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)",
+                    [(key, json.dumps(value, ensure_ascii=False)) for key, value in values.items()]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def apply_batch(self, operations: List[Tuple[str, Any, Any]]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                super().apply_batch(operations)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def clear(self) -> None:
+        self.replace_all({}, {})
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def create_backend(name: Optional[str] = None, path: Optional[str] = None) -> StorageBackend:
+    """
+    Create a storage backend by name.
+
+    Args:
+        name: Backend name ("memory" or "sqlite")
+        path: Database path for the SQLite backend
+
+    Returns:
+        StorageBackend instance
+    """
+    if name == 'sqlite':
+        return SQLiteBackend(path or "dersly.db")
+    return MemoryBackend()
@@ -1,103 +1,556 @@
 """
 Storage Manager for DERSLY Streamlit application.
-Manages all data storage operations using Streamlit session state.
+Manages all data storage operations through per-user tenants,
+backed by a pluggable persistence engine (see utils/storage_backend.py).
 """
 import streamlit as st
 from datetime import datetime
-from typing import Dict, Any, Optional
-import sys
+from typing import Dict, Any, Optional, Iterator, IO, Union, List, Callable, Iterable, ContextManager
+import hashlib
+import itertools
+import json
+import operator
+import os
+import re
+import threading
+import time
+import secrets
+from utils.storage_backend import StorageBackend
+from utils import backup_codec
+from utils.size_accounting import SizeLedger, deep_sizeof
+from utils.tenant_store import Tenant, TenantStore
 
 
 class StorageManager:
     """
-    Manages all data storage operations using Streamlit session state.
+    Manages all data storage operations.
     Provides initialization, export/import, and cleanup functionality.
+    Each user's data lives once per process in a tenant (see
+    utils/tenant_store.py) in front of that user's storage backend; session
+    state only holds the tenant handle. All record writes go through this class.
     """
     
     # Data format version for compatibility checking
     DATA_VERSION = "1.0.0"
     
+    # Format marker in the header line of streamed (NDJSON) backups
+    NDJSON_FORMAT = "dersly-ndjson"
+    
+    # Format marker in the header of compressed columnar (binary) backups
+    BINARY_FORMAT = "dersly-columnar"
+    
+    # Entity collections and their auto-increment counter keys
+    COLLECTIONS = {
+        'courses': 'next_course_id',
+        'assignments': 'next_assignment_id',
+        'grades': 'next_grade_id',
+        'reminders': 'next_reminder_id'
+    }
+    
+    # Import error per entity for malformed record lists
+    IMPORT_LIST_ERRORS = {
+        'courses': "❌ Geçersiz ders listesi formatı",
+        'assignments': "❌ Geçersiz ödev listesi formatı",
+        'grades': "❌ Geçersiz not listesi formatı",
+        'reminders': "❌ Geçersiz hatırlatıcı listesi formatı"
+    }
+    
+    # Session state key holding the tenant handle (the only per-session data key)
+    TENANT_HANDLE_KEY = 'tenant_handle'
+    
+    # Random bytes in a recovery code (token_urlsafe: 24 characters)
+    RECOVERY_CODE_BYTES = 18
+    
+    # Shape of a recovery code as entered by the user
+    RECOVERY_CODE_PATTERN = re.compile(r'^[A-Za-z0-9_-]{16,64}$')
+    
+    # Process-wide tenant store (created lazily from environment)
+    _tenants: Optional[TenantStore] = None
+    
+    # Change-event subscribers: (callback, entity filter or None)
+    _subscribers: List[tuple] = []
+    _subscribers_lock = threading.Lock()
+    
+    # Process-wide source of data versions (never reused, even across tenants)
+    _version_counter = itertools.count(1)
+    
+    @staticmethod
+    def get_tenant_store() -> TenantStore:
+        """
+        Get the process-wide tenant store.
+        Configured with DERSLY_STORAGE_BACKEND ("memory" or "sqlite"),
+        DERSLY_DATA_DIR, DERSLY_TENANT_CAPACITY, DERSLY_WRITE_BEHIND and
+        DERSLY_TENANT_RETENTION_DAYS environment variables. Abandoned
+        tenant files are collected when the store is created.
+        
+        Returns:
+            TenantStore instance
+        """
+        if StorageManager._tenants is None:
+            StorageManager._tenants = TenantStore(
+                StorageManager._snapshot,
+                backend_name=os.getenv('DERSLY_STORAGE_BACKEND', 'memory'),
+                data_dir=os.getenv('DERSLY_DATA_DIR', 'dersly_data'),
+                capacity=int(os.getenv('DERSLY_TENANT_CAPACITY', '200')),
+                write_behind=os.getenv('DERSLY_WRITE_BEHIND', '1') != '0',
+                retention_seconds=float(os.getenv('DERSLY_TENANT_RETENTION_DAYS', '180')) * 24 * 3600
+            )
+            StorageManager._tenants.collect_garbage()
+        return StorageManager._tenants
+    
+    @staticmethod
+    def set_tenant_store(store: TenantStore) -> None:
+        """
+        Replace the process-wide tenant store.
+        
+        Args:
+            store: New tenant store
+        """
+        StorageManager._tenants = store
+    
+    @staticmethod
+    def get_tenant_handle() -> str:
+        """
+        Get the tenant handle (recovery code) of the current session.
+        Each new session gets a random, unguessable code that is kept only in
+        server-side session state: it is never derived from user input
+        (e.g., the profile email) and never placed in the URL. The user can
+        copy it from the profile page and enter it in a later session or on
+        another device to return to the same data (see restore_session).
+        
+        Returns:
+            Recovery code
+        """
+        handle = st.session_state.get(StorageManager.TENANT_HANDLE_KEY)
+        if handle is None:
+            handle = secrets.token_urlsafe(StorageManager.RECOVERY_CODE_BYTES)
+            st.session_state[StorageManager.TENANT_HANDLE_KEY] = handle
+        return handle
+    
+    @staticmethod
+    def tenant_key_for(handle: str) -> str:
+        """
+        Derive the tenant key (and database file name) from a recovery code.
+        Files are named by the hash, so listing the data directory does not
+        reveal any code.
+        
+        Args:
+            handle: Recovery code
+        
+        Returns:
+            Tenant key
+        """
+        return hashlib.sha256(handle.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def get_tenant_key() -> str:
+        """
+        Get the tenant key of the current session.
+        
+        Returns:
+            Tenant key derived from the session's recovery code
+        """
+        return StorageManager.tenant_key_for(StorageManager.get_tenant_handle())
+    
+    @staticmethod
+    def restore_session(code: str) -> tuple[bool, str]:
+        """
+        Attach the current session to the data of a recovery code.
+        The code is only accepted if its tenant exists (in memory or on
+        disk); the current session's own data stays under its own code.
+        
+        Args:
+            code: Recovery code entered by the user
+        
+        Returns:
+            Tuple of (success, message)
+        """
+        code = (code or '').strip()
+        if not StorageManager.RECOVERY_CODE_PATTERN.match(code):
+            return False, "❌ Geçersiz kurtarma kodu"
+        
+        if not StorageManager.get_tenant_store().exists(StorageManager.tenant_key_for(code)):
+            return False, "❌ Bu kurtarma koduna ait veri bulunamadı"
+        
+        st.session_state[StorageManager.TENANT_HANDLE_KEY] = code
+        return True, "✅ Verileriniz geri yüklendi"
+    
+    @staticmethod
+    def get_tenant() -> Tenant:
+        """
+        Get the tenant of the current session.
+        
+        Returns:
+            Tenant holding this user's data
+        """
+        return StorageManager.get_tenant_store().acquire(StorageManager.get_tenant_key())
+    
+    @staticmethod
+    def lock_tenant() -> ContextManager[Tenant]:
+        """
+        Get the tenant of the current session with its lock held.
+        Writes go through this so a tenant evicted by another session is
+        re-acquired (and its backend reopened) instead of being written to
+        after its backend was closed.
+        
+        Returns:
+            Context manager yielding the locked Tenant
+        """
+        return StorageManager.get_tenant_store().locked(StorageManager.get_tenant_key())
+    
+    @staticmethod
+    def state() -> Dict[str, Any]:
+        """
+        Get the data state of the current user.
+        Holds the profile, metadata, counters, collections and derived
+        indexes; shared by all sessions of the same user.
+        
+        Returns:
+            Tenant state dictionary
+        """
+        return StorageManager.get_tenant().state
+    
+    @staticmethod
+    def _snapshot(tenant: Tenant) -> tuple:
+        """
+        Build the persisted form of a tenant (used when it leaves memory).
+        
+        Args:
+            tenant: Tenant to serialize
+        
+        Returns:
+            Tuple of (entity -> record list, key/value entries)
+        """
+        state = tenant.state
+        collections = {}
+        for entity in StorageManager.COLLECTIONS:
+            records = state[entity] if entity in state else tenant.backend.load_collection(entity)
+            collections[entity] = [StorageManager.to_serializable(record) for record in records.values()]
+        
+        values = {}
+        for key in ['user_profile', 'metadata', *StorageManager.COLLECTIONS.values()]:
+            values[key] = state[key] if key in state else tenant.backend.get_value(key)
+        
+        return collections, values
+    
+    @staticmethod
+    def get_backend() -> StorageBackend:
+        """
+        Get the storage backend of the current user.
+        
+        Returns:
+            StorageBackend instance
+        """
+        return StorageManager.get_tenant().backend
+    
+    @staticmethod
+    def set_backend(backend: StorageBackend) -> None:
+        """
+        Replace the current user's storage backend and drop cached data.
+        
+        Args:
+            backend: New storage backend
+        """
+        with StorageManager.lock_tenant() as tenant:
+            tenant.backend = backend
+            tenant.managed = False
+            tenant.state.clear()
+    
     @staticmethod
     def initialize_storage() -> None:
         """
-        Initialize empty data structures in session state if not exists.
-        Sets up all required data containers and metadata.
+        Initialize empty data structures in the user's state if not exists.
+        Sets up profile, metadata and counters; entity collections are
+        loaded lazily from the backend by get_collection().
+        """
+        with StorageManager.lock_tenant() as tenant:
+            state = tenant.state
+            backend = tenant.backend
+            
+            # Initialize user profile
+            if 'user_profile' not in state:
+                state['user_profile'] = backend.get_value('user_profile')
+            
+            # Initialize metadata
+            if 'metadata' not in state:
+                metadata = backend.get_value('metadata')
+                if metadata is None:
+                    metadata = {
+                        'version': StorageManager.DATA_VERSION,
+                        'last_export': None,
+                        'last_import': None,
+                        'created_at': datetime.now().isoformat()
+                    }
+                    backend.set_value('metadata', metadata)
+                state['metadata'] = metadata
+            
+            # Initialize auto-increment counters
+            for counter_key in StorageManager.COLLECTIONS.values():
+                if counter_key not in state:
+                    state[counter_key] = backend.get_value(counter_key) or 1
+    
+    @staticmethod
+    def get_collection(entity: str) -> Dict[int, Dict[str, Any]]:
         """
-        # Initialize user profile
-        if 'user_profile' not in st.session_state:
-            st.session_state['user_profile'] = None
+        Get an entity collection, loading it from the backend on first access.
         
-        # Initialize courses dictionary
-        if 'courses' not in st.session_state:
-            st.session_state['courses'] = {}
+        Args:
+            entity: Collection name ("courses", "assignments", "grades", "reminders")
         
-        # Initialize assignments dictionary
-        if 'assignments' not in st.session_state:
-            st.session_state['assignments'] = {}
+        Returns:
+            Dictionary of records keyed by ID
+        """
+        with StorageManager.lock_tenant() as tenant:
+            state = tenant.state
+            if entity not in state:
+                state[entity] = tenant.backend.load_collection(entity)
+            return state[entity]
+    
+    @staticmethod
+    def get_size_ledger(entity: str) -> SizeLedger:
+        """
+        Get the byte ledger of an entity collection.
+        Rebuilds it when the collection has been replaced (e.g., after import
+        or clearing all data).
         
-        # Initialize grades dictionary
-        if 'grades' not in st.session_state:
-            st.session_state['grades'] = {}
+        Args:
+            entity: Collection name
         
-        # Initialize reminders dictionary
-        if 'reminders' not in st.session_state:
-            st.session_state['reminders'] = {}
+        Returns:
+            SizeLedger tracking the collection
+        """
+        collection = StorageManager.get_collection(entity)
+        ledgers = StorageManager.state().setdefault('size_ledgers', {})
         
-        # Initialize metadata
-        if 'metadata' not in st.session_state:
-            st.session_state['metadata'] = {
-                'version': StorageManager.DATA_VERSION,
-                'last_export': None,
-                'last_import': None,
-                'created_at': datetime.now().isoformat()
-            }
+        ledger = ledgers.get(entity)
+        if ledger is None or ledger.source is not collection:
+            ledger = SizeLedger(collection)
+            ledgers[entity] = ledger
         
-        # Initialize auto-increment counters
-        if 'next_course_id' not in st.session_state:
-            st.session_state['next_course_id'] = 1
+        return ledger
+    
+    @staticmethod
+    def next_id(entity: str) -> int:
+        """
+        Reserve the next auto-increment ID for an entity collection.
         
-        if 'next_assignment_id' not in st.session_state:
-            st.session_state['next_assignment_id'] = 1
+        Args:
+            entity: Collection name
         
-        if 'next_grade_id' not in st.session_state:
-            st.session_state['next_grade_id'] = 1
+        Returns:
+            Reserved ID
+        """
+        StorageManager.initialize_storage()
+        counter_key = StorageManager.COLLECTIONS[entity]
         
-        if 'next_reminder_id' not in st.session_state:
-            st.session_state['next_reminder_id'] = 1
+        with StorageManager.lock_tenant() as tenant:
+            record_id = tenant.state[counter_key]
+            tenant.state[counter_key] += 1
+            tenant.backend.set_value(counter_key, tenant.state[counter_key])
+        
+        return record_id
+    
+    @staticmethod
+    def to_serializable(record: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Strip private cached fields (keys starting with '_') from a record.
+        
+        Args:
+            record: Record dictionary
+        
+        Returns:
+            Copy of the record containing only persisted fields
+        """
+        if record is None:
+            return None
+        return {key: value for key, value in record.items() if not key.startswith('_')}
+    
+    @staticmethod
+    def save_record(entity: str, record: Dict[str, Any]) -> None:
+        """
+        Insert or update a record in the user's state and the backend.
+        
+        Args:
+            entity: Collection name
+            record: Record dictionary containing an 'id' field
+        """
+        with StorageManager.lock_tenant() as tenant:
+            collection = StorageManager.get_collection(entity)
+            action = 'update' if record['id'] in collection else 'add'
+            collection[record['id']] = record
+            StorageManager.get_size_ledger(entity).update(record['id'], record)
+            tenant.backend.save_record(entity, StorageManager.to_serializable(record))
+        
+        StorageManager._emit(entity, action, record['id'])
     
     @staticmethod
-    def get_storage_info() -> Dict[str, Any]:
+    def delete_record(entity: str, record_id: int) -> bool:
+        """
+        Delete a record from the user's state and the backend.
+        
+        Args:
+            entity: Collection name
+            record_id: Record ID
+        
+        Returns:
+            True if deletion successful, False if record not found
+        """
+        with StorageManager.lock_tenant() as tenant:
+            collection = StorageManager.get_collection(entity)
+            if record_id not in collection:
+                return False
+            
+            del collection[record_id]
+            StorageManager.get_size_ledger(entity).remove(record_id)
+            tenant.backend.delete_record(entity, record_id)
+        
+        StorageManager._emit(entity, 'delete', record_id)
+        return True
+    
+    @staticmethod
+    def save_profile(profile: Optional[Dict[str, Any]]) -> None:
+        """
+        Store the user profile in the user's state and the backend.
+        
+        Args:
+            profile: User profile dictionary, or None to remove it
+        """
+        with StorageManager.lock_tenant() as tenant:
+            tenant.state['user_profile'] = profile
+            tenant.backend.set_value('user_profile', profile)
+        
+        StorageManager._emit('user_profile', 'update' if profile is not None else 'delete')
+    
+    @staticmethod
+    def get_version(entity: str) -> int:
+        """
+        Get the data version of an entity type for the current user.
+        Versions change on every mutation and are unique process-wide, so a
+        cache keyed on them can never confuse two states of the data.
+        
+        Args:
+            entity: Collection name or 'user_profile'
+        
+        Returns:
+            Current version number
+        """
+        versions = StorageManager.state().setdefault('data_versions', {})
+        if entity not in versions:
+            versions[entity] = next(StorageManager._version_counter)
+        return versions[entity]
+    
+    @staticmethod
+    def get_versions(*entities: str) -> tuple:
+        """
+        Get the data versions of several entity types (a cache key).
+        
+        Args:
+            *entities: Collection names and/or 'user_profile'
+        
+        Returns:
+            Tuple of version numbers in argument order
+        """
+        return tuple(StorageManager.get_version(entity) for entity in entities)
+    
+    @staticmethod
+    def subscribe(callback: Callable[[Dict[str, Any]], None],
+                  entities: Optional[Iterable[str]] = None) -> Callable[[], None]:
+        """
+        Register a change-event hook.
+        Called synchronously after each mutation with an event dictionary:
+        {'tenant', 'entity', 'action', 'record_id', 'version'} where action is
+        'add', 'update', 'delete', 'replace' (import) or 'clear'.
+        
+        Args:
+            callback: Function receiving the event
+            entities: Only notify for these entity types (default: all)
+        
+        Returns:
+            Function that removes the subscription
+        """
+        subscription = (callback, frozenset(entities) if entities is not None else None)
+        with StorageManager._subscribers_lock:
+            StorageManager._subscribers.append(subscription)
+        
+        def unsubscribe() -> None:
+            with StorageManager._subscribers_lock:
+                if subscription in StorageManager._subscribers:
+                    StorageManager._subscribers.remove(subscription)
+        
+        return unsubscribe
+    
+    @staticmethod
+    def _emit(entity: str, action: str, record_id: Optional[int] = None) -> None:
+        """Bump an entity's data version and notify subscribers."""
+        tenant = StorageManager.get_tenant()
+        version = next(StorageManager._version_counter)
+        tenant.state.setdefault('data_versions', {})[entity] = version
+        
+        event = {
+            'tenant': tenant.key,
+            'entity': entity,
+            'action': action,
+            'record_id': record_id,
+            'version': version
+        }
+        with StorageManager._subscribers_lock:
+            subscribers = list(StorageManager._subscribers)
+        for callback, entities in subscribers:
+            if entities is None or entity in entities:
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"⚠️ Change event handler failed: {e}")
+    
+    @staticmethod
+    def _save_metadata() -> None:
+        """Persist session metadata to the backend."""
+        with StorageManager.lock_tenant() as tenant:
+            tenant.backend.set_value('metadata', tenant.state['metadata'])
+    
+    @staticmethod
+    def get_storage_info(deep: bool = False) -> Dict[str, Any]:
         """
         Get storage usage information and statistics.
+        Record sizes come from incrementally maintained per-entity ledgers,
+        so this is O(1) in the number of records.
+        
+        Args:
+            deep: Re-measure every record and resynchronize the ledgers
+                  (use for sampling; picks up fields cached on records
+                  outside StorageManager writes)
         
         Returns:
             Dictionary containing storage statistics
         """
         StorageManager.initialize_storage()
+        state = StorageManager.state()
         
         # Count items
-        num_courses = len(st.session_state.get('courses', {}))
-        num_assignments = len(st.session_state.get('assignments', {}))
-        num_grades = len(st.session_state.get('grades', {}))
-        num_reminders = len(st.session_state.get('reminders', {}))
-        
-        # Estimate storage size (rough approximation)
-        # Calculate size of session state data
-        total_size = 0
-        try:
-            # Estimate size of each data structure
-            for key in ['user_profile', 'courses', 'assignments', 'grades', 'reminders', 'metadata']:
-                if key in st.session_state and st.session_state[key] is not None:
-                    total_size += sys.getsizeof(str(st.session_state[key]))
-        except Exception:
-            total_size = 0
+        num_courses = len(StorageManager.get_collection('courses'))
+        num_assignments = len(StorageManager.get_collection('assignments'))
+        num_grades = len(StorageManager.get_collection('grades'))
+        num_reminders = len(StorageManager.get_collection('reminders'))
+        
+        # In-memory size per entity
+        entity_bytes = {}
+        for entity in StorageManager.COLLECTIONS:
+            if deep:
+                state.setdefault('size_ledgers', {}).pop(entity, None)
+            entity_bytes[entity] = StorageManager.get_size_ledger(entity).total
+        
+        # Profile and metadata are single small dictionaries
+        total_size = sum(entity_bytes.values())
+        for key in ['user_profile', 'metadata']:
+            if state.get(key) is not None:
+                total_size += deep_sizeof(state[key])
         
         # Convert to KB/MB
         size_kb = total_size / 1024
         size_mb = size_kb / 1024
         
         # Check if profile exists
-        has_profile = st.session_state.get('user_profile') is not None
+        has_profile = state.get('user_profile') is not None
         
         return {
             'has_profile': has_profile,
@@ -109,37 +562,49 @@ class StorageManager:
             'size_bytes': total_size,
             'size_kb': round(size_kb, 2),
             'size_mb': round(size_mb, 2),
-            'version': st.session_state.get('metadata', {}).get('version', 'Unknown'),
-            'last_export': st.session_state.get('metadata', {}).get('last_export'),
-            'last_import': st.session_state.get('metadata', {}).get('last_import')
+            'entity_bytes': entity_bytes,
+            'version': state.get('metadata', {}).get('version', 'Unknown'),
+            'last_export': state.get('metadata', {}).get('last_export'),
+            'last_import': state.get('metadata', {}).get('last_import')
         }
     
     @staticmethod
     def clear_all_data() -> None:
         """
-        Clear all data from session state.
+        Clear all data of the current user.
         Removes all user data and resets to initial state.
         """
-        # Clear all data structures
-        st.session_state['user_profile'] = None
-        st.session_state['courses'] = {}
-        st.session_state['assignments'] = {}
-        st.session_state['grades'] = {}
-        st.session_state['reminders'] = {}
-        
-        # Reset metadata
-        st.session_state['metadata'] = {
-            'version': StorageManager.DATA_VERSION,
-            'last_export': None,
-            'last_import': None,
-            'created_at': datetime.now().isoformat()
-        }
+        with StorageManager.lock_tenant() as tenant:
+            state = tenant.state
+            
+            # Clear persisted data
+            tenant.backend.clear()
+            
+            # Clear all data structures
+            state['user_profile'] = None
+            state['courses'] = {}
+            state['assignments'] = {}
+            state['grades'] = {}
+            state['reminders'] = {}
+            
+            # Reset metadata
+            state['metadata'] = {
+                'version': StorageManager.DATA_VERSION,
+                'last_export': None,
+                'last_import': None,
+                'created_at': datetime.now().isoformat()
+            }
+            
+            # Reset auto-increment counters
+            state['next_course_id'] = 1
+            state['next_assignment_id'] = 1
+            state['next_grade_id'] = 1
+            state['next_reminder_id'] = 1
+            
+            StorageManager._save_metadata()
         
-        # Reset auto-increment counters
-        st.session_state['next_course_id'] = 1
-        st.session_state['next_assignment_id'] = 1
-        st.session_state['next_grade_id'] = 1
-        st.session_state['next_reminder_id'] = 1
+        for entity in ['user_profile', *StorageManager.COLLECTIONS]:
+            StorageManager._emit(entity, 'clear')
     
     @staticmethod
     def has_data() -> bool:
@@ -152,17 +617,17 @@ class StorageManager:
         StorageManager.initialize_storage()
         
         # Check if profile exists
-        if st.session_state.get('user_profile') is not None:
+        if StorageManager.state().get('user_profile') is not None:
             return True
         
         # Check if any items exist
-        if len(st.session_state.get('courses', {})) > 0:
+        if len(StorageManager.get_collection('courses')) > 0:
             return True
-        if len(st.session_state.get('assignments', {})) > 0:
+        if len(StorageManager.get_collection('assignments')) > 0:
             return True
-        if len(st.session_state.get('grades', {})) > 0:
+        if len(StorageManager.get_collection('grades')) > 0:
             return True
-        if len(st.session_state.get('reminders', {})) > 0:
+        if len(StorageManager.get_collection('reminders')) > 0:
             return True
         
         return False
@@ -177,69 +642,100 @@ class StorageManager:
             Dictionary containing all user data in JSON-serializable format
         """
         StorageManager.initialize_storage()
+        state = StorageManager.state()
         
         # Get current timestamp
         export_timestamp = datetime.now().isoformat()
         
         # Convert courses dict to list
         courses_list = []
-        for course_id, course_data in st.session_state.get('courses', {}).items():
-            courses_list.append(course_data)
+        for course_id, course_data in StorageManager.get_collection('courses').items():
+            courses_list.append(StorageManager.to_serializable(course_data))
         
         # Convert assignments dict to list
         assignments_list = []
-        for assignment_id, assignment_data in st.session_state.get('assignments', {}).items():
-            assignments_list.append(assignment_data)
+        for assignment_id, assignment_data in StorageManager.get_collection('assignments').items():
+            assignments_list.append(StorageManager.to_serializable(assignment_data))
         
         # Convert grades dict to list
         grades_list = []
-        for grade_id, grade_data in st.session_state.get('grades', {}).items():
-            grades_list.append(grade_data)
+        for grade_id, grade_data in StorageManager.get_collection('grades').items():
+            grades_list.append(StorageManager.to_serializable(grade_data))
         
         # Convert reminders dict to list
         reminders_list = []
-        for reminder_id, reminder_data in st.session_state.get('reminders', {}).items():
-            reminders_list.append(reminder_data)
+        for reminder_id, reminder_data in StorageManager.get_collection('reminders').items():
+            reminders_list.append(StorageManager.to_serializable(reminder_data))
         
         # Build export data structure
         export_data = {
             'version': StorageManager.DATA_VERSION,
             'exported_at': export_timestamp,
-            'user_profile': st.session_state.get('user_profile'),
+            'user_profile': state.get('user_profile'),
             'courses': courses_list,
             'assignments': assignments_list,
             'grades': grades_list,
             'reminders': reminders_list,
-            'next_course_id': st.session_state.get('next_course_id', 1),
-            'next_assignment_id': st.session_state.get('next_assignment_id', 1),
-            'next_grade_id': st.session_state.get('next_grade_id', 1),
-            'next_reminder_id': st.session_state.get('next_reminder_id', 1)
+            'next_course_id': state.get('next_course_id', 1),
+            'next_assignment_id': state.get('next_assignment_id', 1),
+            'next_grade_id': state.get('next_grade_id', 1),
+            'next_reminder_id': state.get('next_reminder_id', 1)
         }
         
         # Update metadata with last export timestamp
-        if 'metadata' in st.session_state:
-            st.session_state['metadata']['last_export'] = export_timestamp
+        if 'metadata' in state:
+            state['metadata']['last_export'] = export_timestamp
+            StorageManager._save_metadata()
         
         return export_data
     
     @staticmethod
-    def import_data(data: Dict[str, Any]) -> tuple[bool, str]:
+    def import_data(data: Union[Dict[str, Any], bytes]) -> tuple[bool, str]:
         """
-        Import data from dictionary and update session state.
+        Import data from dictionary and update the user's state.
         Validates data structure and integrity before importing.
+        Binary (compressed columnar) backups are detected automatically.
         
         Args:
-            data: Dictionary containing exported data
+            data: Dictionary containing exported data, or binary backup bytes
         
         Returns:
             Tuple of (success: bool, message: str)
         """
+        try:
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                data = StorageManager._decode_binary(data)
+            
+            success, message, _ = StorageManager.bulk_load(data)
+            return success, message
+            
+        except Exception as e:
+            return False, f"❌ Veri içe aktarma hatası: {str(e)}"
+    
+    @staticmethod
+    def bulk_load(data: Dict[str, Any]) -> tuple[bool, str, Dict[str, float]]:
+        """
+        Validate and load a full export dictionary in bulk.
+        Each entity list goes through the shared import checks
+        (_check_records, _index_records, _next_counter), the same ones used
+        by import_ndjson.
+        
+        Args:
+            data: Dictionary in the layout produced by export_data
+        
+        Returns:
+            Tuple of (success: bool, message: str, timings: Dict[str, float]);
+            timings holds seconds spent per entity plus 'persist' and 'total'
+        """
+        timings: Dict[str, float] = {}
+        total_start = time.perf_counter()
+        
         try:
             # Validate required fields
             required_fields = ['version', 'exported_at']
             for field in required_fields:
                 if field not in data:
-                    return False, f"❌ Geçersiz veri formatı: '{field}' alanı eksik"
+                    return False, f"❌ Geçersiz veri formatı: '{field}' alanı eksik", timings
             
             # Check version compatibility
             imported_version = data.get('version', '0.0.0')
@@ -249,69 +745,324 @@ class StorageManager:
                 pass
             
             # Validate data types
-            if 'user_profile' in data and data['user_profile'] is not None:
-                if not isinstance(data['user_profile'], dict):
-                    return False, "❌ Geçersiz kullanıcı profili formatı"
+            profile = data.get('user_profile')
+            if profile is not None and not isinstance(profile, dict):
+                return False, "❌ Geçersiz kullanıcı profili formatı", timings
             
-            if 'courses' in data and not isinstance(data['courses'], list):
-                return False, "❌ Geçersiz ders listesi formatı"
+            collections = {}
+            counters = {}
             
-            if 'assignments' in data and not isinstance(data['assignments'], list):
-                return False, "❌ Geçersiz ödev listesi formatı"
+            for entity, counter_key in StorageManager.COLLECTIONS.items():
+                entity_start = time.perf_counter()
+                
+                records = data.get(entity, [])
+                if not isinstance(records, list):
+                    return False, StorageManager.IMPORT_LIST_ERRORS[entity], timings
+                
+                error = StorageManager._check_records(entity, records)
+                if error:
+                    return False, error, timings
+                
+                collections[entity] = StorageManager._index_records(records)
+                counters[counter_key] = StorageManager._next_counter(data.get(counter_key, 1), collections[entity])
+                
+                timings[entity] = time.perf_counter() - entity_start
             
-            if 'grades' in data and not isinstance(data['grades'], list):
-                return False, "❌ Geçersiz not listesi formatı"
+            persist_start = time.perf_counter()
+            StorageManager._apply_import(profile, collections, counters)
+            timings['persist'] = time.perf_counter() - persist_start
+            timings['total'] = time.perf_counter() - total_start
             
-            if 'reminders' in data and not isinstance(data['reminders'], list):
-                return False, "❌ Geçersiz hatırlatıcı listesi formatı"
+            return True, "✅ Veriler başarıyla içe aktarıldı!", timings
+            
+        except Exception as e:
+            return False, f"❌ Veri içe aktarma hatası: {str(e)}", timings
+    
+    @staticmethod
+    def _check_records(entity: str, records: List[Any]) -> Optional[str]:
+        """
+        Validate imported records of one entity with whole-column checks.
+        Shared by every import path (bulk_load, import_ndjson), which may call
+        it batch by batch.
+        
+        Args:
+            entity: Collection name
+            records: Imported records
+        
+        Returns:
+            Error message, or None if every record is a dictionary with an
+            integer (or missing) ID
+        """
+        if not set(map(type, records)) <= {dict}:
+            return StorageManager.IMPORT_LIST_ERRORS[entity]
+        ids = map(operator.methodcaller('get', 'id'), records)
+        if not set(map(type, ids)) <= {int, type(None)}:
+            return f"❌ Geçersiz kayıt kimliği ({entity})"
+        return None
+    
+    @staticmethod
+    def _index_records(records: List[Dict[str, Any]],
+                       into: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Key validated records by ID in one pass (records without an ID are skipped).
+        
+        Args:
+            records: Records accepted by _check_records
+            into: Existing map to extend (default: a new one)
+        
+        Returns:
+            Dictionary of records keyed by ID
+        """
+        records_by_id = into if into is not None else {}
+        records_by_id.update(zip(map(operator.methodcaller('get', 'id'), records), records))
+        records_by_id.pop(None, None)
+        return records_by_id
+    
+    @staticmethod
+    def _next_counter(exported_counter: Any, records_by_id: Dict[int, Dict[str, Any]]) -> int:
+        """
+        Derive a next-ID counter that cannot collide with imported records.
+        
+        Args:
+            exported_counter: Counter from the backup (ignored unless an int)
+            records_by_id: Imported records keyed by ID
+        
+        Returns:
+            Next ID past both the exported counter and the largest ID
+        """
+        if not isinstance(exported_counter, int) or isinstance(exported_counter, bool):
+            exported_counter = 1
+        return max(exported_counter, max(records_by_id, default=0) + 1)
+    
+    @staticmethod
+    def _apply_import(profile: Optional[Dict[str, Any]], collections: Dict[str, Dict[int, Dict[str, Any]]],
+                      counters: Dict[str, int]) -> None:
+        """
+        Replace the user's data with validated import results and persist them.
+        
+        Args:
+            profile: Imported user profile (or None)
+            collections: Entity name -> records keyed by ID
+            counters: Counter key -> next ID
+        """
+        with StorageManager.lock_tenant() as tenant:
+            state = tenant.state
             
             # Initialize storage first
             StorageManager.initialize_storage()
             
-            # Import user profile
-            st.session_state['user_profile'] = data.get('user_profile')
+            state['user_profile'] = profile
+            for entity in StorageManager.COLLECTIONS:
+                state[entity] = collections.get(entity, {})
+            for counter_key in StorageManager.COLLECTIONS.values():
+                state[counter_key] = counters.get(counter_key, 1)
+            
+            # Update metadata
+            import_timestamp = datetime.now().isoformat()
+            if 'metadata' in state:
+                state['metadata']['last_import'] = import_timestamp
+                state['metadata']['version'] = StorageManager.DATA_VERSION
+            
+            # Persist imported data in a single backend operation
+            tenant.backend.replace_all(
+                {
+                    entity: [StorageManager.to_serializable(record) for record in state[entity].values()]
+                    for entity in StorageManager.COLLECTIONS
+                },
+                {
+                    'user_profile': state['user_profile'],
+                    'metadata': state['metadata'],
+                    **{key: state[key] for key in StorageManager.COLLECTIONS.values()}
+                }
+            )
+        
+        for entity in ['user_profile', *StorageManager.COLLECTIONS]:
+            StorageManager._emit(entity, 'replace')
+    
+    @staticmethod
+    def export_ndjson() -> Iterator[str]:
+        """
+        Stream all data as newline-delimited JSON.
+        The first line is a header with version, profile, counters and record
+        counts; each following line holds one record. Records are serialized
+        one at a time, so no full copy of the data is built.
+        
+        Yields:
+            JSON lines (including trailing newline)
+        """
+        StorageManager.initialize_storage()
+        state = StorageManager.state()
+        
+        export_timestamp = datetime.now().isoformat()
+        
+        header = {
+            'format': StorageManager.NDJSON_FORMAT,
+            'version': StorageManager.DATA_VERSION,
+            'exported_at': export_timestamp,
+            'user_profile': state.get('user_profile'),
+            'counts': {entity: len(StorageManager.get_collection(entity)) for entity in StorageManager.COLLECTIONS},
+            **{key: state.get(key, 1) for key in StorageManager.COLLECTIONS.values()}
+        }
+        yield json.dumps(header, ensure_ascii=False, separators=(',', ':')) + '\n'
+        
+        for entity in StorageManager.COLLECTIONS:
+            for record in list(StorageManager.get_collection(entity).values()):
+                line = {'type': entity, 'data': StorageManager.to_serializable(record)}
+                yield json.dumps(line, ensure_ascii=False, separators=(',', ':')) + '\n'
+        
+        # Update metadata with last export timestamp
+        if 'metadata' in state:
+            state['metadata']['last_export'] = export_timestamp
+            StorageManager._save_metadata()
+    
+    @staticmethod
+    def export_binary(codec: str = 'zlib') -> bytes:
+        """
+        Export all data as a compact binary backup.
+        Records are stored as one column table per entity type and compressed;
+        the uncompressed header carries the data version, profile, counters
+        and record counts.
+        
+        Args:
+            codec: Compression codec ('zlib' or 'lzma')
+        
+        Returns:
+            Binary backup bytes
+        """
+        data = StorageManager.export_data()
+        
+        header = {
+            'format': StorageManager.BINARY_FORMAT,
+            'version': data['version'],
+            'exported_at': data['exported_at'],
+            'user_profile': data['user_profile'],
+            'counts': {entity: len(data[entity]) for entity in StorageManager.COLLECTIONS},
+            **{key: data[key] for key in StorageManager.COLLECTIONS.values()}
+        }
+        tables = {entity: backup_codec.encode_columns(data[entity]) for entity in StorageManager.COLLECTIONS}
+        
+        return backup_codec.pack(header, tables, codec)
+    
+    @staticmethod
+    def _decode_binary(data: bytes) -> Dict[str, Any]:
+        """
+        Convert a binary backup into the dictionary layout used by import_data.
+        
+        Args:
+            data: Binary backup bytes
+        
+        Returns:
+            Dictionary in the same layout as export_data
+        """
+        header, tables = backup_codec.unpack(data)
+        if header.get('format') != StorageManager.BINARY_FORMAT:
+            raise ValueError("Bilinmeyen yedek formatı")
+        
+        decoded = {key: value for key, value in header.items() if key not in ('format', 'counts', 'codec', 'payload_crc32')}
+        for entity in StorageManager.COLLECTIONS:
+            records = backup_codec.decode_columns(tables.get(entity, {}))
+            expected = header.get('counts', {}).get(entity, len(records))
+            if len(records) != expected:
+                raise ValueError(f"{entity}: {len(records)} kayıt bulundu, {expected} bekleniyordu")
+            decoded[entity] = records
+        return decoded
+    
+    @staticmethod
+    def read_backup_header(stream: IO) -> Optional[Dict[str, Any]]:
+        """
+        Read the header of an NDJSON or binary backup without loading records.
+        
+        Args:
+            stream: Binary or text file object positioned at the start
+        
+        Returns:
+            Header dictionary, or None if the stream is a legacy JSON backup
+        """
+        prefix = stream.read(len(backup_codec.MAGIC))
+        if isinstance(prefix, bytes) and backup_codec.is_binary_backup(prefix):
+            return backup_codec.read_header_from_stream(stream, prefix)
+        
+        first_line = prefix + stream.readline()
+        if isinstance(first_line, bytes):
+            first_line = first_line.decode('utf-8')
+        
+        try:
+            header = json.loads(first_line)
+        except json.JSONDecodeError:
+            return None
+        
+        if not isinstance(header, dict) or header.get('format') != StorageManager.NDJSON_FORMAT:
+            return None
+        return header
+    
+    @staticmethod
+    def import_ndjson(stream: IO, batch_size: int = 500) -> tuple[bool, str]:
+        """
+        Import an NDJSON backup incrementally.
+        Lines are parsed, validated and inserted batch by batch; session data
+        is only replaced after the whole file has been validated.
+        
+        Args:
+            stream: Binary or text file object positioned at the start
+            batch_size: Number of records validated and inserted per batch
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            header = StorageManager.read_backup_header(stream)
+            if header is None or header.get('format') != StorageManager.NDJSON_FORMAT:
+                return False, "❌ Geçersiz veri formatı: yedek başlığı bulunamadı"
             
-            # Import courses (convert list to dict with ID keys)
-            courses_dict = {}
-            for course in data.get('courses', []):
-                if 'id' in course:
-                    courses_dict[course['id']] = course
-            st.session_state['courses'] = courses_dict
+            profile = header.get('user_profile')
+            if profile is not None and not isinstance(profile, dict):
+                return False, "❌ Geçersiz kullanıcı profili formatı"
             
-            # Import assignments (convert list to dict with ID keys)
-            assignments_dict = {}
-            for assignment in data.get('assignments', []):
-                if 'id' in assignment:
-                    assignments_dict[assignment['id']] = assignment
-            st.session_state['assignments'] = assignments_dict
+            collections = {entity: {} for entity in StorageManager.COLLECTIONS}
             
-            # Import grades (convert list to dict with ID keys)
-            grades_dict = {}
-            for grade in data.get('grades', []):
-                if 'id' in grade:
-                    grades_dict[grade['id']] = grade
-            st.session_state['grades'] = grades_dict
+            def insert_batch(batch: list) -> Optional[str]:
+                # Validate the whole batch before inserting any of it
+                grouped = {entity: [] for entity in collections}
+                for line_number, line in batch:
+                    if (not isinstance(line, dict) or line.get('type') not in collections
+                            or not isinstance(line.get('data'), dict)):
+                        return f"❌ Geçersiz kayıt formatı (satır {line_number})"
+                    grouped[line['type']].append(line['data'])
+                for entity, records in grouped.items():
+                    error = StorageManager._check_records(entity, records)
+                    if error:
+                        return error
+                for entity, records in grouped.items():
+                    StorageManager._index_records(records, into=collections[entity])
+                return None
             
-            # Import reminders (convert list to dict with ID keys)
-            reminders_dict = {}
-            for reminder in data.get('reminders', []):
-                if 'id' in reminder:
-                    reminders_dict[reminder['id']] = reminder
-            st.session_state['reminders'] = reminders_dict
+            batch = []
+            for line_number, raw_line in enumerate(stream, start=2):
+                if isinstance(raw_line, bytes):
+                    raw_line = raw_line.decode('utf-8')
+                if not raw_line.strip():
+                    continue
+                
+                batch.append((line_number, json.loads(raw_line)))
+                if len(batch) >= batch_size:
+                    error = insert_batch(batch)
+                    if error:
+                        return False, error
+                    batch = []
             
-            # Import ID counters
-            st.session_state['next_course_id'] = data.get('next_course_id', 1)
-            st.session_state['next_assignment_id'] = data.get('next_assignment_id', 1)
-            st.session_state['next_grade_id'] = data.get('next_grade_id', 1)
-            st.session_state['next_reminder_id'] = data.get('next_reminder_id', 1)
+            error = insert_batch(batch)
+            if error:
+                return False, error
             
-            # Update metadata
-            import_timestamp = datetime.now().isoformat()
-            if 'metadata' in st.session_state:
-                st.session_state['metadata']['last_import'] = import_timestamp
-                st.session_state['metadata']['version'] = StorageManager.DATA_VERSION
+            counters = {
+                counter_key: StorageManager._next_counter(header.get(counter_key, 1), collections[entity])
+                for entity, counter_key in StorageManager.COLLECTIONS.items()
+            }
+            StorageManager._apply_import(profile, collections, counters)
             
             return True, "✅ Veriler başarıyla içe aktarıldı!"
-            
+        
+        except json.JSONDecodeError as e:
+            return False, f"❌ Geçersiz JSON satırı: {str(e)}"
         except Exception as e:
             return False, f"❌ Veri içe aktarma hatası: {str(e)}"
@@ -0,0 +1,313 @@
+"""
+Tenant Store for DERSLY Streamlit application.
+Process-level store holding each user's data once, shared by all of that
+user's browser sessions. Idle tenants are evicted to disk in LRU order.
+"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from utils.storage_backend import StorageBackend, SQLiteBackend, create_backend
+from utils.write_behind import WriteBehindBackend
+
+
+# Tenant keys are used as file names, so only a safe alphabet is allowed
+TENANT_KEY_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+# (collections, values) pair written to disk when a tenant is evicted
+Snapshot = Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Any]]
+
+# Files kept next to a tenant database (SQLite WAL and the write-behind journal)
+SIDECAR_SUFFIXES = ('-wal', '-shm', '.wbq', '.wbq.inflight', '.wbq.rotating')
+
+
+class Tenant:
+    """
+    Data of one user.
+    `state` replaces the data keys previously kept in st.session_state
+    (profile, metadata, counters, collections and derived indexes).
+    """
+
+    def __init__(self, key: str, backend: StorageBackend, managed: bool = True):
+        """
+        Create an empty tenant.
+
+        Args:
+            key: Tenant key
+            backend: Persistence backend of this tenant
+            managed: Whether the store opened the backend (and owns its file)
+        """
+        self.key = key
+        self.backend = backend
+        self.managed = managed
+        self.state: Dict[str, Any] = {}
+        self.lock = threading.RLock()
+        self.last_access = time.monotonic()
+
+        # Set (under `lock`) when the store drops this tenant; holders must re-acquire
+        self.evicted = False
+
+
+class TenantStore:
+    """
+    Lock-protected, LRU-ordered map of tenant key -> Tenant.
+    When more than `capacity` tenants are resident, tenants idle for at least
+    `min_idle_seconds` are evicted: persistent backends are closed, and
+    in-memory tenants with data are spilled to `<data_dir>/<key>.db`, which is
+    reopened the next time the tenant is acquired.
+
+    Tenant files only stay reachable through the user's recovery code, so
+    files of tenants without data are deleted on eviction, and files not
+    opened for `retention_seconds` are garbage-collected (see
+    collect_garbage).
+    """
+
+    # Seconds between garbage collection passes triggered by acquire()
+    GC_INTERVAL = 3600
+
+    def __init__(self, snapshot: Callable[[Tenant], Snapshot], backend_name: str = 'memory',
+                 data_dir: str = 'dersly_data', capacity: int = 200, min_idle_seconds: float = 300,
+                 write_behind: bool = True, flush_interval: float = 1.0,
+                 retention_seconds: float = 180 * 24 * 3600):
+        """
+        Create an empty store.
+
+        Args:
+            snapshot: Returns the persisted form (collections, values) of a tenant
+            backend_name: Backend for new tenants ("memory" or "sqlite")
+            data_dir: Directory of per-tenant database files
+            capacity: Number of tenants kept in memory
+            min_idle_seconds: Minimum idle time before a tenant may be evicted
+            write_behind: Queue writes to tenant databases (see utils/write_behind.py)
+            flush_interval: Maximum seconds a queued write waits before it is applied
+            retention_seconds: Age after which unopened tenant files are deleted
+        """
+        self.snapshot = snapshot
+        self.backend_name = backend_name
+        self.data_dir = data_dir
+        self.capacity = capacity
+        self.min_idle_seconds = min_idle_seconds
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.retention_seconds = retention_seconds
+        self._tenants: 'OrderedDict[str, Tenant]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._last_collected = time.monotonic()
+
+    @staticmethod
+    def is_valid_key(key: Any) -> bool:
+        """
+        Check whether a value can be used as a tenant key.
+
+        Args:
+            key: Candidate key
+
+        Returns:
+            True if the key is a short, file-name safe string
+        """
+        return isinstance(key, str) and TENANT_KEY_PATTERN.match(key) is not None
+
+    def path_for(self, key: str) -> str:
+        """
+        Get the database file of a tenant.
+
+        Args:
+            key: Tenant key
+
+        Returns:
+            Path of the tenant's SQLite file
+        """
+        if not self.is_valid_key(key):
+            raise ValueError(f"Geçersiz kullanıcı anahtarı: {key!r}")
+        return os.path.join(self.data_dir, f"{key}.db")
+
+    def _open_backend(self, key: str) -> StorageBackend:
+        """Open the backend of a tenant that is not resident."""
+        path = self.path_for(key)
+        if self.backend_name == 'sqlite' or os.path.exists(path):
+            os.makedirs(self.data_dir, exist_ok=True)
+            if os.path.exists(path):
+                # Opening counts as use for garbage collection
+                os.utime(path)
+            if self.write_behind:
+                return WriteBehindBackend(SQLiteBackend(path), journal_path=path + '.wbq',
+                                          flush_interval=self.flush_interval)
+            return SQLiteBackend(path)
+        return create_backend(self.backend_name)
+
+    def acquire(self, key: str) -> Tenant:
+        """
+        Get a tenant, loading it (from disk if evicted) when not resident.
+
+        Args:
+            key: Tenant key
+
+        Returns:
+            Resident Tenant
+        """
+        with self._lock:
+            tenant = self._tenants.get(key)
+            if tenant is None:
+                tenant = Tenant(key, self._open_backend(key))
+                self._tenants[key] = tenant
+                self._evict_idle()
+                if time.monotonic() - self._last_collected >= self.GC_INTERVAL:
+                    self.collect_garbage()
+            else:
+                self._tenants.move_to_end(key)
+            tenant.last_access = time.monotonic()
+            return tenant
+
+    @contextmanager
+    def locked(self, key: str) -> Iterator[Tenant]:
+        """
+        Acquire a tenant and hold its lock.
+        If the tenant is evicted between acquiring and locking, it is
+        acquired again (reopening its backend), so callers never write to a
+        closed backend.
+
+        Args:
+            key: Tenant key
+
+        Yields:
+            Resident, locked Tenant
+        """
+        while True:
+            tenant = self.acquire(key)
+            with tenant.lock:
+                if not tenant.evicted:
+                    yield tenant
+                    return
+
+    def exists(self, key: str) -> bool:
+        """
+        Check whether a tenant is resident or stored on disk.
+
+        Args:
+            key: Tenant key
+
+        Returns:
+            True if the tenant has been created before
+        """
+        with self._lock:
+            return key in self._tenants or os.path.exists(self.path_for(key))
+
+    def resident_keys(self) -> List[str]:
+        """
+        Get the keys of tenants held in memory, least recently used first.
+
+        Returns:
+            List of tenant keys
+        """
+        with self._lock:
+            return list(self._tenants)
+
+    def evict(self, key: str, wait: bool = True) -> bool:
+        """
+        Remove a tenant from memory, writing in-memory data to disk first.
+        A tenant whose lock is held (a write in progress) is not evicted
+        until the lock is released; the store lock is not held meanwhile, so
+        the writer can still acquire tenants.
+
+        Args:
+            key: Tenant key
+            wait: Wait for a busy tenant instead of leaving it resident
+
+        Returns:
+            True if the tenant was evicted
+        """
+        while True:
+            with self._lock:
+                tenant = self._tenants.get(key)
+                if tenant is None:
+                    return False
+                if tenant.lock.acquire(blocking=False):
+                    try:
+                        del self._tenants[key]
+                        tenant.evicted = True
+                        self._release(tenant)
+                    finally:
+                        tenant.lock.release()
+                    return True
+            if not wait:
+                return False
+            with tenant.lock:
+                pass
+
+    def _release(self, tenant: Tenant) -> None:
+        """Close or spill the backend of an evicted tenant. Caller holds tenant.lock."""
+        if tenant.backend.is_persistent:
+            if tenant.managed:
+                has_data = self._has_data(tenant)
+                tenant.backend.close()
+                if not has_data:
+                    self._remove_files(tenant.key)
+            return
+
+        collections, values = self.snapshot(tenant)
+        has_data = any(collections.values()) or values.get('user_profile') is not None
+        if has_data:
+            os.makedirs(self.data_dir, exist_ok=True)
+            spill = SQLiteBackend(self.path_for(tenant.key))
+            spill.replace_all(collections, values)
+            spill.close()
+
+    def _has_data(self, tenant: Tenant) -> bool:
+        """Check whether a tenant has any records or a profile."""
+        collections, values = self.snapshot(tenant)
+        return any(collections.values()) or values.get('user_profile') is not None
+
+    def _remove_files(self, key: str) -> None:
+        """Delete a tenant's database file and its sidecar files."""
+        path = self.path_for(key)
+        for file_path in [path, *(path + suffix for suffix in SIDECAR_SUFFIXES)]:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    def collect_garbage(self) -> int:
+        """
+        Delete files of tenants that are not resident and were not opened or
+        written for `retention_seconds`. Their recovery codes are treated as
+        abandoned; nothing else can reach these files.
+
+        Returns:
+            Number of tenants removed
+        """
+        with self._lock:
+            self._last_collected = time.monotonic()
+            if not os.path.isdir(self.data_dir):
+                return 0
+
+            cutoff = time.time() - self.retention_seconds
+            removed = 0
+            for name in os.listdir(self.data_dir):
+                key, extension = os.path.splitext(name)
+                if extension != '.db' or not self.is_valid_key(key) or key in self._tenants:
+                    continue
+                path = self.path_for(key)
+                files = [file_path for file_path in [path, *(path + suffix for suffix in SIDECAR_SUFFIXES)]
+                         if os.path.exists(file_path)]
+                if max(os.path.getmtime(file_path) for file_path in files) < cutoff:
+                    self._remove_files(key)
+                    removed += 1
+            return removed
+
+    def evict_all(self) -> None:
+        """Evict every resident tenant (used on shutdown)."""
+        for key in self.resident_keys():
+            self.evict(key)
+
+    def _evict_idle(self) -> None:
+        """Evict least recently used tenants while over capacity."""
+        now = time.monotonic()
+        while len(self._tenants) > self.capacity:
+            key, tenant = next(iter(self._tenants.items()))
+            if now - tenant.last_access < self.min_idle_seconds:
+                # Oldest tenant is still active, so every other one is too
+                break
+            if not self.evict(key, wait=False):
+                # Busy writing: in use after all
+                break
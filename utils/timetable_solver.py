@@ -0,0 +1,246 @@
+"""
+Timetable Solver for DERSLY Streamlit application.
+Finds conflict-free weekly schedules from candidate course sections and
+ranks them by gaps between classes, early starts and days on campus.
+
+Sections are converted to week bitsets (see utils/week_mask.py), so a
+conflict test is one AND. The search is a backtracking search that always
+branches on the course with the fewest remaining compatible sections,
+drops sections that clash with a choice (forward checking) and stops
+exploring partial schedules that cannot beat the current top results.
+"""
+import heapq
+import itertools
+from typing import Dict, Any, List, Optional, Tuple
+from utils.department_catalog import TimeSlotSuggestions
+from utils.week_mask import DAYS, MINUTES_PER_DAY, time_to_minutes, meeting_mask, day_profile
+
+
+# Default ranking weights, in penalty minutes
+DEFAULT_WEIGHTS = {
+    'gaps': 1.0,     # per idle minute between the first and last class of a day
+    'early': 1.0,    # per minute a day starts before `early_before`
+    'days': 120.0    # per day with at least one class
+}
+
+
+def sections_from_slots(days: List[str], duration: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Build candidate sections from TimeSlotSuggestions.COMMON_SLOTS.
+
+    Args:
+        days: Days the course may be held on
+        duration: Only use slots of this length in minutes (default: all)
+
+    Returns:
+        List of single-meeting sections
+    """
+    sections = []
+    for day in days:
+        for slot in TimeSlotSuggestions.COMMON_SLOTS:
+            if duration is not None and slot['duration'] != duration:
+                continue
+            sections.append({
+                'section': f"{day[:3]} {slot['start']}",
+                'meetings': [{'day': day, 'start_time': slot['start'], 'end_time': slot['end']}]
+            })
+    return sections
+
+
+def schedule_to_courses(schedule: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Convert a solved schedule to course records for CourseManager.add_course.
+
+    Args:
+        schedule: One result of TimetableSolver.solve()
+
+    Returns:
+        List of course dictionaries, one per weekly meeting
+    """
+    courses = []
+    for choice in schedule['sections']:
+        for meeting in choice['meetings']:
+            courses.append({
+                'course_name': choice['course_name'],
+                'course_code': choice['course_code'],
+                'day': meeting['day'],
+                'start_time': meeting['start_time'],
+                'end_time': meeting['end_time'],
+                **({'credits': choice['credits']} if 'credits' in choice else {})
+            })
+    return courses
+
+
+class TimetableSolver:
+    """
+    Ranks conflict-free combinations of course sections.
+    Each course request is a dictionary with course_code, course_name,
+    optional credits and 'sections': a list of {'section', 'meetings'} where
+    meetings are {'day', 'start_time', 'end_time'} dictionaries.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, early_before: str = "09:00", limit: int = 5):
+        """
+        Configure the ranking.
+
+        Args:
+            weights: Overrides of DEFAULT_WEIGHTS ('gaps', 'early', 'days')
+            early_before: Classes starting before this time count as early
+            limit: Number of schedules returned
+        """
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.early_before = time_to_minutes(early_before)
+        self.limit = limit
+
+        # Search nodes visited by the last solve() call
+        self.nodes = 0
+
+    def _measure(self, mask: int) -> Tuple[int, int, int]:
+        """Get (gap minutes, early minutes, days on campus) of a week mask."""
+        gaps = early = days = 0
+        for day in day_profile(mask):
+            gaps += day['gap']
+            early += max(0, self.early_before - day['first'])
+            days += 1
+        return gaps, early, days
+
+    def _score(self, gaps: int, early: int, days: int) -> float:
+        """Weighted penalty of a schedule (lower is better)."""
+        return gaps * self.weights['gaps'] + early * self.weights['early'] + days * self.weights['days']
+
+    def _option(self, mask: int, section: Dict[str, Any]) -> tuple:
+        """
+        Precompute a section's bound data: (mask, section, days bitset,
+        ((day number, first minute), ...)).
+        """
+        days = 0
+        firsts = []
+        for day in day_profile(mask):
+            days |= 1 << day['day_number']
+            firsts.append((day['day_number'], day['first']))
+        return mask, section, days, tuple(firsts)
+
+    def solve(self, requests: List[Dict[str, Any]],
+              fixed_courses: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Find the best conflict-free schedules.
+
+        Args:
+            requests: Course requests with candidate sections
+            fixed_courses: Courses that are already taken (e.g.,
+                CourseManager.get_all_courses()); sections must not overlap them
+
+        Returns:
+            Up to `limit` schedules, best first, each with score, gap_minutes,
+            early_minutes, days_on_campus and the chosen 'sections'
+            (empty if no conflict-free schedule exists)
+        """
+        self.nodes = 0
+        early_before = self.early_before
+        day_weight = self.weights['days']
+        early_weight = self.weights['early']
+
+        base = 0
+        for course in fixed_courses or []:
+            base |= meeting_mask(course)
+
+        # (request position, [option]) without sections clashing with fixed courses
+        domains = []
+        for position, request in enumerate(requests):
+            options = []
+            for section in request['sections']:
+                mask = 0
+                for meeting in section['meetings']:
+                    meeting_bits = meeting_mask(meeting)
+                    if mask & meeting_bits:
+                        # Section overlaps itself
+                        mask = None
+                        break
+                    mask |= meeting_bits
+                if mask is not None and not mask & base:
+                    options.append(self._option(mask, section))
+            if not options:
+                return []
+            domains.append((position, options))
+
+        def penalty(days: int, firsts: tuple) -> float:
+            """Days and early-start part of the score; it never decreases as classes are added."""
+            early = sum(max(0, early_before - first) for first in firsts)
+            return bin(days).count('1') * day_weight + early * early_weight
+
+        def extend(days: int, firsts: tuple, option: tuple) -> Tuple[int, tuple]:
+            """Combine a partial schedule's days/first minutes with a section."""
+            merged = list(firsts)
+            for day_number, first in option[3]:
+                if first < merged[day_number]:
+                    merged[day_number] = first
+            return days | option[2], tuple(merged)
+
+        # Max-heap of the best results so far: (-score, tiebreak, choices, mask)
+        best: List[tuple] = []
+        tiebreak = itertools.count()
+
+        def search(mask: int, days: int, firsts: tuple, choices: Dict[int, Dict[str, Any]],
+                   remaining: List[tuple]) -> None:
+            self.nodes += 1
+
+            if not remaining:
+                score = self._score(*self._measure(mask))
+                entry = (-score, -next(tiebreak), dict(choices), mask)
+                if len(best) < self.limit:
+                    heapq.heappush(best, entry)
+                elif score < -best[0][0]:
+                    heapq.heapreplace(best, entry)
+                return
+
+            # Branch on the course with the fewest compatible sections
+            pick = min(range(len(remaining)), key=lambda i: len(remaining[i][1]))
+            position, options = remaining[pick]
+            rest = remaining[:pick] + remaining[pick + 1:]
+
+            for option in options:
+                new_mask = mask | option[0]
+                new_days, new_firsts = extend(days, firsts, option)
+
+                # Every remaining course must still fit (forward checking). The
+                # bound is the worst, over remaining courses, of the cheapest way
+                # to add that course: valid because the penalty only grows.
+                bound = penalty(new_days, new_firsts)
+                filtered = []
+                for other_position, other_options in rest:
+                    compatible = [other for other in other_options if not other[0] & new_mask]
+                    if not compatible:
+                        break
+                    filtered.append((other_position, compatible))
+                    if len(best) == self.limit:
+                        bound = max(bound, min(penalty(*extend(new_days, new_firsts, other)) for other in compatible))
+                else:
+                    if len(best) == self.limit and bound >= -best[0][0]:
+                        continue
+                    choices[position] = option[1]
+                    search(new_mask, new_days, new_firsts, choices, filtered)
+                    del choices[position]
+
+        base_days, base_firsts = extend(0, (MINUTES_PER_DAY,) * len(DAYS), self._option(base, {}))
+        search(base, base_days, base_firsts, {}, domains)
+
+        results = []
+        for negative_score, _, choices, mask in sorted(best, key=lambda entry: (-entry[0], -entry[1])):
+            gaps, early, days = self._measure(mask)
+            results.append({
+                'score': -negative_score,
+                'gap_minutes': gaps,
+                'early_minutes': early,
+                'days_on_campus': days,
+                'sections': [
+                    {
+                        'course_code': requests[position].get('course_code'),
+                        'course_name': requests[position].get('course_name'),
+                        **({'credits': requests[position]['credits']} if 'credits' in requests[position] else {}),
+                        'section': choices[position].get('section'),
+                        'meetings': choices[position]['meetings']
+                    }
+                    for position in range(len(requests))
+                ]
+            })
+        return results
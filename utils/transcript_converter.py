@@ -0,0 +1,104 @@
+"""
+Transcript Converter for DERSLY Streamlit application.
+Converts a grade history between GPA systems (e.g., after transferring to a
+university with a different scale) using the compiled GPASystem tables.
+"""
+from typing import Optional, Dict, Any, List
+import numpy as np
+from utils.gpa_systems import GPASystem
+from utils.grade_manager import GradeManager
+
+
+class TranscriptConverter:
+    """
+    Converts whole transcripts between GPA systems.
+    Stored grade points are snapped to the source system's letters, then
+    mapped through the cached source -> target conversion table, so a
+    transcript costs a few array operations regardless of its length.
+    """
+    
+    @staticmethod
+    def convert_grades(grades: List[Dict[str, Any]], from_system: str, to_system: str) -> Dict[str, Any]:
+        """
+        Convert grade entries from one system to another.
+        
+        Args:
+            grades: Grade dictionaries with grade (points in the source
+                system) and credits; course_name, semester and year are copied
+            from_system: Source system name
+            to_system: Target system name
+        
+        Returns:
+            Dictionary with:
+                - from_system, to_system: Resolved system names
+                - courses: Per-grade dictionaries in input order (grade_id,
+                  course_name, semester, year, credits, source_point,
+                  source_letter, target_letter, target_point)
+                - grade_count, total_credits
+                - source_gpa, target_gpa: Credit-weighted GPAs rounded to two
+                  decimals (0.0 without credits)
+        """
+        source = GPASystem.compile(from_system)
+        target = GPASystem.compile(to_system)
+        table = GPASystem.conversion_table(source.name, target.name)
+        
+        count = len(grades)
+        points = np.fromiter((float(g.get('grade', 0)) for g in grades), dtype=np.float64, count=count)
+        credits = np.fromiter((int(g.get('credits', 0)) for g in grades), dtype=np.int64, count=count)
+        
+        source_codes = source.codes_for(points)
+        target_codes = table[source_codes]
+        target_points = target.points[target_codes]
+        
+        total_credits = int(credits.sum())
+        
+        def gpa(values: np.ndarray) -> float:
+            if total_credits == 0:
+                return 0.0
+            return round(float(values @ credits) / total_credits, 2)
+        
+        courses = [
+            {
+                'grade_id': grade.get('id'),
+                'course_name': grade.get('course_name'),
+                'semester': grade.get('semester'),
+                'year': grade.get('year'),
+                'credits': grade_credits,
+                'source_point': source_point,
+                'source_letter': source.letters[source_code],
+                'target_letter': target.letters[target_code],
+                'target_point': target_point
+            }
+            for grade, grade_credits, source_point, source_code, target_code, target_point in zip(
+                grades, credits.tolist(), points.tolist(), source_codes.tolist(),
+                target_codes.tolist(), target_points.tolist()
+            )
+        ]
+        
+        return {
+            'from_system': source.name,
+            'to_system': target.name,
+            'courses': courses,
+            'grade_count': count,
+            'total_credits': total_credits,
+            'source_gpa': gpa(points),
+            'target_gpa': gpa(target_points)
+        }
+    
+    @staticmethod
+    def convert_transcript(from_system: str, to_system: str,
+                           grades: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Convert the current user's transcript between systems.
+        
+        Args:
+            from_system: System the stored grades are in
+            to_system: Target system name
+            grades: Grade entries to convert (default: GradeManager.get_all_grades())
+        
+        Returns:
+            Conversion result (see convert_grades)
+        """
+        if grades is None:
+            grades = GradeManager.get_all_grades()
+        return TranscriptConverter.convert_grades(grades, from_system, to_system)
@@ -2,11 +2,21 @@
 Modern UI styles for DERSLY application.
 Enhanced with glassmorphism, better animations, and improved UX.
 """
+import base64
+import functools
+import hashlib
+import os
+import re
+import streamlit as st
+from typing import Optional, Tuple
 
+
+@functools.lru_cache(maxsize=None)
 def get_modern_css(theme="light") -> str:
     """
     Returns enhanced modern CSS styling for the entire application.
     Uses soft, eye-friendly colors with glassmorphism effects.
+    Built once per theme and cached for the lifetime of the process.
     
     Args:
         theme: "light" or "dark"
@@ -690,25 +700,96 @@ def get_modern_css(theme="light") -> str:
     """
 
 
-def apply_modern_style(theme="light"):
-    """Apply enhanced modern CSS styling to the current page."""
-    import streamlit as st
-    st.markdown(get_modern_css(theme), unsafe_allow_html=True)
+# Quoted CSS strings, kept byte for byte by minify_css
+_CSS_STRING = r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\''
+
+_CSS_STRING_OR_COMMENT = re.compile(rf'({_CSS_STRING})|/\*.*?\*/', re.DOTALL)
+
+
+def _squeeze_css(code: str) -> str:
+    """Collapse whitespace in CSS code outside strings."""
+    code = re.sub(r'\s+', ' ', code)
+    code = re.sub(r'\s*([{};,])\s*', r'\1', code)
+    return code.replace(';}', '}')
+
+
+def minify_css(css: str) -> str:
+    """
+    Minify a CSS (or <style> block) string.
+    Removes comments and redundant whitespace; quoted strings and values
+    (e.g., the spaces in calc()) are left unchanged.
+    
+    Args:
+        css: CSS source
+    
+    Returns:
+        Minified CSS
+    """
+    css = re.sub(r'</?style>', '', css)
+    css = _CSS_STRING_OR_COMMENT.sub(lambda match: match.group(1) or '', css)
+    
+    # Odd items are strings
+    parts = re.split(f'({_CSS_STRING})', css)
+    return ''.join(part if i % 2 else _squeeze_css(part) for i, part in enumerate(parts)).strip()
+
+
+@functools.lru_cache(maxsize=None)
+def get_css_bundle(theme="light", include_mobile=False) -> Tuple[str, str]:
+    """
+    Build the minified application stylesheet once per theme.
+    
+    Args:
+        theme: "light" or "dark"
+        include_mobile: Also include MobileUtils responsive styles
+    
+    Returns:
+        Tuple of (style block, content hash)
+    """
+    parts = [get_modern_css(theme)]
+    if include_mobile:
+        from utils.mobile_utils import MobileUtils
+        parts.append(MobileUtils.get_responsive_css())
+    
+    css = ''.join(minify_css(part) for part in parts)
+    content_hash = hashlib.sha1(css.encode()).hexdigest()[:12]
+    
+    return f'<style data-dersly-css="{content_hash}">{css}</style>', content_hash
+
+
+def apply_modern_style(theme="light", include_mobile=False):
+    """
+    Apply enhanced modern CSS styling to the current page.
+    Emits one cached, minified style block. Streamlit drops elements that
+    are not re-emitted on rerun, so the block is sent on every run.
+    """
+    style_block, _ = get_css_bundle(theme, include_mobile)
+    st.markdown(style_block, unsafe_allow_html=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_logo_base64(logo_path: str = "logo-512x512.webp") -> Optional[str]:
+    """
+    Read and base64-encode the logo once per process.
+    
+    Args:
+        logo_path: Path to the logo image
+    
+    Returns:
+        Base64-encoded image, or None if the file does not exist
+    """
+    if not os.path.exists(logo_path):
+        return None
+    with open(logo_path, "rb") as img_file:
+        return base64.b64encode(img_file.read()).decode()
 
 
 def show_logo_in_sidebar():
     """Display animated logo in sidebar with reminder count."""
-    import streamlit as st
-    import os
-    import base64
     from utils.reminder_manager import ReminderManager
     
-    logo_path = "logo-512x512.webp"
-    if os.path.exists(logo_path):
-        with open(logo_path, "rb") as img_file:
-            logo_base64 = base64.b64encode(img_file.read()).decode()
-        
-        # Get urgent reminder count
+    logo_base64 = get_logo_base64()
+    if logo_base64 is not None:
+        # Get urgent reminder count (memoized by the reminder engine)
         try:
             reminder_counts = ReminderManager.get_reminder_count()
             urgent_count = reminder_counts.get('urgent', 0)
@@ -1,8 +1,7 @@
 """
 User Manager for DERSLY Streamlit application.
-Manages user profile operations using session state.
+Manages user profile operations.
 """
-import streamlit as st
 from datetime import datetime
 from typing import Optional, Dict, Any
 from utils.storage_manager import StorageManager
@@ -11,13 +10,14 @@ from utils.storage_manager import StorageManager
 class UserManager:
     """
     Simplified user management without database.
-    Stores single user profile in session state.
+    Stores a single profile in the current session's tenant. Profile fields
+    are plain data: they never select or switch the tenant.
     """
     
     @staticmethod
     def create_profile(name: str, email: str, **kwargs) -> Dict[str, Any]:
         """
-        Create user profile in session state.
+        Create user profile in the current session's data.
         
         Args:
             name: User's full name
@@ -38,19 +38,19 @@ class UserManager:
             'created_at': datetime.now().isoformat()
         }
         
-        st.session_state['user_profile'] = profile
+        StorageManager.save_profile(profile)
         return profile
     
     @staticmethod
     def get_profile() -> Optional[Dict[str, Any]]:
         """
-        Get current user profile from session state.
+        Get current user profile.
         
         Returns:
             User profile dictionary if exists, None otherwise
         """
         StorageManager.initialize_storage()
-        return st.session_state.get('user_profile')
+        return StorageManager.state().get('user_profile')
     
     @staticmethod
     def update_profile(updates: Dict[str, Any]) -> bool:
@@ -65,7 +65,7 @@ class UserManager:
         """
         StorageManager.initialize_storage()
         
-        profile = st.session_state.get('user_profile')
+        profile = StorageManager.state().get('user_profile')
         if profile is None:
             return False
         
@@ -74,25 +74,25 @@ class UserManager:
             if key in ['name', 'email', 'student_id', 'department', 'class_year']:
                 profile[key] = value
         
-        st.session_state['user_profile'] = profile
+        StorageManager.save_profile(profile)
         return True
     
     @staticmethod
     def is_profile_exists() -> bool:
         """
-        Check if user profile exists in session state.
+        Check if user profile exists.
         
         Returns:
             True if profile exists, False otherwise
         """
         StorageManager.initialize_storage()
-        profile = st.session_state.get('user_profile')
+        profile = StorageManager.state().get('user_profile')
         return profile is not None
     
     @staticmethod
     def delete_profile() -> None:
         """
-        Delete user profile from session state.
+        Delete user profile.
         """
         StorageManager.initialize_storage()
-        st.session_state['user_profile'] = None
+        StorageManager.save_profile(None)
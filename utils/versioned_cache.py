@@ -0,0 +1,133 @@
+"""
+Versioned Cache for DERSLY Streamlit application.
+Memoizes read-only manager methods on the data versions of the entity
+collections they read (see StorageManager.get_version), so results are
+reused across reruns and pages until the data actually changes.
+"""
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List
+from utils.storage_manager import StorageManager
+
+
+# Every cache created by versioned_cache, for statistics
+_CACHES: List['VersionedCache'] = []
+
+
+class VersionedCache:
+    """
+    Bounded LRU cache of one function's results.
+    Keys combine the call arguments with the current data versions. Versions
+    are unique process-wide, so entries of different users or of older data
+    can never match; they simply age out of the LRU order.
+    """
+
+    def __init__(self, name: str, entities: tuple, maxsize: int = 128):
+        """
+        Create an empty cache.
+
+        Args:
+            name: Name of the cached function (used in statistics)
+            entities: Entity types whose versions are part of the key
+            maxsize: Maximum number of cached results
+        """
+        self.name = name
+        self.entities = entities
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[tuple, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """
+        Return a cached result, calling the function on a miss.
+
+        Args:
+            func: Function being cached
+            args: Positional arguments of the call
+            kwargs: Keyword arguments of the call
+
+        Returns:
+            Function result
+        """
+        StorageManager.initialize_storage()
+        key = (StorageManager.get_versions(*self.entities), args, tuple(sorted(kwargs.items())))
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        result = func(*args, **kwargs)
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def info(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics.
+
+        Returns:
+            Dictionary with name, hits, misses, size and maxsize
+        """
+        with self._lock:
+            return {
+                'name': self.name,
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
+
+    def clear(self) -> None:
+        """Drop all cached results and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def versioned_cache(*entities: str, maxsize: int = 128) -> Callable:
+    """
+    Memoize a function on its arguments and the given entity versions.
+    Cached results are shared between calls and must not be modified by
+    callers. Apply below @staticmethod.
+
+    Args:
+        *entities: Entity types the function reads (e.g., "courses")
+        maxsize: Maximum number of cached results
+
+    Returns:
+        Decorator adding cache_info() and cache_clear() to the function
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = VersionedCache(func.__qualname__, entities, maxsize)
+        _CACHES.append(cache)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return cache.get_or_compute(func, args, kwargs)
+
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def get_cache_stats() -> List[Dict[str, Any]]:
+    """
+    Get statistics of every versioned cache.
+
+    Returns:
+        List of cache_info() dictionaries
+    """
+    return [cache.info() for cache in _CACHES]
@@ -0,0 +1,310 @@
+"""
+Week Mask for DERSLY Streamlit application.
+Represents weekly time occupancy as a single integer bitset with one bit per
+minute of the week (7 x 1440 bits), so overlap tests are a single AND.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MINUTES_PER_DAY = 24 * 60
+
+# All bits of one day
+DAY_BITS = (1 << MINUTES_PER_DAY) - 1
+
+# int.bit_count is only available on Python 3.10+
+_bit_count = getattr(int, 'bit_count', None) or (lambda mask: bin(mask).count('1'))
+
+
+def time_to_minutes(time_str: str) -> int:
+    """
+    Convert an HH:MM time string to minutes after midnight.
+
+    Args:
+        time_str: Time in HH:MM format
+
+    Returns:
+        Minutes after midnight
+
+    Raises:
+        ValueError: If the string is not in HH:MM format
+    """
+    hours, minutes = map(int, time_str.split(':'))
+    return hours * 60 + minutes
+
+
+def minute_range(start: int, end: int) -> int:
+    """
+    Build the bits of a minute range within one day.
+
+    Args:
+        start: Start in minutes after midnight
+        end: End in minutes after midnight (exclusive)
+
+    Returns:
+        Day bitset with the range set (0 for an empty range)
+    """
+    start = max(start, 0)
+    end = min(end, MINUTES_PER_DAY)
+    if end <= start:
+        return 0
+    return ((1 << (end - start)) - 1) << start
+
+
+def slot_mask(day: str, start: int, end: int) -> int:
+    """
+    Build the mask of a time slot.
+
+    Args:
+        day: Day of week (e.g., "Monday")
+        start: Start in minutes after midnight
+        end: End in minutes after midnight (exclusive)
+
+    Returns:
+        Bitset with the slot's minutes set (0 for an empty or unknown slot)
+    """
+    if day not in DAYS:
+        return 0
+    return minute_range(start, end) << (DAYS.index(day) * MINUTES_PER_DAY)
+
+
+def meeting_mask(meeting: Dict[str, Any]) -> int:
+    """
+    Build the mask of a course meeting.
+
+    Args:
+        meeting: Dictionary with day, start_time and end_time (HH:MM)
+
+    Returns:
+        Bitset of the meeting
+    """
+    return slot_mask(meeting['day'], time_to_minutes(meeting['start_time']), time_to_minutes(meeting['end_time']))
+
+
+def day_bits(mask: int, day_number: int) -> int:
+    """
+    Extract one day of a week mask.
+
+    Args:
+        mask: Week bitset
+        day_number: Day index (0 = Monday)
+
+    Returns:
+        Bitset of the day's 1440 minutes
+    """
+    return (mask >> (day_number * MINUTES_PER_DAY)) & DAY_BITS
+
+
+def count_minutes(mask: int) -> int:
+    """
+    Count occupied minutes.
+
+    Args:
+        mask: Bitset
+
+    Returns:
+        Number of set bits
+    """
+    return _bit_count(mask)
+
+
+def first_minute(bits: int) -> Optional[int]:
+    """Get the lowest set minute of a day bitset, or None if empty."""
+    if not bits:
+        return None
+    return (bits & -bits).bit_length() - 1
+
+
+def last_minute(bits: int) -> Optional[int]:
+    """Get the highest set minute of a day bitset, or None if empty."""
+    if not bits:
+        return None
+    return bits.bit_length() - 1
+
+
+def day_profile(mask: int) -> List[Dict[str, int]]:
+    """
+    Summarize each occupied day of a week mask.
+
+    Args:
+        mask: Week bitset
+
+    Returns:
+        List of dictionaries with day_number, first, last (inclusive minutes),
+        busy and gap minutes, one per day that has any occupancy
+    """
+    profile = []
+    for day_number in range(len(DAYS)):
+        bits = day_bits(mask, day_number)
+        if not bits:
+            continue
+        first = first_minute(bits)
+        last = last_minute(bits)
+        busy = count_minutes(bits)
+        profile.append({
+            'day_number': day_number,
+            'first': first,
+            'last': last,
+            'busy': busy,
+            'gap': (last - first + 1) - busy
+        })
+    return profile
+
+
+def free_runs(bits: int, start: int = 0, end: int = MINUTES_PER_DAY) -> List[Tuple[int, int]]:
+    """
+    Get the unoccupied (start, end) minute ranges of a day within a window.
+
+    Args:
+        bits: Day bitset
+        start: Window start in minutes
+        end: Window end in minutes (exclusive)
+
+    Returns:
+        List of free ranges ordered by start, end exclusive
+    """
+    free = ~bits & minute_range(start, end)
+
+    runs = []
+    while free:
+        low = (free & -free).bit_length() - 1
+        shifted = free >> low
+        # x ^ (x + 1) sets the trailing ones of x plus one more bit
+        length = (shifted ^ (shifted + 1)).bit_length() - 1
+        runs.append((low, low + length))
+        free &= ~(((1 << length) - 1) << low)
+    return runs
+
+
+class WeekOccupancy:
+    """
+    Minute-resolution occupancy of the weekly schedule.
+    Keeps one 1440-bit integer per day (the union of that day's courses) so
+    totals, busiest day, free slots and overlap checks are bit operations.
+    Updated incrementally; removing a course rebuilds only its day.
+    """
+
+    def __init__(self):
+        """Create an empty week."""
+        # Day number -> union of the day's course bits
+        self.days: List[int] = [0] * len(DAYS)
+
+        # id -> (day number, bits) currently included
+        self.entries: Dict[int, Tuple[int, int]] = {}
+
+    def add(self, record_id: int, day: str, start: int, end: int) -> None:
+        """
+        Add or move a course.
+
+        Args:
+            record_id: Course ID
+            day: Day of week
+            start: Start in minutes
+            end: End in minutes (exclusive)
+        """
+        if record_id in self.entries:
+            self.remove(record_id)
+        if day not in DAYS:
+            return
+
+        day_number = DAYS.index(day)
+        bits = minute_range(start, end)
+        self.entries[record_id] = (day_number, bits)
+        self.days[day_number] |= bits
+
+    def remove(self, record_id: int) -> None:
+        """
+        Remove a course.
+
+        Args:
+            record_id: Course ID
+        """
+        entry = self.entries.pop(record_id, None)
+        if entry is None:
+            return
+
+        day_number = entry[0]
+        bits = 0
+        for other_day, other_bits in self.entries.values():
+            if other_day == day_number:
+                bits |= other_bits
+        self.days[day_number] = bits
+
+    def week_mask(self) -> int:
+        """
+        Get the whole week as one 7 x 1440 bit integer.
+
+        Returns:
+            Week bitset (compatible with slot_mask/meeting_mask)
+        """
+        mask = 0
+        for day_number, bits in enumerate(self.days):
+            mask |= bits << (day_number * MINUTES_PER_DAY)
+        return mask
+
+    def total_minutes(self, day: Optional[str] = None) -> int:
+        """
+        Get occupied minutes (overlapping courses are counted once).
+
+        Args:
+            day: Day of week (default: whole week)
+
+        Returns:
+            Number of occupied minutes
+        """
+        if day is not None:
+            return _bit_count(self.days[DAYS.index(day)]) if day in DAYS else 0
+        return sum(_bit_count(bits) for bits in self.days)
+
+    def minutes_by_day(self) -> Dict[str, int]:
+        """
+        Get occupied minutes of every day.
+
+        Returns:
+            Dictionary of day -> minutes
+        """
+        return {day: _bit_count(bits) for day, bits in zip(DAYS, self.days)}
+
+    def busiest_day(self) -> Optional[str]:
+        """
+        Get the day with the most class minutes.
+
+        Returns:
+            Day name, or None if the week is empty
+        """
+        minutes = self.minutes_by_day()
+        day = max(DAYS, key=lambda name: minutes[name])
+        return day if minutes[day] else None
+
+    def is_free(self, day: str, start: int, end: int) -> bool:
+        """
+        Check whether a slot overlaps no course.
+
+        Args:
+            day: Day of week
+            start: Start in minutes
+            end: End in minutes (exclusive)
+
+        Returns:
+            True if the slot is free
+        """
+        if day not in DAYS:
+            return True
+        return not self.days[DAYS.index(day)] & minute_range(start, end)
+
+    def free_slots(self, day: str, min_minutes: int = 1, start: int = 0,
+                   end: int = MINUTES_PER_DAY) -> List[Tuple[int, int]]:
+        """
+        Get free ranges of a day.
+
+        Args:
+            day: Day of week
+            min_minutes: Shortest range to report
+            start: Window start in minutes (e.g., 8 * 60)
+            end: Window end in minutes (exclusive)
+
+        Returns:
+            List of (start, end) minute ranges ordered by start
+        """
+        bits = self.days[DAYS.index(day)] if day in DAYS else 0
+        return [run for run in free_runs(bits, start, end) if run[1] - run[0] >= min_minutes]
@@ -0,0 +1,381 @@
+"""
+Write-Behind Queue for DERSLY Streamlit application.
+Defers backend writes to a shared pool of background workers that apply
+them in batches.
+
+Every write is appended to a journal file before it is acknowledged and
+replayed when the backend is reopened. The journal is not fsynced on the
+caller's thread: the flush worker fsyncs it once per batch (group commit),
+just before applying the batch. A process crash therefore loses nothing
+(journaled lines are already in the OS page cache), while an OS crash or
+power loss can lose the writes of the last `flush_interval` seconds that
+were not yet flushed.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from utils.storage_backend import StorageBackend
+
+
+# Open queues, flushed when the interpreter exits
+_QUEUES: 'weakref.WeakSet[WriteBehindBackend]' = weakref.WeakSet()
+
+# Worker threads shared by all queues (DERSLY_WRITE_BEHIND_WORKERS)
+WORKERS = max(1, int(os.getenv('DERSLY_WRITE_BEHIND_WORKERS', '2')))
+
+
+def flush_all() -> None:
+    """Flush every open write-behind queue (registered as a shutdown hook)."""
+    for queue in list(_QUEUES):
+        try:
+            queue.flush()
+        except Exception as e:
+            print(f"⚠️ Write-behind flush failed for {queue.journal_path}: {e}")
+
+
+atexit.register(flush_all)
+
+
+Operation = Tuple[str, Any, Any]
+
+
+class _FlushScheduler:
+    """
+    One timer thread and a fixed worker pool flushing every open queue, so
+    the number of threads does not grow with the number of tenant databases.
+    Queues register the time their pending writes are due; the timer hands
+    due queues to the pool.
+    """
+
+    def __init__(self, workers: int):
+        """
+        Start the timer thread and the worker pool.
+
+        Args:
+            workers: Number of flush worker threads
+        """
+        self._condition = threading.Condition()
+        self._due: Dict['WriteBehindBackend', float] = {}
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dersly-write-behind')
+        self._thread = threading.Thread(target=self._run, name='dersly-write-behind-timer', daemon=True)
+        self._thread.start()
+
+    def schedule(self, queue: 'WriteBehindBackend', due: float) -> None:
+        """
+        Flush a queue at `due` (monotonic time) unless it is already due earlier.
+
+        Args:
+            queue: Queue with pending writes
+            due: Monotonic time of the flush
+        """
+        with self._condition:
+            current = self._due.get(queue)
+            if current is None or due < current:
+                self._due[queue] = due
+                self._condition.notify()
+
+    def cancel(self, queue: 'WriteBehindBackend') -> None:
+        """Forget a queue's scheduled flush (on close)."""
+        with self._condition:
+            self._due.pop(queue, None)
+
+    def _run(self) -> None:
+        """Timer loop: wait for the earliest due queue and submit it to the pool."""
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                ready = [queue for queue, due in self._due.items() if due <= now]
+                if not ready:
+                    self._condition.wait(min(self._due.values()) - now if self._due else None)
+                    continue
+                for queue in ready:
+                    del self._due[queue]
+
+            for queue in ready:
+                try:
+                    self._pool.submit(queue._flush_scheduled)
+                except RuntimeError:
+                    # Interpreter shutdown: flush_all() takes over
+                    return
+
+
+_scheduler: Optional[_FlushScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def _get_scheduler() -> _FlushScheduler:
+    """Get the process-wide flush scheduler, starting it on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = _FlushScheduler(WORKERS)
+        return _scheduler
+
+
+def _operation_key(operation: Operation) -> tuple:
+    """Key under which later writes replace earlier ones in a batch."""
+    name, first, second = operation
+    if name == 'set_value':
+        return ('value', first)
+    if name == 'save_record':
+        return ('record', first, second['id'])
+    return ('record', first, second)
+
+
+class WriteBehindBackend(StorageBackend):
+    """
+    Backend wrapper that queues writes and applies them in batches.
+    A shared worker (see _FlushScheduler) flushes the queue `flush_interval`
+    seconds after its first pending write, or as soon as `max_batch`
+    distinct records/values are pending. Repeated writes to the same record
+    are coalesced, and each flush is a single apply_batch() call (one
+    transaction on SQLite).
+    """
+
+    def __init__(self, backend: StorageBackend, journal_path: Optional[str] = None,
+                 flush_interval: float = 1.0, max_batch: int = 200):
+        """
+        Wrap a backend and replay any journal left by a previous crash.
+
+        Args:
+            backend: Backend receiving the batched writes
+            journal_path: Append-only journal file (None disables journaling)
+            flush_interval: Maximum seconds a write stays queued
+            max_batch: Pending writes that trigger an early flush
+        """
+        self.backend = backend
+        self.journal_path = journal_path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.batches_applied = 0
+
+        self._pending: Dict[tuple, Operation] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+
+        self._journal = None
+        if journal_path:
+            self._recover()
+            self._journal = open(journal_path, 'a', encoding='utf-8')
+
+        self._scheduler = _get_scheduler()
+        _QUEUES.add(self)
+
+    @property
+    def is_persistent(self) -> bool:
+        return self.backend.is_persistent
+
+    @property
+    def _inflight_path(self) -> str:
+        return self.journal_path + '.inflight'
+
+    @property
+    def _rotating_path(self) -> str:
+        return self.journal_path + '.rotating'
+
+    def pending_count(self) -> int:
+        """
+        Get the number of queued (coalesced) writes.
+
+        Returns:
+            Number of pending writes
+        """
+        with self._lock:
+            return len(self._pending)
+
+    # Reads see all queued writes
+
+    def load_collection(self, entity: str) -> Dict[int, Dict[str, Any]]:
+        self.flush()
+        return self.backend.load_collection(entity)
+
+    def get_value(self, key: str) -> Any:
+        self.flush()
+        return self.backend.get_value(key)
+
+    # Writes are queued
+
+    def save_record(self, entity: str, record: Dict[str, Any]) -> None:
+        self._enqueue([('save_record', entity, record)])
+
+    def delete_record(self, entity: str, record_id: int) -> None:
+        self._enqueue([('delete_record', entity, record_id)])
+
+    def set_value(self, key: str, value: Any) -> None:
+        self._enqueue([('set_value', key, value)])
+
+    def apply_batch(self, operations: List[Operation]) -> None:
+        self._enqueue(operations)
+
+    # Full replacements supersede everything queued and run synchronously
+
+    def replace_all(self, collections: Dict[str, List[Dict[str, Any]]], values: Dict[str, Any]) -> None:
+        with self._flush_lock:
+            self._discard_pending()
+            self.backend.replace_all(collections, values)
+
+    def clear(self) -> None:
+        with self._flush_lock:
+            self._discard_pending()
+            self.backend.clear()
+
+    def close(self) -> None:
+        """Flush queued writes, leave the worker pool and close the wrapped backend."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._scheduler.cancel(self)
+        self.flush()
+        if self._journal:
+            self._journal.close()
+            os.remove(self.journal_path)
+        _QUEUES.discard(self)
+        self.backend.close()
+
+    def flush(self) -> None:
+        """
+        Apply all queued writes to the wrapped backend as one batch.
+        The batch's journal segment is fsynced first, outside self._lock, so
+        writers are never blocked on the disk.
+        On failure the writes are re-queued (newer writes still win), retried
+        one interval later, and the error is raised.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                batch = self._pending
+                self._pending = {}
+                segment = self._rotate_journal()
+
+            self._sync_segment(segment)
+            try:
+                self.backend.apply_batch(list(batch.values()))
+            except Exception:
+                with self._lock:
+                    batch.update(self._pending)
+                    self._pending = batch
+                    if not self._closed:
+                        self._scheduler.schedule(self, time.monotonic() + self.flush_interval)
+                raise
+
+            self.batches_applied += 1
+            if self.journal_path and os.path.exists(self._inflight_path):
+                os.remove(self._inflight_path)
+
+    def _enqueue(self, operations: List[Operation]) -> None:
+        """
+        Journal a batch of writes and add them to the pending batch.
+        The journal is written to the OS but not fsynced here (see flush()).
+        """
+        lines = []
+        queued = []
+        for operation in operations:
+            line = json.dumps(operation, ensure_ascii=False)
+            if operation[0] == 'set_value':
+                # Values (metadata, profile) are mutated in place by callers
+                operation = tuple(json.loads(line))
+            lines.append(line + '\n')
+            queued.append(operation)
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write-behind queue is closed")
+            if self._journal:
+                self._journal.write(''.join(lines))
+                self._journal.flush()
+
+            was_empty = not self._pending
+            for operation in queued:
+                self._pending[_operation_key(operation)] = operation
+
+            if len(self._pending) >= self.max_batch:
+                self._scheduler.schedule(self, time.monotonic())
+            elif was_empty and self._pending:
+                self._scheduler.schedule(self, time.monotonic() + self.flush_interval)
+
+    def _flush_scheduled(self) -> None:
+        """Flush from a pool worker (a failed batch is rescheduled by flush())."""
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"⚠️ Write-behind flush failed for {self.journal_path}: {e}")
+
+    def _rotate_journal(self) -> Optional[Tuple[Any, str]]:
+        """
+        Start a new journal file for writes arriving while a batch is applied.
+        Only renames and opens files; syncing and copying the old segment are
+        left to _sync_segment(). Caller holds self._lock.
+
+        Returns:
+            (old journal handle, path it was renamed to), or None without a journal
+        """
+        if not self._journal:
+            return None
+
+        # A previous batch failed: its writes stay in the in-flight file, ahead of the new ones
+        target = self._rotating_path if os.path.exists(self._inflight_path) else self._inflight_path
+        os.replace(self.journal_path, target)
+        segment = (self._journal, target)
+        self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        return segment
+
+    def _sync_segment(self, segment: Optional[Tuple[Any, str]]) -> None:
+        """
+        Fsync a rotated journal segment and merge it into the in-flight file.
+        Caller holds self._flush_lock but not self._lock.
+        """
+        if segment is None:
+            return
+
+        journal, path = segment
+        os.fsync(journal.fileno())
+        journal.close()
+        if path == self._rotating_path:
+            with open(path, encoding='utf-8') as source, \
+                    open(self._inflight_path, 'a', encoding='utf-8') as target:
+                target.write(source.read())
+                target.flush()
+                os.fsync(target.fileno())
+            os.remove(path)
+
+    def _discard_pending(self) -> None:
+        """Drop queued writes and truncate the journal. Caller holds self._flush_lock."""
+        with self._lock:
+            self._pending = {}
+            if self._journal:
+                self._journal.truncate(0)
+            if self.journal_path and os.path.exists(self._inflight_path):
+                os.remove(self._inflight_path)
+
+    def _recover(self) -> None:
+        """Replay journaled writes left behind by a crash, oldest first."""
+        batch: Dict[tuple, Operation] = {}
+        paths = [self._inflight_path, self._rotating_path, self.journal_path]
+
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            with open(path, encoding='utf-8') as journal:
+                for line in journal:
+                    try:
+                        operation = tuple(json.loads(line))
+                    except json.JSONDecodeError:
+                        # Torn final line from a crash mid-write
+                        break
+                    batch[_operation_key(operation)] = operation
+
+        if batch:
+            self.backend.apply_batch(list(batch.values()))
+            print(f"⚠️ Replayed {len(batch)} journaled writes from {self.journal_path}")
+
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
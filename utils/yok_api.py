@@ -3,8 +3,11 @@ YÖK (Yükseköğretim Kurulu) API integration for DERSLY.
 Fetches university and department information from YÖK Atlas.
 Uses yokatlas-py library: https://github.com/saidsurucu/yokatlas-py
 """
-from typing import List, Dict, Optional
-import json
+from typing import List, Dict, Optional, Any, Callable
+import os
+import time
+from utils.yok_cache import YokCache
+from utils.yok_index import UniversityIndex, DepartmentIndex
 
 try:
     from yokatlas import YokAtlas
@@ -17,14 +20,157 @@ except ImportError:
 class YokAPI:
     """
     YÖK API integration for fetching university and department data.
-    Uses YÖK Atlas API when available, falls back to static data.
+    Reads the disk cache (see utils/yok_cache.py) first and falls back to
+    static data. YÖK Atlas is only contacted when remote fetching is enabled
+    (DERSLY_YOK_REMOTE=1) and the cached entry is missing or expired, so
+    cold starts never wait on the network.
     """
     
     _yokatlas = None
-    _cache = {
-        'universities': None,
-        'departments': None
-    }
+    
+    # key -> (version, data) copies of disk cache entries
+    _cache: Dict[str, tuple] = {}
+    
+    # key -> (monotonic time, fresh) of the last disk version check
+    _checked: Dict[str, tuple] = {}
+    
+    # Seconds a disk version check is trusted; avoids a SQLite query on every keystroke
+    version_check_interval = float(os.getenv('DERSLY_YOK_CHECK_INTERVAL', '5'))
+    
+    # Default result count of the search helpers (autocomplete lists)
+    SEARCH_LIMIT = 50
+    
+    # Disk cache, opened on first use (DERSLY_YOK_CACHE, default <DERSLY_DATA_DIR>/yok_cache.db)
+    _disk_cache: Optional[YokCache] = None
+    
+    # Whether expired or missing entries may be fetched from YÖK Atlas
+    remote_enabled = os.getenv('DERSLY_YOK_REMOTE', '0') == '1'
+    
+    # Search indexes by kind ("universities", "departments"), built once per data version
+    _indexes: Dict[str, Any] = {}
+    
+    @staticmethod
+    def get_university_index() -> UniversityIndex:
+        """
+        Get the search index of the current university list.
+        Rebuilt only when the list changes (e.g., after a cache refresh).
+        
+        Returns:
+            UniversityIndex
+        """
+        universities = YokAPI.get_all_universities()
+        index = YokAPI._indexes.get('universities')
+        if index is None or index.source is not universities:
+            index = UniversityIndex(universities)
+            YokAPI._indexes['universities'] = index
+        return index
+    
+    @staticmethod
+    def get_department_index() -> DepartmentIndex:
+        """
+        Get the search index of the current department list.
+        Rebuilt only when the list changes.
+        
+        Returns:
+            DepartmentIndex
+        """
+        departments = YokAPI.get_all_departments()
+        index = YokAPI._indexes.get('departments')
+        if index is None or index.source is not departments:
+            index = DepartmentIndex(departments)
+            YokAPI._indexes['departments'] = index
+        return index
+    
+    @staticmethod
+    def get_disk_cache() -> Optional[YokCache]:
+        """Get the disk cache, opening it on first use (None if it cannot be opened)."""
+        if YokAPI._disk_cache is None:
+            path = os.getenv('DERSLY_YOK_CACHE') or os.path.join(os.getenv('DERSLY_DATA_DIR', 'dersly_data'), 'yok_cache.db')
+            try:
+                YokAPI._disk_cache = YokCache(path)
+            except Exception as e:
+                print(f"⚠️ Could not open YÖK cache: {e}")
+        return YokAPI._disk_cache
+    
+    @staticmethod
+    def set_disk_cache(cache: Optional[YokCache]) -> None:
+        """
+        Use another disk cache (e.g., a temporary one in tests).
+        
+        Args:
+            cache: YokCache instance, or None to reopen the default on next use
+        """
+        YokAPI._disk_cache = cache
+        YokAPI._cache.clear()
+        YokAPI._checked.clear()
+    
+    @staticmethod
+    def _cached(key: str, fetch: Callable[[], Any], fallback: Any) -> Any:
+        """
+        Read an entry through the in-process copy and the disk cache.
+        The disk entry's version is checked at most once per
+        `version_check_interval` seconds, and its data is only loaded when
+        the version differs from the in-process copy.
+        
+        Args:
+            key: Cache key
+            fetch: Remote fetch returning data or None
+            fallback: Static data used when nothing is cached
+        
+        Returns:
+            Cached, freshly fetched or fallback data
+        """
+        now = time.monotonic()
+        memo = YokAPI._cache.get(key)
+        checked = YokAPI._checked.get(key)
+        if (memo is not None and checked is not None and now - checked[0] < YokAPI.version_check_interval
+                and (checked[1] or not YokAPI.remote_enabled)):
+            return memo[1]
+        
+        disk = YokAPI.get_disk_cache()
+        data = fallback
+        fresh = False
+        
+        if disk is not None:
+            try:
+                stat = disk.stat(key)
+                if stat is None:
+                    YokAPI._cache[key] = (None, fallback)
+                else:
+                    if memo is not None and memo[0] == stat[0]:
+                        data = memo[1]
+                    else:
+                        entry = disk.get(key)
+                        data = entry['data']
+                        YokAPI._cache[key] = (entry['version'], data)
+                    fresh = disk.is_fresh(stat[1])
+                YokAPI._checked[key] = (now, fresh)
+            except Exception as e:
+                print(f"⚠️ Could not read YÖK cache: {e}")
+        
+        if fresh or not YokAPI.remote_enabled:
+            return data
+        
+        fetched = fetch()
+        if not fetched:
+            return data
+        
+        if disk is not None:
+            try:
+                YokAPI._cache[key] = (disk.put(key, fetched), fetched)
+                YokAPI._checked[key] = (time.monotonic(), True)
+            except Exception as e:
+                print(f"⚠️ Could not write YÖK cache: {e}")
+        return fetched
+    
+    @staticmethod
+    def refresh() -> None:
+        """Fetch universities from YÖK Atlas into the cache now, regardless of age."""
+        disk = YokAPI.get_disk_cache()
+        universities = YokAPI._fetch_universities()
+        if disk is not None and universities:
+            YokAPI._cache['universities'] = (disk.put('universities', universities), universities)
+            YokAPI._checked['universities'] = (time.monotonic(), True)
     
     @staticmethod
     def _get_yokatlas():
@@ -128,60 +274,55 @@ class YokAPI:
     def get_all_universities() -> List[Dict[str, any]]:
         """
         Get list of all universities.
-        Tries to fetch from YÖK Atlas API, falls back to static data.
+        Reads the YÖK cache, falls back to static data.
         
         Returns:
             List of university dictionaries with id, name, city, type
         """
-        # Try to use cached data first
-        if YokAPI._cache['universities'] is not None:
-            return YokAPI._cache['universities']
-        
-        # Try to fetch from YÖK Atlas
+        return YokAPI._cached('universities', YokAPI._fetch_universities, YokAPI.UNIVERSITIES)
+    
+    @staticmethod
+    def _fetch_universities() -> Optional[List[Dict[str, Any]]]:
+        """Fetch universities from YÖK Atlas (None if unavailable)."""
         yokatlas = YokAPI._get_yokatlas()
         if yokatlas:
             try:
-                # Fetch universities from API
                 unis = yokatlas.get_universities()
                 if unis:
                     # Convert to our format
-                    result = []
-                    for i, uni in enumerate(unis[:50]):  # Limit to 50 for performance
-                        result.append({
+                    return [
+                        {
                             'id': i + 1,
                             'name': uni.get('name', ''),
                             'city': uni.get('city', 'Bilinmiyor'),
                             'type': uni.get('type', 'Bilinmiyor')
-                        })
-                    YokAPI._cache['universities'] = result
-                    return result
+                        }
+                        for i, uni in enumerate(unis[:50])  # Limit to 50 for performance
+                    ]
             except Exception as e:
                 print(f"⚠️ Could not fetch from YÖK Atlas: {e}")
-        
-        # Fallback to static data
-        return YokAPI.UNIVERSITIES
+        return None
     
     @staticmethod
-    def search_universities(query: str) -> List[Dict[str, any]]:
+    def search_universities(query: str, limit: Optional[int] = SEARCH_LIMIT) -> List[Dict[str, any]]:
         """
         Search universities by name.
+        Matching ignores case and Turkish letters ("bogazici" finds
+        "Boğaziçi Üniversitesi"); name and word prefix matches come first.
         
         Args:
             query: Search query
+            limit: Maximum number of results (default: SEARCH_LIMIT, None for all)
             
         Returns:
             List of matching universities
         """
-        query_lower = query.lower()
-        return [
-            uni for uni in YokAPI.UNIVERSITIES
-            if query_lower in uni['name'].lower()
-        ]
+        return YokAPI.get_university_index().search(query, limit)
     
     @staticmethod
     def get_university_by_name(name: str) -> Optional[Dict[str, any]]:
         """
-        Get university by exact name.
+        Get university by name (ignoring case and Turkish letters).
         
         Args:
             name: University name
@@ -189,10 +330,7 @@ class YokAPI:
         Returns:
             University dictionary or None
         """
-        for uni in YokAPI.UNIVERSITIES:
-            if uni['name'] == name:
-                return uni
-        return None
+        return YokAPI.get_university_index().get_by_name(name)
     
     @staticmethod
     def get_all_departments() -> Dict[str, List[str]]:
@@ -202,7 +340,8 @@ class YokAPI:
         Returns:
             Dictionary of faculty -> departments
         """
-        return YokAPI.DEPARTMENTS
+        # No remote source for programs yet: served from the cache when seeded
+        return YokAPI._cached('departments', lambda: None, YokAPI.DEPARTMENTS)
     
     @staticmethod
     def get_departments_by_faculty(faculty: str) -> List[str]:
@@ -215,7 +354,7 @@ class YokAPI:
         Returns:
             List of department names
         """
-        return YokAPI.DEPARTMENTS.get(faculty, [])
+        return YokAPI.get_all_departments().get(faculty, [])
     
     @staticmethod
     def get_all_departments_flat() -> List[str]:
@@ -223,30 +362,23 @@ class YokAPI:
         Get all departments as a flat list.
         
         Returns:
-            List of all department names
+            Sorted list of distinct department names
         """
-        all_deps = []
-        for deps in YokAPI.DEPARTMENTS.values():
-            all_deps.extend(deps)
-        return sorted(all_deps)
+        return list(YokAPI.get_department_index().flat)
     
     @staticmethod
-    def search_departments(query: str) -> List[str]:
+    def search_departments(query: str, limit: Optional[int] = SEARCH_LIMIT) -> List[str]:
         """
-        Search departments by name.
+        Search departments by name (ignoring case and Turkish letters).
         
         Args:
             query: Search query
+            limit: Maximum number of results (default: SEARCH_LIMIT, None for all)
             
         Returns:
-            List of matching department names
+            List of matching department names, best first
         """
-        query_lower = query.lower()
-        all_deps = YokAPI.get_all_departments_flat()
-        return [
-            dep for dep in all_deps
-            if query_lower in dep.lower()
-        ]
+        return YokAPI.get_department_index().search(query, limit)
     
     @staticmethod
     def get_university_info(university_name: str) -> Dict[str, any]:
@@ -265,7 +397,7 @@ class YokAPI:
                 "name": uni['name'],
                 "city": uni['city'],
                 "type": uni['type'],
-                "available_faculties": list(YokAPI.DEPARTMENTS.keys())
+                "available_faculties": list(YokAPI.get_all_departments().keys())
             }
         return {}
     
@@ -277,8 +409,7 @@ class YokAPI:
         Returns:
             Sorted list of city names
         """
-        cities = set(uni['city'] for uni in YokAPI.UNIVERSITIES)
-        return sorted(cities)
+        return list(YokAPI.get_university_index().cities)
     
     @staticmethod
     def get_universities_by_city(city: str) -> List[Dict[str, any]]:
@@ -291,10 +422,7 @@ class YokAPI:
         Returns:
             List of universities in that city
         """
-        return [
-            uni for uni in YokAPI.UNIVERSITIES
-            if uni['city'] == city
-        ]
+        return YokAPI.get_university_index().get_by_city(city)
     
     @staticmethod
     def get_universities_by_type(uni_type: str) -> List[Dict[str, any]]:
@@ -307,7 +435,4 @@ class YokAPI:
         Returns:
             List of universities of that type
         """
-        return [
-            uni for uni in YokAPI.UNIVERSITIES
-            if uni['type'] == uni_type
-        ]
+        return YokAPI.get_university_index().get_by_type(uni_type)
@@ -0,0 +1,152 @@
+"""
+YÖK data cache for DERSLY Streamlit application.
+Persists university and program lists fetched from YÖK Atlas in a small
+SQLite file, so restarts read the last known data instead of the network.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple
+
+
+# Entries older than this are refreshed when remote fetching is enabled
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+# Bumped when the cached data layout changes; older entries are ignored
+CACHE_FORMAT = 1
+
+
+def content_version(data: Any) -> str:
+    """
+    Get an ETag-style version of cached data.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Hex digest of the canonical JSON encoding
+    """
+    encoded = json.dumps(data, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class YokCache:
+    """
+    Disk-backed key/value cache with a TTL and content versions.
+    Each entry stores its data as JSON with the time it was fetched and a
+    version derived from the content. Readers can compare versions before
+    loading data, and storing identical data only renews the fetch time.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        format INTEGER NOT NULL,
+        version TEXT NOT NULL,
+        fetched_at REAL NOT NULL,
+        data TEXT NOT NULL
+    );
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL):
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: SQLite file path (":memory:" for a temporary cache)
+            ttl: Seconds before an entry counts as expired
+        """
+        self.path = path
+        self.ttl = ttl
+        directory = os.path.dirname(path)
+        if path != ':memory:' and directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.executescript(self.SCHEMA)
+
+    def stat(self, key: str) -> Optional[Tuple[str, float]]:
+        """
+        Get the version and fetch time of an entry without loading its data.
+
+        Args:
+            key: Entry key (e.g., "universities")
+
+        Returns:
+            Tuple of (version, fetched_at), or None if missing
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, fetched_at FROM entries WHERE key = ? AND format = ?",
+                (key, CACHE_FORMAT)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load an entry.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Dictionary with data, version, fetched_at and fresh (not expired),
+            or None if missing
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, fetched_at, data FROM entries WHERE key = ? AND format = ?",
+                (key, CACHE_FORMAT)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'data': json.loads(row[2]),
+            'version': row[0],
+            'fetched_at': row[1],
+            'fresh': self.is_fresh(row[1])
+        }
+
+    def put(self, key: str, data: Any, fetched_at: Optional[float] = None) -> str:
+        """
+        Store an entry. Unchanged data keeps its row and only renews the fetch time.
+
+        Args:
+            key: Entry key
+            data: JSON-serializable data
+            fetched_at: Fetch time (default: now)
+
+        Returns:
+            Version of the stored data
+        """
+        version = content_version(data)
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        with self._lock:
+            updated = self._conn.execute(
+                "UPDATE entries SET fetched_at = ? WHERE key = ? AND format = ? AND version = ?",
+                (fetched_at, key, CACHE_FORMAT, version)
+            ).rowcount
+            if not updated:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, format, version, fetched_at, data) VALUES (?, ?, ?, ?, ?)",
+                    (key, CACHE_FORMAT, version, fetched_at, json.dumps(data, ensure_ascii=False))
+                )
+        return version
+
+    def is_fresh(self, fetched_at: float) -> bool:
+        """Check whether an entry fetched at `fetched_at` is within the TTL."""
+        return time.time() - fetched_at < self.ttl
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the cache file."""
+        with self._lock:
+            self._conn.close()
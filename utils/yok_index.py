@@ -0,0 +1,252 @@
+"""
+YÖK Search Index for DERSLY Streamlit application.
+Prebuilt in-memory indexes over university and department names: Turkish
+case folding, accent-insensitive normalized names, a word prefix trie for
+autocomplete and inverted indexes by city and type.
+"""
+import re
+import unicodedata
+from typing import Optional, Dict, Any, List, Set
+
+
+# Turkish dotted/dotless I pairs; str.lower() alone maps "İ" to "i" + U+0307
+_TURKISH_UPPER = str.maketrans({'İ': 'i', 'I': 'ı'})
+
+# Dotless i has no decomposition to strip
+_DOTLESS = str.maketrans({'ı': 'i'})
+
+_SEPARATORS = re.compile(r'[^\w]+')
+
+
+def turkish_lower(text: str) -> str:
+    """
+    Lowercase a string with Turkish rules (İ -> i, I -> ı).
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        Lowercase text
+    """
+    return text.translate(_TURKISH_UPPER).lower()
+
+
+def normalize_name(text: str) -> str:
+    """
+    Normalize a name for matching: Turkish lowercase, accents removed
+    (ş -> s, ğ -> g, ı -> i, ...) and punctuation collapsed to single spaces,
+    so "BOĞAZİÇİ", "boğaziçi" and "bogazici" are equal.
+
+    Args:
+        text: Name or query
+
+    Returns:
+        Normalized text
+    """
+    decomposed = unicodedata.normalize('NFKD', turkish_lower(text).translate(_DOTLESS))
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return _SEPARATORS.sub(' ', stripped).strip()
+
+
+class _TrieNode:
+    __slots__ = ('children', 'ids')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        # Items having a word that starts with the path to this node
+        self.ids: Set[int] = set()
+
+
+class PrefixTrie:
+    """
+    Character trie over the words of indexed names.
+    Every node keeps the set of items with a word starting with its prefix,
+    so a prefix lookup is one walk of the prefix's length.
+    """
+
+    def __init__(self):
+        """Create an empty trie."""
+        self.root = _TrieNode()
+
+    def insert(self, word: str, item_id: int) -> None:
+        """
+        Add one word of an item.
+
+        Args:
+            word: Normalized word
+            item_id: Item position
+        """
+        node = self.root
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+            node.ids.add(item_id)
+
+    def lookup(self, prefix: str) -> Set[int]:
+        """
+        Get the items with a word starting with `prefix`.
+
+        Args:
+            prefix: Normalized prefix
+
+        Returns:
+            Set of item positions (shared with the trie; do not modify)
+        """
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return node.ids
+
+
+class NameIndex:
+    """
+    Search index over a list of names.
+    Results are ranked: exact name, name prefix, every query word
+    prefixing a word of the name, then plain substring matches (the old
+    linear-scan behaviour), each group in list order.
+    """
+
+    def __init__(self, names: List[str]):
+        """
+        Build the index.
+
+        Args:
+            names: Names in display order
+        """
+        self.names = names
+        self.normalized = [normalize_name(name) for name in names]
+        self.trie = PrefixTrie()
+
+        # normalized name -> first position
+        self.positions: Dict[str, int] = {}
+
+        for position, normalized in enumerate(self.normalized):
+            self.positions.setdefault(normalized, position)
+            for word in set(normalized.split()):
+                self.trie.insert(word, position)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Get positions of names matching a query, best first.
+
+        Args:
+            query: Search text (any case, with or without Turkish letters)
+            limit: Maximum number of results (default: all)
+
+        Returns:
+            List of name positions
+        """
+        normalized = normalize_name(query)
+        if not normalized:
+            positions = list(range(len(self.names)))
+            return positions[:limit] if limit is not None else positions
+
+        # Every query word must prefix some word of the name
+        word_matches: Optional[Set[int]] = None
+        for word in normalized.split():
+            ids = self.trie.lookup(word)
+            word_matches = ids if word_matches is None else word_matches & ids
+            if not word_matches:
+                break
+
+        word_matches = word_matches or set()
+
+        # Rank groups as sorted position lists; only word matches can start with the query
+        first = self.positions.get(normalized)
+        exact = [first] if first is not None else []
+        prefix = sorted(
+            position for position in word_matches
+            if position != first and self.normalized[position].startswith(normalized)
+        )
+        ranked = exact + prefix
+        ranked += sorted(word_matches.difference(ranked))
+
+        # Substring matches only matter when word prefixes do not fill the limit
+        if limit is None or len(ranked) < limit:
+            ranked += [
+                position for position, name in enumerate(self.normalized)
+                if normalized in name and position not in word_matches
+            ]
+
+        return ranked[:limit] if limit is not None else ranked
+
+    def find(self, name: str) -> Optional[int]:
+        """
+        Get the position of a name, ignoring case and Turkish accents.
+
+        Args:
+            name: Name to look up
+
+        Returns:
+            Position, or None if not indexed
+        """
+        return self.positions.get(normalize_name(name))
+
+
+class UniversityIndex:
+    """
+    Name index plus city and type inverted indexes over a university list.
+    Rebuilt when the list object changes (see `source`).
+    """
+
+    def __init__(self, universities: List[Dict[str, Any]]):
+        """
+        Build the indexes.
+
+        Args:
+            universities: University dictionaries with name, city and type
+        """
+        # List the index was built from (replaced when the YÖK cache changes)
+        self.source = universities
+        self.names = NameIndex([uni['name'] for uni in universities])
+
+        # normalized city/type -> universities in list order
+        self.by_city: Dict[str, List[Dict[str, Any]]] = {}
+        self.by_type: Dict[str, List[Dict[str, Any]]] = {}
+        for uni in universities:
+            self.by_city.setdefault(normalize_name(uni.get('city', '')), []).append(uni)
+            self.by_type.setdefault(normalize_name(uni.get('type', '')), []).append(uni)
+
+        # Distinct cities in display form, sorted
+        self.cities = sorted({uni['city'] for uni in universities if uni.get('city')})
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get universities matching a query, best first (see NameIndex.search)."""
+        return [self.source[position] for position in self.names.search(query, limit)]
+
+    def get_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a university by name, ignoring case and Turkish accents."""
+        position = self.names.find(name)
+        return self.source[position] if position is not None else None
+
+    def get_by_city(self, city: str) -> List[Dict[str, Any]]:
+        """Get universities in a city."""
+        return list(self.by_city.get(normalize_name(city), []))
+
+    def get_by_type(self, uni_type: str) -> List[Dict[str, Any]]:
+        """Get universities of a type ("Devlet"/"Vakıf")."""
+        return list(self.by_type.get(normalize_name(uni_type), []))
+
+
+class DepartmentIndex:
+    """
+    Name index over the flattened department list.
+    Rebuilt when the department dictionary changes (see `source`).
+    """
+
+    def __init__(self, departments: Dict[str, List[str]]):
+        """
+        Build the index.
+
+        Args:
+            departments: Dictionary of faculty -> department names
+        """
+        # Dictionary the index was built from
+        self.source = departments
+        self.flat = sorted({name for names in departments.values() for name in names})
+        self.names = NameIndex(self.flat)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Get department names matching a query, best first (see NameIndex.search)."""
+        return [self.flat[position] for position in self.names.search(query, limit)]